@@ -1,21 +1,175 @@
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
 from fastapi import Request, HTTPException, status, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from passlib.exc import UnknownHashError
 from decouple import config
-from uuid import uuid4
+from uuid import UUID, uuid4
+from cachetools import LRUCache, TTLCache
 import jwt
 
 from datetime import datetime, timedelta, timezone
 
 from models.auth.refresh import RefreshToken
 
+REFRESH_TOKEN_DAYS = 50
+REVOKED_REFRESH_TOKEN_CACHE_SIZE = config('REVOKED_REFRESH_TOKEN_CACHE_SIZE', default=100000, cast=int)
+# argon2 cost - changing it only affects hashes made from then on
+ARGON2_TIME_COST = config('ARGON2_TIME_COST', default=3, cast=int)
+ARGON2_MEMORY_COST_KIB = config('ARGON2_MEMORY_COST_KIB', default=65536, cast=int)
+ARGON2_PARALLELISM = config('ARGON2_PARALLELISM', default=4, cast=int)
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=4, cast=int)
+PASSWORD_HASH_MAX_QUEUE = config('PASSWORD_HASH_MAX_QUEUE', default=64, cast=int)
+VERIFIED_TOKEN_CACHE_SIZE = config('VERIFIED_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
+
+def _compact_jti(jti: str) -> bytes | str:
+    """16-byte form of a UUID jti for the revoked cache, the string itself otherwise"""
+    try:
+        return UUID(jti).bytes
+    except ValueError:
+        return jti
+
+
+class PasswordHashingPool:
+    """
+    Per-worker bounded thread pool for argon2 hashing and verification.
+
+    argon2 releases the GIL, so running it here keeps the event loop free for
+    other requests while up to `workers` hashes run in parallel. Calls beyond
+    that wait in the pool's queue; once max_queue are waiting new calls are
+    refused with a 503 rather than piling up behind a login storm.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='argon2')
+        # Running plus queued calls
+        self.in_flight = 0
+        self.completed = 0
+        self.errors = 0
+        self.rejected = 0
+
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker"""
+        return max(0, self.in_flight - self.workers)
+
+    async def run(self, function: Callable, *args):
+        if self.queue_depth() >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail='Too many sign-ins in progress, please try again shortly',
+                headers={'Retry-After': '1'}
+            )
+
+        loop = asyncio.get_running_loop()
+        job = self._executor.submit(function, *args)
+        self.in_flight += 1
+        # Counted when the thread finishes, not when the caller stops waiting - a
+        # cancelled request can't cancel a hash that is already running
+        job.add_done_callback(lambda job: loop.call_soon_threadsafe(self._finished, job))
+        return await asyncio.wrap_future(job)
+
+    def _finished(self, job: Future) -> None:
+        self.in_flight -= 1
+        if job.cancelled():
+            return
+        if job.exception() is not None:
+            self.errors += 1
+        else:
+            self.completed += 1
+
+    def stats(self) -> dict:
+        return {
+            'workers': self.workers,
+            'in_flight': self.in_flight,
+            'queue_depth': self.queue_depth(),
+            'max_queue': self.max_queue,
+            'completed': self.completed,
+            'errors': self.errors,
+            'rejected': self.rejected
+        }
+
+
+class VerifiedTokenCache:
+    """
+    Per-worker LRU of JWTs whose signature has already been verified, keyed by
+    the token's SHA-256 digest and holding (sub, exp, claims). A cached token
+    is only served until its exp, after which it goes back through jwt.decode
+    (and is rejected as expired). Sync dependencies run on FastAPI's thread
+    pool, hence the lock.
+    """
+
+    def __init__(self, max_entries: int):
+        self._tokens: LRUCache = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        now = datetime.now(timezone.utc).timestamp()
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is not None and entry[1] <= now:
+                self._tokens.pop(key, None)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return dict(entry[2])
+
+    def put(self, token: str, claims: dict) -> None:
+        # Tokens without an exp would never leave on their own - don't keep them
+        if 'exp' not in claims:
+            return
+        with self._lock:
+            self._tokens[self._key(token)] = (claims.get('sub'), claims['exp'], claims)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._tokens),
+            'max_entries': self._tokens.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
 
 class Authorization:
     security = HTTPBearer()
+    # Shared by every Authorization instance in the worker
+    password_hashing = PasswordHashingPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE)
+    verified_tokens = VerifiedTokenCache(VERIFIED_TOKEN_CACHE_SIZE)
+    # Per-worker negative cache of refresh token ids already used up or found
+    # missing, shared by every Authorization instance. A jti never becomes
+    # valid again, so a hit is always a rejection - the TTL only bounds memory.
+    revoked_refresh_tokens: TTLCache = TTLCache(
+        maxsize=REVOKED_REFRESH_TOKEN_CACHE_SIZE,
+        ttl=timedelta(days=REFRESH_TOKEN_DAYS).total_seconds()
+    )
 
     def __init__(self):
-        self.password_context = CryptContext(schemes=['argon2'], deprecated='auto')
+        self.password_context = CryptContext(
+            schemes=['argon2'],
+            deprecated='auto',
+            argon2__rounds=ARGON2_TIME_COST,
+            argon2__memory_cost=ARGON2_MEMORY_COST_KIB,
+            argon2__parallelism=ARGON2_PARALLELISM
+        )
         self.SECRET_KEY = config('SECRET_KEY', cast=str)
         self.ENVIRONMENT = config('ENVIRONMENT', cast=str)
         self.ALGORITHM = 'RS256' if self.ENVIRONMENT == 'production' else 'HS256'
@@ -36,10 +190,13 @@ class Authorization:
         else:
             return self.SECRET_KEY
     
-    def hash_password(self, password:str) -> str:
-        return self.password_context.hash(password)
+    async def hash_password(self, password:str) -> str:
+        return await self.password_hashing.run(self.password_context.hash, password)
     
-    def verify_password(self, password:str, hashed_password:str) -> bool:
+    async def verify_password(self, password:str, hashed_password:str) -> bool:
+        return await self.password_hashing.run(self._verify_password_blocking, password, hashed_password)
+
+    def _verify_password_blocking(self, password:str, hashed_password:str) -> bool:
         try:
             return self.password_context.verify(password, hashed_password)
         except UnknownHashError:
@@ -53,7 +210,7 @@ class Authorization:
         }
         return jwt.encode(payload, self.PRIVATE_KEY, algorithm=self.ALGORITHM)
     
-    async def encode_refresh_token(self, req:Request, user_id:str, days:int=50) -> str:
+    async def encode_refresh_token(self, req:Request, user_id:str, days:int=REFRESH_TOKEN_DAYS) -> str:
         refresh_token_id = str(uuid4())
         payload = {
             'exp': datetime.now(timezone.utc) + timedelta(days=days),
@@ -76,8 +233,14 @@ class Authorization:
         return token
 
     def decode_token(self, token:str) -> dict:
+        # Skip the signature check for tokens verified recently and not yet expired
+        cached_claims = self.verified_tokens.get(token)
+        if cached_claims is not None:
+            return cached_claims
         try:
-            return jwt.decode(jwt=token, key=self.PUBLIC_KEY, algorithms=[self.ALGORITHM])
+            claims = jwt.decode(jwt=token, key=self.PUBLIC_KEY, algorithms=[self.ALGORITHM])
+            self.verified_tokens.put(token, claims)
+            return claims
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Token has expired')
         except jwt.InvalidTokenError:
@@ -96,17 +259,23 @@ class Authorization:
         return decoded_token
     
     async def refresh_access_token(self, req:Request, user_id:str, refresh_token_jti:str) -> tuple[str, str]:
-        refresh_token_document = await req.app.mongodb['refresh_tokens'].find_one({
+        revoked_key = _compact_jti(refresh_token_jti)
+        if revoked_key in self.revoked_refresh_tokens:
+            print(f"WARNING: REFRESH TOKEN IS INVALID - REFRESH TOKEN ALREADY USED OR REVOKED (USER ID {user_id} - REFRESH TOKEN JTI {refresh_token_jti})")
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid refresh token')
+
+        # Rotate - consuming the token atomically means a concurrent or replayed
+        # refresh with the same token finds nothing
+        refresh_token_document = await req.app.mongodb['refresh_tokens'].find_one_and_delete({
             'token_id': refresh_token_jti,
+            'user_id': user_id,
             'expires_at': {'$gt': datetime.now(timezone.utc)}
         })
+        self.revoked_refresh_tokens[revoked_key] = True
         if not refresh_token_document:
             print(f"WARNING: REFRESH TOKEN IS INVALID - REFRESH TOKEN DOCUMENT NOT FOUND (USER ID {user_id} - REFRESH TOKEN JTI {refresh_token_jti})")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid refresh token')
 
-        # delete refresh token from database
-        # await req.app.mongodb['refresh_tokens'].delete_one({'token_id': refresh_token_jti})
-
         new_refresh_token = await self.encode_refresh_token(req, user_id)
         new_access_token = self.encode_short_lived_token(user_id=user_id)
         return new_access_token, new_refresh_token
@@ -124,6 +293,7 @@ class Authorization:
                 req=req,
                 collection_name="users",
                 BaseModel=User,
+                fields=['role'],
                 id=user_id
             )
             
@@ -0,0 +1,121 @@
+"""
+Load benchmark for password hashing on the event loop: p50/p99 latency of
+an unrelated endpoint while a burst of logins is in flight. It compares
+argon2 verification run inline in the handler (the old behaviour) with
+verification offloaded to Authorization.password_hashing.
+
+The endpoints are served in-process by driving the ASGI app directly, so no
+database or network is involved. Uses the same environment as the API
+(SECRET_KEY, ENVIRONMENT, ARGON2_*, PASSWORD_HASH_*).
+
+Run from backend/src:
+    python -m benchmarks.login_load --logins 32 --pings 300
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI
+
+from authentication import Authorization
+
+PASSWORD = 'correct horse battery staple'
+
+
+def build_app(auth: Authorization, hashed_password: str, offload: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get('/ping')
+    async def ping():
+        return {'ok': True}
+
+    @app.post('/login')
+    async def login():
+        if offload:
+            verified = await auth.verify_password(PASSWORD, hashed_password)
+        else:
+            verified = auth._verify_password_blocking(PASSWORD, hashed_password)
+        return {'ok': verified}
+
+    return app
+
+
+async def call(app: FastAPI, method: str, path: str, issued_at: float) -> float:
+    """Serve one request and return the seconds since it was issued"""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [],
+        'client': ('127.0.0.1', 50000),
+        'server': ('127.0.0.1', 80),
+    }
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+    return time.perf_counter() - issued_at
+
+
+async def measure(app: FastAPI, logins: int, pings: int, interval: float) -> tuple[list[float], float]:
+    """Fire the logins at once, then issue pings at a fixed rate - ping latencies and login wall time"""
+    started = time.perf_counter()
+    login_tasks = [
+        asyncio.create_task(call(app, 'POST', '/login', started))
+        for _ in range(logins)
+    ]
+
+    # Pings are timed from their scheduled issue time, so ones held up while
+    # the loop was blocked count their full delay
+    ping_tasks = []
+    for ping in range(pings):
+        scheduled_at = started + ping * interval
+        await asyncio.sleep(max(0, scheduled_at - time.perf_counter()))
+        ping_tasks.append(asyncio.create_task(call(app, 'GET', '/ping', scheduled_at)))
+
+    latencies = await asyncio.gather(*ping_tasks)
+    login_latencies = await asyncio.gather(*login_tasks)
+    return latencies, max(login_latencies, default=0)
+
+
+def summarize(label: str, latencies: list[float], login_seconds: float) -> None:
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<28} ping p50 {percentiles[49] * 1000:8.2f} ms   "
+        f"p99 {percentiles[98] * 1000:8.2f} ms   "
+        f"max {max(latencies) * 1000:8.2f} ms   "
+        f"logins done in {login_seconds:6.2f} s"
+    )
+
+
+async def main(logins: int, pings: int, interval: float) -> None:
+    auth = Authorization()
+    hashed_password = auth.password_context.hash(PASSWORD)
+
+    inline_app = build_app(auth, hashed_password, offload=False)
+    offloaded_app = build_app(auth, hashed_password, offload=True)
+
+    summarize('no logins', *await measure(offloaded_app, 0, pings, interval))
+    summarize('logins on the event loop', *await measure(inline_app, logins, pings, interval))
+    summarize('logins on the hashing pool', *await measure(offloaded_app, logins, pings, interval))
+    print(f"hashing pool: {auth.password_hashing.stats()}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=32, help='concurrent logins in the burst')
+    parser.add_argument('--pings', type=int, default=300, help='unrelated requests to time')
+    parser.add_argument('--interval', type=float, default=0.005, help='seconds between unrelated requests')
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.pings, args.interval))
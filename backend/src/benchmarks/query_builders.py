@@ -0,0 +1,68 @@
+"""
+Micro-benchmark of the per-call query building overhead in the generic CRUD
+layer: the old loop over BaseModel.model_fields (plus the CollectionModelMatch
+import and subclass check) against a lookup of the precompiled descriptor.
+
+Run from backend/src:
+    python -m benchmarks.query_builders
+"""
+import timeit
+
+from models.users.users import User
+from models.questions.questions import MultipleChoiceQuestion
+from models.leaderboard.leaderboard import NationalLeaderboard
+from crud._generic.query_descriptors import get_query_descriptor
+
+NUMBER = 100000
+
+CASES = [
+    ('users', User, {'email': 'someone@example.com'}),
+    ('questions', MultipleChoiceQuestion, {'_id': '665f1c2e9b1e8a3d4c5b6a79'}),
+    ('national_leaderboard', NationalLeaderboard, {'user_id': '665f1c2e9b1e8a3d4c5b6a79', 'score__gte': 10}),
+]
+
+
+def build_query_per_call(collection_name, BaseModel, kwargs):
+    """Query building as getDocument did it before descriptors"""
+    from crud._generic.model_mappings import CollectionModelMatch
+
+    if collection_name not in CollectionModelMatch:
+        raise ValueError(collection_name)
+    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+        raise ValueError(BaseModel.__name__)
+
+    query = {}
+    for field_name, field in BaseModel.model_fields.items():
+        param_value = kwargs.get(field.alias, kwargs.get(field_name))
+        if param_value is not None:
+            query[field.alias if field.alias else field_name] = param_value
+
+    for key, value in kwargs.items():
+        if "__" in key and key not in query:
+            query[key.replace("__", ".")] = value
+    return query
+
+
+def build_query_with_descriptor(collection_name, BaseModel, kwargs):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
+        raise ValueError(collection_name)
+    return descriptor.build_query(kwargs)
+
+
+def main():
+    for collection_name, BaseModel, kwargs in CASES:
+        assert build_query_per_call(collection_name, BaseModel, kwargs) == build_query_with_descriptor(collection_name, BaseModel, kwargs)
+
+        before = timeit.timeit(lambda: build_query_per_call(collection_name, BaseModel, kwargs), number=NUMBER)
+        after = timeit.timeit(lambda: build_query_with_descriptor(collection_name, BaseModel, kwargs), number=NUMBER)
+        print(
+            f"{collection_name:<22} {BaseModel.__name__:<24} "
+            f"per-call loop {before / NUMBER * 1e6:6.2f} us   "
+            f"descriptor {after / NUMBER * 1e6:6.2f} us   "
+            f"({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
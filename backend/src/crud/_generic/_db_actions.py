@@ -1,11 +1,19 @@
 from fastapi import Request
-from typing import Optional
+from typing import AsyncIterator, Optional
 from enum import Enum
+import pydantic
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from decouple import config
 
 from datetime import datetime, timezone
 
 from models._base import MongoBaseModel
+from crud._generic.model_mappings import CollectionModelMatch
+from crud._generic.query_descriptors import get_query_descriptor, get_field_adapter, get_projection
+from crud._generic.document_loader import get_document_loader, peek_document_loader
+from crud._generic.bulk_operations import BulkOperation, BulkInsert, BulkUpdate, BulkUpsert, BulkDelete, BulkWriteOutcome
 
 from utils.__errors__.custom_exception import CustomException
 from utils.mongo_helpers import exclude_created_at
@@ -18,14 +26,33 @@ class SortDirection(str, Enum):
     DESCENDING = 'descending'
 
 # Create Operations
+def _as_stored(value):
+    """
+    Mirror what MongoDB hands back for a payload it stored - datetimes are kept
+    to the millisecond - so a created document can be built without reading it back
+    """
+    if isinstance(value, datetime):
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: _as_stored(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_as_stored(item) for item in value]
+    return value
+
 async def createDocument(
         req:Request,
         collection_name:str,
         BaseModel:MongoBaseModel,
-        new_document:MongoBaseModel
+        new_document:MongoBaseModel,
+        read_back:bool = False
 ) -> MongoBaseModel:
+    """
+    Insert a document and return it as BaseModel. The result is built from the
+    inserted payload (the _id is generated client-side) unless read_back is set,
+    which re-fetches the stored document for collections where the database
+    could change it on write.
+    """
     
-    from crud._generic.model_mappings import CollectionModelMatch
     
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -63,9 +90,13 @@ async def createDocument(
             collection_name:str,
             new_document:BaseModel
     ) -> BaseModel:
-        created_document = await req.app.mongodb[collection_name].insert_one(
-            new_document.model_dump(by_alias=True, exclude_none=True)
-        )
+        payload = new_document.model_dump(by_alias=True, exclude_none=True)
+        created_document = await req.app.mongodb[collection_name].insert_one(payload)
+        loader = peek_document_loader(req)
+        if loader is not None:
+            loader.clear(collection_name, created_document.inserted_id)
+        if not read_back:
+            return BaseModel(**_as_stored(payload))
         document = await req.app.mongodb[collection_name].find_one({
             '_id': created_document.inserted_id
         })
@@ -79,10 +110,11 @@ async def createMultipleDocuments(
     req:Request,
     collection_name:str,
     BaseModel:MongoBaseModel,
-    new_documents:list[MongoBaseModel]
+    new_documents:list[MongoBaseModel],
+    read_back:bool = False
 ) -> list[MongoBaseModel]:
+    """Insert several documents in one round trip - results are built as in createDocument"""
     
-    from crud._generic.model_mappings import CollectionModelMatch
     for new_document in new_documents:
         if collection_name not in CollectionModelMatch:
             raise CustomException(
@@ -124,12 +156,17 @@ async def createMultipleDocuments(
         new_documents:list[BaseModel]
     ) -> list[BaseModel]:
         
-        created_documents = await req.app.mongodb[collection_name].insert_many(
-            [ document.model_dump(
-                by_alias=True,
-                exclude_none=True
-            ) for document in new_documents ]
-        )
+        payloads = [ document.model_dump(
+            by_alias=True,
+            exclude_none=True
+        ) for document in new_documents ]
+        created_documents = await req.app.mongodb[collection_name].insert_many(payloads)
+        loader = peek_document_loader(req)
+        if loader is not None:
+            for document_id in created_documents.inserted_ids:
+                loader.clear(collection_name, document_id)
+        if not read_back:
+            return [BaseModel(**_as_stored(payload)) for payload in payloads]
 
         documents = await req.app.mongodb[collection_name].find({
             '_id': {'$in': created_documents.inserted_ids}
@@ -150,14 +187,31 @@ async def createMultipleDocuments(
 
 # Get Operations
 
+def _narrow_model(descriptor, fields:Optional[list[str]], ProjectionModel:Optional[MongoBaseModel]):
+    """
+    Model to build narrowed reads with - ProjectionModel, or a partial model
+    of BaseModel for `fields` - None if neither was asked for, False if a
+    field isn't on the model
+    """
+    if ProjectionModel:
+        return ProjectionModel
+    if fields:
+        return descriptor.partial_model(fields) or False
+    return None
+
 async def getDocument(
     req:Request,
     collection_name:str,
     BaseModel:MongoBaseModel,
+    fields:Optional[list[str]] = None,
+    ProjectionModel:Optional[MongoBaseModel] = None,
     **kwargs
 ) -> MongoBaseModel | None:
-    
-    from crud._generic.model_mappings import CollectionModelMatch
+    """
+    Fetch the first document matching the model field kwargs. Passing fields
+    (names or aliases) or a ProjectionModel only reads those fields and
+    returns a correspondingly narrow model.
+    """
     
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -175,7 +229,8 @@ async def getDocument(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -190,24 +245,8 @@ async def getDocument(
             }
         )
     
-    query = {}
-    # Handle direct model fields
-    print(f"getDocument called with collection: {collection_name}, kwargs: {kwargs}")
-    print(f"BaseModel fields: {[(name, field.alias) for name, field in BaseModel.model_fields.items()]}")
-    for field_name, field in BaseModel.model_fields.items():
-        param_value = kwargs.get(field.alias, kwargs.get(field_name))
-        if param_value is not None:
-            query[field.alias if field.alias else field_name] = param_value
-            print(f"Added to query: {field.alias if field.alias else field_name} = {param_value}")
-            
-    # Handle embedded fields with double underscore notation
-    for key, value in kwargs.items():
-        if "__" in key and key not in query:
-            # Convert double underscores to dots for MongoDB query
-            mongo_key = key.replace("__", ".")
-            query[mongo_key] = value
-            
-    print(f"Final query built: {query}")
+    # Model fields by name or alias, embedded fields with double underscores
+    query = descriptor.build_query(kwargs)
     if not query:
         raise CustomException(
             message="None or invalid query parameters provided - get failed",
@@ -221,11 +260,35 @@ async def getDocument(
             }
         )
 
-    document = await req.app.mongodb[collection_name].find_one(query)
+    NarrowModel = _narrow_model(descriptor, fields, ProjectionModel)
+    if NarrowModel is False:
+        raise CustomException(
+            message="Requested fields are not all on the model - get failed",
+            custom_error_path=error_path,
+            custom_error_file_name="get_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "fields": fields
+            }
+        )
+    if NarrowModel:
+        document = await req.app.mongodb[collection_name].find_one(
+            query,
+            projection=get_projection(NarrowModel)
+        )
+        return descriptor.load(document, NarrowModel) if document else None
+
+    # Full lookups by _id alone go through the request's loader, which
+    # batches them per tick and remembers them for the rest of the request
+    document_id = query.get('_id')
+    loader = get_document_loader(req) if len(query) == 1 and isinstance(document_id, str) else None
+    if loader is not None:
+        document = await loader.load(collection_name, document_id)
+    else:
+        document = await req.app.mongodb[collection_name].find_one(query)
 
-    if collection_name == "users":
-        return BaseModel.model_construct(**document) if document else None
-    return BaseModel(**document) if document else None
+    return descriptor.load(document) if document else None
 
 
 
@@ -241,7 +304,6 @@ async def getMultipleDocuments(
     ProjectionModel:Optional[MongoBaseModel] = None,
     **kwargs
 ) -> list[MongoBaseModel]:
-    from crud._generic.model_mappings import CollectionModelMatch
     
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -262,10 +324,8 @@ async def getMultipleDocuments(
             }
         )
     
-    if not issubclass(
-        BaseModel, 
-        CollectionModelMatch[collection_name]
-    ):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -284,19 +344,8 @@ async def getMultipleDocuments(
             }
         )
     
-    query = {}
-    # Handle direct model fields
-    for field_name, field in BaseModel.model_fields.items():
-        param_value = kwargs.get(field.alias, kwargs.get(field_name))
-        if param_value is not None:
-            query[field.alias if field.alias else field_name] = param_value
-    
-    # Handle embedded fields with double underscore notation
-    for key, value in kwargs.items():
-        if "__" in key and key not in query:
-            # Convert double underscores to dots for MongoDB query
-            mongo_key = key.replace("__", ".")
-            query[mongo_key] = value
+    # Model fields by name or alias, embedded fields with double underscores
+    query = descriptor.build_query(kwargs)
 
     if not query:
         raise CustomException(
@@ -320,13 +369,9 @@ async def getMultipleDocuments(
             }
         )
     
-    projection = {}
-    if ProjectionModel:
-        for field_name, field in ProjectionModel.model_fields.items():
-            field_key = field.alias if field.alias else field_name
-            projection[field_key] = 1
-        if '_id' not in projection:
-            projection['_id'] = 1
+    projection = get_projection(ProjectionModel) if ProjectionModel else {}
+    if descriptor.is_unindexed(query) and ENVIRONMENT == 'development':
+        print(f"No declared index on {collection_name} serves the query {list(query)}")
 
     # Sorting
     sort_field = order_by if order_by else 'created_at'
@@ -352,24 +397,12 @@ async def getMultipleDocuments(
             projection=projection
         ).to_list(length=None)
     
-    if collection_name == "users":
-        if ProjectionModel:
-            return [ProjectionModel(
-                **document
-            ) for document in documents] if documents else []
-        
-        return [BaseModel.model_construct(
-            **document
-        ) for document in documents] if documents else []
-
     if ProjectionModel:
         return [ProjectionModel(
             **document
         ) for document in documents] if documents else []
 
-    return [BaseModel(
-        **document
-    ) for document in documents] if documents else []
+    return [descriptor.load(document) for document in documents] if documents else []
 
 
 
@@ -382,7 +415,6 @@ async def getAllDocuments(
     limit:Optional[int] = 0,
 ) -> list[MongoBaseModel]:
     
-    from crud._generic.model_mappings import CollectionModelMatch
     
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -401,7 +433,8 @@ async def getAllDocuments(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -436,14 +469,7 @@ async def getAllDocuments(
         sort_criteria
     ).limit(limit).to_list(length=None)
 
-    if collection_name == "users":
-        return [BaseModel.model_construct(
-            **document
-        ) for document in documents] if documents else []
-
-    return [BaseModel(
-        **document
-    ) for document in documents] if documents else []
+    return [descriptor.load(document) for document in documents] if documents else []
 
 async def batchGetDocuments(
     req:Request,
@@ -454,10 +480,12 @@ async def batchGetDocuments(
     order_direction:Optional[SortDirection] = SortDirection.DESCENDING,
     limit:Optional[int] = 0,
     skip:Optional[int] = 0,
+    fields:Optional[list[str]] = None,
+    ProjectionModel:Optional[MongoBaseModel] = None,
     **additional_filters
 ) -> list[MongoBaseModel]:
+    """Fetch documents by id - fields/ProjectionModel narrow the read as in getDocument"""
     
-    from crud._generic.model_mappings import CollectionModelMatch
 
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -474,7 +502,8 @@ async def batchGetDocuments(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -507,17 +536,170 @@ async def batchGetDocuments(
     if additional_filters:
         query.update(additional_filters)
     
-    documents = await req.app.mongodb[collection_name].find(query).sort(
-        sort_criteria).limit(limit).skip(skip).to_list(length=None)
+    NarrowModel = _narrow_model(descriptor, fields, ProjectionModel)
+    if NarrowModel is False:
+        raise CustomException(
+            message="Requested fields are not all on the model - batch get failed",
+            custom_error_path=error_path,
+            custom_error_file_name="batch_get_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "fields": fields
+            }
+        )
 
-    if collection_name == "users":
-        return [BaseModel.model_construct(
-            **document
-        ) for document in documents] if documents else []
+    documents = await req.app.mongodb[collection_name].find(
+        query,
+        projection=get_projection(NarrowModel) if NarrowModel else None
+    ).sort(sort_criteria).limit(limit).skip(skip).to_list(length=None)
 
-    return [BaseModel(
-        **document
-    ) for document in documents] if documents else []
+    return [descriptor.load(document, NarrowModel) for document in documents] if documents else []
+
+# Streaming Get Operations
+
+def _sort_criteria(order_by:Optional[str], order_direction:Optional[SortDirection]) -> list[tuple[str, int]]:
+    """Sort on order_by (created_at by default), breaking ties by created_at"""
+    sort_field = order_by if order_by else 'created_at'
+    sort_direction = -1 if order_direction == SortDirection.DESCENDING else 1
+    sort_criteria = [(sort_field, sort_direction)]
+    if sort_field != 'created_at':
+        sort_criteria.append(('created_at', 1))
+    return sort_criteria
+
+async def _iterCursor(descriptor, cursor, Model) -> AsyncIterator[MongoBaseModel]:
+    """Validate documents one at a time as the cursor hands out its batches"""
+    try:
+        async for document in cursor:
+            yield descriptor.load(document, Model)
+    finally:
+        # Stop the server-side cursor if the consumer gives up early
+        await cursor.close()
+
+async def iterDocuments(
+    req:Request,
+    collection_name:str,
+    BaseModel:MongoBaseModel,
+    order_by:Optional[str] = None,
+    order_direction:Optional[SortDirection] = SortDirection.DESCENDING,
+    limit:Optional[int] = 0,
+    skip:Optional[int] = 0,
+    batch_size:int = 500,
+    ProjectionModel:Optional[MongoBaseModel] = None,
+    **kwargs
+) -> AsyncIterator[MongoBaseModel]:
+    """
+    Streaming form of getMultipleDocuments / getAllDocuments - no query
+    kwargs means every document. Documents are fetched batch_size at a time
+    and validated as they are consumed, so memory use stays flat however
+    many documents match. Await the call to get the iterator, so bad
+    arguments raise before anything is streamed.
+    """
+    
+    if collection_name not in CollectionModelMatch:
+        raise CustomException(
+            message="""
+                Collection name has not been set up to
+                use generic crud functions - iterate failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="iterate_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "query_parameters": kwargs
+            }
+        )
+    
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
+        raise CustomException(
+            message="""
+                BaseModel is not of the correct type
+                for the collection - iterate failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="iterate_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "query_parameters": kwargs
+            }
+        )
+
+    query = descriptor.build_query(kwargs)
+    if kwargs and not query:
+        raise CustomException(
+            message="Invalid query parameters provided - iterate failed",
+            custom_error_path=error_path,
+            custom_error_file_name="iterate_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "query_parameters": kwargs
+            }
+        )
+
+    cursor = req.app.mongodb[collection_name].find(
+        query,
+        projection=get_projection(ProjectionModel) if ProjectionModel else None,
+        batch_size=batch_size
+    ).sort(_sort_criteria(order_by, order_direction)).limit(limit).skip(skip)
+
+    return _iterCursor(descriptor, cursor, ProjectionModel)
+
+async def iterBatchDocuments(
+    req:Request,
+    collection_name:str,
+    BaseModel:MongoBaseModel,
+    document_ids:list[str],
+    order_by:Optional[str] = None,
+    order_direction:Optional[SortDirection] = SortDirection.DESCENDING,
+    batch_size:int = 500,
+    ProjectionModel:Optional[MongoBaseModel] = None,
+    **additional_filters
+) -> AsyncIterator[MongoBaseModel]:
+    """Streaming form of batchGetDocuments, batched and validated as in iterDocuments"""
+    
+    if collection_name not in CollectionModelMatch:
+        raise CustomException(
+            message="""
+                Collection name has not been set up to
+                use generic crud functions - iterate batch failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="iterate_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "document_ids": document_ids
+            }
+        )
+    
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
+        raise CustomException(
+            message="""
+                BaseModel is not of the correct type
+                for the collection - iterate batch failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="iterate_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "document_ids": document_ids
+            }
+        )
+
+    query = {'_id': {'$in': document_ids}, **additional_filters}
+    cursor = req.app.mongodb[collection_name].find(
+        query,
+        projection=get_projection(ProjectionModel) if ProjectionModel else None,
+        batch_size=batch_size
+    ).sort(_sort_criteria(order_by, order_direction))
+
+    return _iterCursor(descriptor, cursor, ProjectionModel)
 
 # Counting Operations
 
@@ -531,7 +713,6 @@ async def countDocuments(
     Counts the number of documents in a given collection
     that match the provided query parameters (based on BaseModel fields).
     """
-    from crud._generic.model_mappings import CollectionModelMatch
 
     # Ensure the collection is supported
     if collection_name not in CollectionModelMatch:
@@ -550,7 +731,8 @@ async def countDocuments(
         )
 
     # Ensure the BaseModel matches the collection
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -565,19 +747,9 @@ async def countDocuments(
             }
         )
 
-    # Build the query from the fields defined in the BaseModel
-    query = {}    
-    # Handle direct model fields
-    for field_name, field in BaseModel.model_fields.items():
-        if field_name in kwargs:
-            query[field.alias if field.alias else field_name] = kwargs[field_name]
-            
-    # Handle embedded fields with double underscore notation
-    for key, value in kwargs.items():
-        if "__" in key and key not in query:
-            # Convert double underscores to dots for MongoDB query
-            mongo_key = key.replace("__", ".")
-            query[mongo_key] = value
+    # Build the query from the fields defined in the BaseModel - an explicit
+    # None counts documents where the field is null
+    query = descriptor.build_query(kwargs, include_none=True)
 
     # If no valid query parameters are provided, 
     # instruct user to call countAllDocuments
@@ -608,7 +780,6 @@ async def countAllDocuments(
     """
     Counts the total number of all documents in a given collection.
     """
-    from crud._generic.model_mappings import CollectionModelMatch
 
     # Ensure the collection is supported
     if collection_name not in CollectionModelMatch:
@@ -626,7 +797,8 @@ async def countAllDocuments(
         )
 
     # Ensure the BaseModel matches the collection
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -655,11 +827,15 @@ async def updateDocument(
     BaseModel:MongoBaseModel,
     document_id:str,
     raw_update:Optional[dict] = None,
+    validate_against_current:bool = False,
     **kwargs
 ) -> MongoBaseModel:
+    """
+    Apply an update and return the updated document in one round trip. Values
+    are validated against their field schemas; validate_against_current instead
+    fetches the document first and validates it whole as it would be after the update.
+    """
     
-    from crud._generic.model_mappings import CollectionModelMatch
-    import pydantic
 
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -677,10 +853,8 @@ async def updateDocument(
             }
         )
     
-    if not issubclass(
-        BaseModel,
-        CollectionModelMatch[collection_name]
-    ):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -696,56 +870,20 @@ async def updateDocument(
             }
         )
     
-    existing_document = await getDocument(
-        req,
-        collection_name,
-        BaseModel,
-        _id=document_id
-    )
-
-    if not existing_document:
-        return None
-    
-    # Create a simulated document to validate after updates
-    simulated_document_dict = existing_document.model_dump()
-    
+    now = datetime.now(timezone.utc)
     if raw_update:
         update_clause = raw_update
         update_clause.setdefault("$set", {})
-        update_clause["$set"]["updated_at"] = datetime.now(
-            timezone.utc
-        )
+        update_clause["$set"]["updated_at"] = now
         # Exclude created_at from $set
         update_clause["$set"] = exclude_created_at(update_clause["$set"])
-        
-        # Apply simulated updates for validation
-        for operation, fields in update_clause.items():
-            if operation == "$set":
-                # Direct field updates
-                for field, value in fields.items():
-                    if field in simulated_document_dict:
-                        simulated_document_dict[field] = value
-            elif operation == "$inc":
-                # Increment operations
-                for field, value in fields.items():
-                    if field in simulated_document_dict:
-                        simulated_document_dict[field] += value
-            # Add other MongoDB update operators as needed
     else:
         # Create the update data from kwargs
-        update_data = {}
         # Remove the _id field from the update data
         kwargs.pop('_id', None)
-        for field_name, field in BaseModel.model_fields.items():
-            param_value = kwargs.get(field.alias, kwargs.get(field_name))
-            if param_value is not None:
-                field_key = field.alias if field.alias else field_name
-                update_data[field_key] = param_value
-                # Also update the simulated document
-                simulated_document_dict[field_key] = param_value
+        update_data = descriptor.build_fields(kwargs)
     
-        update_data['updated_at'] = datetime.now(timezone.utc)
-        simulated_document_dict['updated_at'] = update_data['updated_at']
+        update_data['updated_at'] = now
 
         # Exclude created_at from update_data
         update_data = exclude_created_at(update_data)
@@ -754,18 +892,24 @@ async def updateDocument(
             '$set': update_data
         }
     
-    # Validate the simulated document against Pydantic constraints
-    try:
-        # Create a new instance with the updated values to trigger validation
-        BaseModel(**simulated_document_dict)
-    except pydantic.ValidationError as e:
-        # Extract validation errors to provide helpful feedback
-        error_fields = {}
-        for error in e.errors():
-            field = error["loc"][0]
-            message = error["msg"]
-            error_fields[field] = message
-        
+    update_filter = { '_id': document_id }
+    if validate_against_current:
+        existing_document = await getDocument(
+            req,
+            collection_name,
+            BaseModel,
+            _id=document_id
+        )
+        if not existing_document:
+            return None
+        error_fields = _validate_simulated_update(BaseModel, existing_document, update_clause)
+    else:
+        error_fields = _validate_update_fields(descriptor, update_clause)
+        # $inc results can't be checked without the document - guard their
+        # bounds in the filter instead so the write only applies if they hold
+        update_filter.update(_increment_bound_filters(descriptor, update_clause))
+    
+    if error_fields:
         raise CustomException(
             message=f"""
                 Update operation would violate field constraints.
@@ -781,20 +925,97 @@ async def updateDocument(
             }
         )
     
-    # Update the document
-    await req.app.mongodb[collection_name].update_one(
-        { '_id': document_id },
-        update_clause
+    # Update the document and get it back in the same round trip
+    document = await req.app.mongodb[collection_name].find_one_and_update(
+        update_filter,
+        update_clause,
+        return_document=ReturnDocument.AFTER
     )
 
+    loader = peek_document_loader(req)
+    if loader is not None:
+        if document is not None:
+            loader.prime(collection_name, document_id, document)
+        else:
+            loader.clear(collection_name, document_id)
+
+    if document is None:
+        # Either the document doesn't exist or an $inc bound guard didn't match
+        if len(update_filter) > 1 and await req.app.mongodb[collection_name].count_documents({ '_id': document_id }, limit=1):
+            raise CustomException(
+                message="""
+                    Update operation would violate field constraints.
+                    An incremented field would leave its allowed range
+                """,
+                custom_error_path=error_path,
+                custom_error_file_name="update_validation_failed.txt",
+                extra_error_info={
+                    "collection_name": collection_name,
+                    "document_id": document_id,
+                    "update_clause": update_clause
+                }
+            )
+        return None
+
+    return descriptor.load(document)
+
+def _validate_update_fields(descriptor, update_clause: dict) -> dict:
+    """Validate each $set value against its own field schema - {field: message} for failures"""
+    error_fields = {}
+    for field_key, value in update_clause.get('$set', {}).items():
+        adapter = get_field_adapter(descriptor, field_key)
+        if adapter is None:
+            continue
+        try:
+            adapter.validate_python(value)
+        except pydantic.ValidationError as e:
+            error_fields[field_key] = e.errors()[0]["msg"]
+    return error_fields
+
+def _increment_bound_filters(descriptor, update_clause: dict) -> dict:
+    """Filter conditions under which each $inc keeps its field within the field's ge/gt/le/lt bounds"""
+    bound_operators = {'ge': '$gte', 'gt': '$gt', 'le': '$lte', 'lt': '$lt'}
+    filters = {}
+    for field_key, increment in update_clause.get('$inc', {}).items():
+        field = descriptor.field(field_key)
+        if field is None:
+            continue
+        conditions = {}
+        for constraint in field.metadata:
+            for attribute, operator in bound_operators.items():
+                bound = getattr(constraint, attribute, None)
+                if bound is not None:
+                    # current + increment must satisfy the bound
+                    conditions[operator] = bound - increment
+        if conditions:
+            filters[field_key] = conditions
+    return filters
+
+def _validate_simulated_update(BaseModel: MongoBaseModel, existing_document: MongoBaseModel, update_clause: dict) -> dict:
+    """Validate the whole document as it would look after the update - {field: message} for failures"""
     
-    # Return the updated document
-    return await getDocument(
-        req,
-        collection_name,
-        BaseModel,
-        _id=document_id
-    )
+    # Create a simulated document to validate after updates
+    simulated_document_dict = existing_document.model_dump(by_alias=True)
+    for operation, fields in update_clause.items():
+        if operation == "$set":
+            # Direct field updates
+            for field, value in fields.items():
+                simulated_document_dict[field] = value
+        elif operation == "$inc":
+            # Increment operations
+            for field, value in fields.items():
+                if field in simulated_document_dict:
+                    simulated_document_dict[field] += value
+        # Add other MongoDB update operators as needed
+    
+    # Validate the simulated document against Pydantic constraints
+    try:
+        # Create a new instance with the updated values to trigger validation
+        BaseModel(**simulated_document_dict)
+    except pydantic.ValidationError as e:
+        # Extract validation errors to provide helpful feedback
+        return {error["loc"][0]: error["msg"] for error in e.errors()}
+    return {}
 
 
 
@@ -828,8 +1049,6 @@ async def updateMultipleDocuments(
                          when no valid filter criteria are provided/found,
                          or when the update would violate field constraints.
     """
-    from crud._generic.model_mappings import CollectionModelMatch
-    import pydantic
 
     # Ensure the collection is supported
     if collection_name not in CollectionModelMatch:
@@ -849,7 +1068,8 @@ async def updateMultipleDocuments(
         )
     
     # Ensure the BaseModel matches the collection
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -867,14 +1087,7 @@ async def updateMultipleDocuments(
     
     # Build the query from the fields defined in 
     # the BaseModel using filter_kwargs
-    query = {}
-    for field_name, field in BaseModel.model_fields.items():
-        param_value = filter_kwargs.get(
-            field.alias, 
-            filter_kwargs.get(field_name)
-        )
-        if param_value is not None:
-            query[field.alias if field.alias else field_name] = param_value
+    query = descriptor.build_fields(filter_kwargs)
             
     if not query:
         raise CustomException(
@@ -892,74 +1105,42 @@ async def updateMultipleDocuments(
             }
         )
     
-    # Retrieve the documents that match the filter
+    # Retrieve the ids that match the filter so we update exactly these documents
     existing_documents = await req.app.mongodb[collection_name].find(
-        query
+        query,
+        projection={'_id': 1}
     ).to_list(length=None)
     
     if not existing_documents:
         return []
     
-    # Extract the document ids to ensure we update exactly these documents
     document_ids = [doc['_id'] for doc in existing_documents]
     
     # Prepare the update data (exclude _id and include only valid fields)
     update_fields.pop('_id', None)
-    valid_update_data = {}
-    for field_name, field in BaseModel.model_fields.items():
-        param_value = update_fields.get(
-            field.alias, 
-            update_fields.get(field_name)
-        )
-        if param_value is not None:
-            valid_update_data[
-                field.alias if field.alias else field_name
-            ] = param_value
+    valid_update_data = descriptor.build_fields(update_fields)
             
     valid_update_data['updated_at'] = datetime.now(timezone.utc)
     # Exclude created_at from valid_update_data
     valid_update_data = exclude_created_at(valid_update_data)
     
-    # Validate each document against Pydantic constraints after simulated updates
-    validation_failures = []
-    
-    for doc in existing_documents:
-        # Create a copy of the document for simulation
-        simulated_doc = dict(doc)
-        
-        # Apply updates to the simulated document
-        for field, value in valid_update_data.items():
-            simulated_doc[field] = value
-            
-        try:
-            # Validate against the model
-            BaseModel(**simulated_doc)
-        except pydantic.ValidationError as e:
-            # Collect validation errors
-            error_fields = {}
-            for error in e.errors():
-                field = error["loc"][0]
-                message = error["msg"]
-                error_fields[field] = message
-                
-            validation_failures.append({
-                "document_id": doc["_id"],
-                "validation_errors": error_fields
-            })
+    # Every document gets the same values, so each field is validated once
+    error_fields = _validate_update_fields(descriptor, {'$set': valid_update_data})
     
     # If there are validation failures, raise an exception
-    if validation_failures:
+    if error_fields:
         raise CustomException(
             message=f"""
-                Update operation would violate field constraints for {len(validation_failures)} document(s).
-                Sample errors: {validation_failures[0]['validation_errors']}
+                Update operation would violate field constraints for {len(document_ids)} document(s).
+                Field validations failed: {error_fields}
             """,
             custom_error_path=error_path,
             custom_error_file_name="update_multiple_validation_failed.txt",
             extra_error_info={
                 "collection_name": collection_name,
                 "update_fields": valid_update_data,
-                "validation_failures": validation_failures
+                "document_ids": document_ids,
+                "validation_errors": error_fields
             }
         )
     
@@ -968,6 +1149,10 @@ async def updateMultipleDocuments(
         {'_id': {'$in': document_ids}},
         {'$set': valid_update_data}
     )
+    loader = peek_document_loader(req)
+    if loader is not None:
+        for document_id in document_ids:
+            loader.clear(collection_name, document_id)
     
     # Retrieve and return the updated documents using batchGetDocuments
     updated_documents = await batchGetDocuments(
@@ -1015,9 +1200,6 @@ async def incrementDocumentField(
                          when the field doesn't exist, when the document doesn't exist,
                          or when the increment would violate field constraints.
     """
-    from crud._generic.model_mappings import CollectionModelMatch
-    import pydantic
-    from pymongo import ReturnDocument
     
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -1036,10 +1218,8 @@ async def incrementDocumentField(
             }
         )
     
-    if not issubclass(
-        BaseModel, 
-        CollectionModelMatch[collection_name]
-    ):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -1059,16 +1239,7 @@ async def incrementDocumentField(
     # Ensure the field to increment is valid on this model.
     # If the user can provide either the canonical field name or the alias,
     # check if it matches a model field and retrieve the stored field name/alias.
-    valid_field = None
-    for model_field_name, field_def in BaseModel.model_fields.items():
-        possible_keys = {model_field_name}
-        if field_def.alias:
-            possible_keys.add(field_def.alias)
-
-        if field_name in possible_keys:
-            # Use the alias if it exists, otherwise the regular field name
-            valid_field = field_def.alias if field_def.alias else model_field_name
-            break
+    valid_field = descriptor.resolve(field_name)
 
     if not valid_field:
         raise CustomException(
@@ -1136,6 +1307,10 @@ async def incrementDocumentField(
         return_document=ReturnDocument.AFTER
     )
     
+    loader = peek_document_loader(req)
+    if loader is not None:
+        loader.prime(collection_name, document_id, updated_doc)
+
     # If somehow the document disappeared between validation and update
     if not updated_doc:
         raise CustomException(
@@ -1156,6 +1331,210 @@ async def incrementDocumentField(
     # Return the updated document as a model instance
     return BaseModel(**updated_doc)
 
+# Bulk Operations
+
+def _validate_fields_once(descriptor, fields: dict, checked: dict) -> dict:
+    """
+    Validate stored-key field values against their field schemas, reusing
+    results in checked for values already seen in this bulk - {field: message}
+    """
+    error_fields = {}
+    for field_key, value in fields.items():
+        try:
+            cache_key = (field_key, value)
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in checked:
+            message = checked[cache_key]
+        else:
+            message = None
+            adapter = get_field_adapter(descriptor, field_key)
+            if adapter is not None:
+                try:
+                    adapter.validate_python(value)
+                except pydantic.ValidationError as e:
+                    message = e.errors()[0]["msg"]
+            if cache_key is not None:
+                checked[cache_key] = message
+
+        if message:
+            error_fields[field_key] = message
+    return error_fields
+
+async def bulkWriteDocuments(
+    req:Request,
+    collection_name:str,
+    BaseModel:MongoBaseModel,
+    operations:list[BulkOperation],
+    ordered:bool = True,
+    read_back:bool = False
+) -> BulkWriteOutcome:
+    """
+    Send a mix of inserts, updates, upserts and deletes as one bulk_write.
+
+    Every field value is checked against its field schema before anything is
+    sent (each distinct value once, however many operations carry it), and
+    the whole bulk is rejected if one fails. $inc bounds are guarded in the
+    update filter as in updateDocument, so an increment that would leave its
+    range simply doesn't match. Upserts only check the fields they are given.
+    With read_back the inserted, updated and upserted documents are fetched
+    in one more query.
+    """
+    
+    if collection_name not in CollectionModelMatch:
+        raise CustomException(
+            message="""
+                Collection name has not been set up to
+                use generic crud functions - bulk write failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="bulk_write_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "operation_count": len(operations)
+            }
+        )
+    
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
+        raise CustomException(
+            message="""
+                BaseModel is not of the correct type
+                for the collection - bulk write failed
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="bulk_write_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "BaseModel": BaseModel.__name__,
+                "operation_count": len(operations)
+            }
+        )
+
+    if not operations:
+        return BulkWriteOutcome(0, 0, 0, 0, 0, [] if read_back else None)
+
+    now = datetime.now(timezone.utc)
+    requests = []
+    written_ids = []
+    upsert_filters = []
+    validation_failures = []
+    checked = {}
+
+    for index, operation in enumerate(operations):
+        error_fields = {}
+
+        if isinstance(operation, BulkInsert):
+            if not isinstance(operation.document, CollectionModelMatch[collection_name]):
+                error_fields['document'] = "Document is not of the correct type for the collection"
+            else:
+                payload = operation.document.model_dump(by_alias=True, exclude_none=True)
+                requests.append(InsertOne(payload))
+                written_ids.append(payload['_id'])
+
+        elif isinstance(operation, BulkUpdate):
+            set_data = exclude_created_at(descriptor.build_fields(operation.set_fields))
+            set_data.pop('_id', None)
+            increments = descriptor.build_fields(operation.increments)
+            if not set_data and not increments:
+                error_fields['set_fields'] = "No model fields to update"
+            error_fields.update(_validate_fields_once(descriptor, set_data, checked))
+
+            update_clause = {'$set': {**set_data, 'updated_at': now}}
+            if increments:
+                update_clause['$inc'] = increments
+            requests.append(UpdateOne(
+                {'_id': operation.document_id, **_increment_bound_filters(descriptor, update_clause)},
+                update_clause
+            ))
+            written_ids.append(operation.document_id)
+
+        elif isinstance(operation, BulkUpsert):
+            filter_data = descriptor.build_fields(operation.filter_fields)
+            set_data = exclude_created_at(descriptor.build_fields(operation.set_fields))
+            set_data.pop('_id', None)
+            if not filter_data:
+                error_fields['filter_fields'] = "No model fields to match on"
+            # Filter values are written too when the upsert inserts
+            error_fields.update(_validate_fields_once(descriptor, {**filter_data, **set_data}, checked))
+
+            requests.append(UpdateOne(
+                filter_data,
+                {
+                    '$set': {**set_data, 'updated_at': now},
+                    '$setOnInsert': {'_id': str(ObjectId()), 'created_at': now}
+                },
+                upsert=True
+            ))
+            upsert_filters.append(filter_data)
+
+        elif isinstance(operation, BulkDelete):
+            requests.append(DeleteOne({'_id': operation.document_id}))
+
+        else:
+            error_fields['operation'] = f"Unsupported bulk operation {type(operation).__name__}"
+
+        if error_fields:
+            validation_failures.append({
+                "operation_index": index,
+                "validation_errors": error_fields
+            })
+
+    if validation_failures:
+        raise CustomException(
+            message=f"""
+                Bulk write would violate field constraints for {len(validation_failures)} operation(s).
+                Sample errors: {validation_failures[0]['validation_errors']}
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="bulk_write_validation_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "validation_failures": validation_failures
+            }
+        )
+
+    loader = peek_document_loader(req)
+    try:
+        result = await req.app.mongodb[collection_name].bulk_write(requests, ordered=ordered)
+    except BulkWriteError as e:
+        raise CustomException(
+            message=f"""
+                Bulk write failed for {len(e.details.get('writeErrors', []))} operation(s)
+            """,
+            custom_error_path=error_path,
+            custom_error_file_name="bulk_write_failed.txt",
+            extra_error_info={
+                "collection_name": collection_name,
+                "ordered": ordered,
+                "write_errors": e.details.get('writeErrors', [])[:20]
+            }
+        )
+    finally:
+        if loader is not None:
+            loader.clear(collection_name)
+
+    documents = None
+    if read_back:
+        written_ids.extend(result.upserted_ids.values())
+        read_query = {'$or': [{'_id': {'$in': written_ids}}, *upsert_filters]}
+        documents = [
+            descriptor.load(document)
+            for document in await req.app.mongodb[collection_name].find(read_query).to_list(length=None)
+        ]
+
+    return BulkWriteOutcome(
+        inserted_count=result.inserted_count,
+        matched_count=result.matched_count,
+        modified_count=result.modified_count,
+        upserted_count=result.upserted_count,
+        deleted_count=result.deleted_count,
+        documents=documents
+    )
+
 # Delete Operations
 
 async def deleteDocument(
@@ -1165,7 +1544,6 @@ async def deleteDocument(
     **kwargs
 ) -> MongoBaseModel:
     
-    from crud._generic.model_mappings import CollectionModelMatch
 
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -1182,7 +1560,8 @@ async def deleteDocument(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type
@@ -1223,6 +1602,9 @@ async def deleteDocument(
     await req.app.mongodb[collection_name].delete_one({
         '_id': existing_document.id
     })
+    loader = peek_document_loader(req)
+    if loader is not None:
+        loader.prime(collection_name, existing_document.id, None)
 
     # Return the deleted document in case you need its data
     return existing_document
@@ -1235,7 +1617,6 @@ async def deleteMultipleDocuments(
     BaseModel: MongoBaseModel,
     **kwargs
 ) -> list[MongoBaseModel]:
-    from crud._generic.model_mappings import CollectionModelMatch
 
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -1252,7 +1633,8 @@ async def deleteMultipleDocuments(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type for the collection
@@ -1267,11 +1649,7 @@ async def deleteMultipleDocuments(
         )
 
     # Build the query from BaseModel fields
-    query = {}
-    for field_name, field in BaseModel.model_fields.items():
-        param_value = kwargs.get(field.alias, kwargs.get(field_name))
-        if param_value is not None:
-            query[field.alias if field.alias else field_name] = param_value
+    query = descriptor.build_fields(kwargs)
 
     if not query:
         raise CustomException(
@@ -1300,6 +1678,10 @@ async def deleteMultipleDocuments(
 
     # Perform the deletion
     await req.app.mongodb[collection_name].delete_many(query)
+    loader = peek_document_loader(req)
+    if loader is not None:
+        for document in documents_to_delete:
+            loader.prime(collection_name, document['_id'], None)
 
     # Return the list of deleted documents
     return [BaseModel(
@@ -1313,7 +1695,6 @@ async def deleteAllDocuments(
     collection_name: str,
     BaseModel: MongoBaseModel,
 ) -> list[MongoBaseModel]:
-    from crud._generic.model_mappings import CollectionModelMatch
 
     if collection_name not in CollectionModelMatch:
         raise CustomException(
@@ -1329,7 +1710,8 @@ async def deleteAllDocuments(
             }
         )
     
-    if not issubclass(BaseModel, CollectionModelMatch[collection_name]):
+    descriptor = get_query_descriptor(collection_name, BaseModel)
+    if descriptor is None:
         raise CustomException(
             message="""
                 BaseModel is not of the correct type for the collection
@@ -1352,6 +1734,9 @@ async def deleteAllDocuments(
 
     # Perform the deletion
     await req.app.mongodb[collection_name].delete_many({})
+    loader = peek_document_loader(req)
+    if loader is not None:
+        loader.clear(collection_name)
 
     # Return the list of deleted documents
     return [BaseModel(
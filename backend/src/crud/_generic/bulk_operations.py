@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
+
+from models._base import MongoBaseModel
+
+
+@dataclass(frozen=True)
+class BulkInsert:
+    """Insert an already validated document"""
+    document: MongoBaseModel
+
+
+@dataclass(frozen=True)
+class BulkUpdate:
+    """$set and/or $inc model fields (by name or alias) on the document with this _id"""
+    document_id: str
+    set_fields: dict[str, Any] = field(default_factory=dict)
+    increments: dict[str, int | float] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BulkUpsert:
+    """
+    $set model fields on the document matching filter_fields, inserting it
+    (with a fresh _id and created_at) when nothing matches
+    """
+    filter_fields: dict[str, Any]
+    set_fields: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BulkDelete:
+    """Delete the document with this _id"""
+    document_id: str
+
+
+BulkOperation = Union[BulkInsert, BulkUpdate, BulkUpsert, BulkDelete]
+
+
+@dataclass(frozen=True)
+class BulkWriteOutcome:
+    """Counts from the bulk write, plus the written documents when read back"""
+    inserted_count: int
+    matched_count: int
+    modified_count: int
+    upserted_count: int
+    deleted_count: int
+    documents: Optional[list[MongoBaseModel]] = None
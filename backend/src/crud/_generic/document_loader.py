@@ -0,0 +1,102 @@
+import asyncio
+from typing import Optional
+
+
+class DocumentLoader:
+    """
+    Request-scoped batching loader for documents fetched by _id.
+
+    Every load() made in the same event loop tick for a collection is sent as
+    one find({'_id': {'$in': [...]}}), and results (including misses) are
+    memoized for the life of the request, so repeated lookups of the same
+    document cost nothing. Writes made through the generic CRUD functions
+    prime or clear the affected entries; raw writes elsewhere in the same
+    request are not seen.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._results: dict[tuple[str, str], asyncio.Future] = {}
+        self._pending: dict[str, dict[str, asyncio.Future]] = {}
+        # Strong references to running dispatches - the event loop only keeps weak ones
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, collection_name: str, document_id: str) -> Optional[dict]:
+        """Raw document for an _id, or None if it doesn't exist"""
+        key = (collection_name, document_id)
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[key] = future
+
+            pending = self._pending.get(collection_name)
+            if pending is None:
+                pending = self._pending[collection_name] = {}
+                # Dispatch once the current tick's callers have all queued their ids
+                loop.call_soon(self._start_dispatch, collection_name)
+            pending[document_id] = future
+
+        # Shielded so one caller being cancelled doesn't cancel the shared load
+        document = await asyncio.shield(future)
+        # Top-level copy so callers can't change the memoized document
+        return dict(document) if document is not None else None
+
+    def _start_dispatch(self, collection_name: str) -> None:
+        task = asyncio.ensure_future(self._dispatch(collection_name))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, collection_name: str) -> None:
+        pending = self._pending.pop(collection_name, {})
+        if not pending:
+            return
+        try:
+            documents = await self.db[collection_name].find(
+                {'_id': {'$in': list(pending)}}
+            ).to_list(length=None)
+        except Exception as e:
+            for document_id, future in pending.items():
+                # Forget the failure so a later load retries - unless a prime() replaced it meanwhile
+                key = (collection_name, document_id)
+                if self._results.get(key) is future:
+                    del self._results[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        found = {document['_id']: document for document in documents}
+        for document_id, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(document_id))
+
+    def prime(self, collection_name: str, document_id: str, document: Optional[dict]) -> None:
+        """Record a document's current state (None once deleted) after a write"""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(document)
+        self._results[(collection_name, document_id)] = future
+
+    def clear(self, collection_name: str, document_id: Optional[str] = None) -> None:
+        """Forget one document, or every document of a collection"""
+        if document_id is not None:
+            self._results.pop((collection_name, document_id), None)
+            return
+        for key in [key for key in self._results if key[0] == collection_name]:
+            self._results.pop(key, None)
+
+
+def get_document_loader(req) -> Optional[DocumentLoader]:
+    """The request's loader, created on first use - None for callers without request state"""
+    state = getattr(req, 'state', None)
+    if state is None:
+        return None
+    loader = getattr(state, 'document_loader', None)
+    if loader is None:
+        loader = DocumentLoader(req.app.mongodb)
+        state.document_loader = loader
+    return loader
+
+
+def peek_document_loader(req) -> Optional[DocumentLoader]:
+    """The request's loader only if one was already created (used to keep it in step with writes)"""
+    return getattr(getattr(req, 'state', None), 'document_loader', None)
@@ -0,0 +1,49 @@
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from crud._generic.model_mappings import CollectionModelMatch
+
+# IndexOptionsConflict / IndexKeySpecsConflict - an index with the same name
+# or keys already exists with different options
+INDEX_CONFLICT_CODES = {85, 86}
+
+
+async def ensure_collection_indexes(db) -> None:
+    """
+    Reconcile the indexes declared on every CollectionModelMatch model (its
+    `indexes` class attribute) with the database. Missing indexes are built;
+    one whose name or keys clash with a declared index but whose options
+    differ is dropped and rebuilt. Undeclared indexes are left alone.
+    """
+    for collection_name, Model in CollectionModelMatch.items():
+        if Model.indexes:
+            await _reconcile_indexes(db[collection_name], Model.indexes)
+
+
+async def _reconcile_indexes(collection, indexes: list[IndexModel]) -> None:
+    try:
+        # create_indexes is a no-op for indexes that already match
+        await collection.create_indexes(indexes)
+        return
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:
+            raise
+
+    # Find the conflicting ones one by one
+    for index in indexes:
+        try:
+            await collection.create_indexes([index])
+        except OperationFailure as e:
+            if e.code not in INDEX_CONFLICT_CODES:
+                raise
+            await _drop_conflicting_index(collection, index)
+            await collection.create_indexes([index])
+
+
+async def _drop_conflicting_index(collection, index: IndexModel) -> None:
+    name = index.document['name']
+    keys = list(index.document['key'].items())
+    for existing_name, info in (await collection.index_information()).items():
+        if existing_name != '_id_' and (existing_name == name or list(info['key']) == keys):
+            print(f"Rebuilding index {existing_name} on {collection.name} to match its declared options")
+            await collection.drop_index(existing_name)
@@ -1,7 +1,7 @@
 from models.auth.refresh import RefreshToken
 from models.users.users import User
 from models.questions.questions import BaseQuestion
-from models.leaderboard.leaderboard import NationalLeaderboard, SchoolLeaderboard
+from models.leaderboard.leaderboard import NationalLeaderboard, NationalBestScore, NationalDailyBest, SchoolLeaderboard, SchoolTotal, RegionLeaderboard, ScoreIngestionBatch
 from models.schools.school import School
 
 CollectionModelMatch = {
@@ -9,6 +9,11 @@ CollectionModelMatch = {
     'users': User,
     'questions': BaseQuestion,  # Using base question model for all question types
     'national_leaderboard': NationalLeaderboard,
+    'national_best_scores': NationalBestScore,
+    'national_daily_best': NationalDailyBest,
     'school_leaderboard': SchoolLeaderboard,
+    'school_totals': SchoolTotal,
+    'region_leaderboard': RegionLeaderboard,
+    'score_ingestion_batches': ScoreIngestionBatch,
     'schools': School
 }
@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from typing import Annotated, Iterable, Optional
+
+from pydantic import BaseModel as PydanticBaseModel, ConfigDict, TypeAdapter, create_model
+from pydantic.fields import FieldInfo
+
+from models._base import MongoBaseModel
+from crud._generic.model_mappings import CollectionModelMatch
+
+# Collections whose documents are trusted enough to skip validation on read
+CONSTRUCT_ON_READ = {'users'}
+
+
+@dataclass(frozen=True)
+class ModelQueryDescriptor:
+    """
+    Everything the generic CRUD functions need to know about a
+    (collection, model) pair, worked out once instead of on every call.
+
+    key_map maps every accepted kwarg (field name or alias) to the key stored
+    in MongoDB; aliased names lose to the alias when both are passed, as the
+    old per-call loops did.
+    """
+    collection_name: str
+    BaseModel: type[MongoBaseModel]
+    key_map: dict[str, str]
+    alias_keys: frozenset[str]
+    fields: dict[str, FieldInfo]
+    projection: dict[str, int]
+    index_hints: tuple[tuple[str, ...], ...]
+    construct_on_read: bool
+
+    def resolve(self, key: str) -> Optional[str]:
+        """Stored key for a field name or alias, None if it isn't a model field"""
+        return self.key_map.get(key)
+
+    def field(self, key: str) -> Optional[FieldInfo]:
+        stored_key = self.key_map.get(key)
+        return self.fields[stored_key] if stored_key is not None else None
+
+    def build_fields(self, kwargs: dict, include_none: bool = False) -> dict:
+        """Map model field kwargs onto their stored keys, dropping anything else"""
+        values = {}
+        for key, value in kwargs.items():
+            stored_key = self.key_map.get(key)
+            if stored_key is None or (value is None and not include_none):
+                continue
+            if stored_key in values and key not in self.alias_keys:
+                continue
+            values[stored_key] = value
+        return values
+
+    def build_query(self, kwargs: dict, include_none: bool = False) -> dict:
+        """build_fields plus embedded field filters written with double underscores (a__b -> a.b)"""
+        query = self.build_fields(kwargs, include_none)
+        for key, value in kwargs.items():
+            if "__" in key and key not in query and key not in self.key_map:
+                query[key.replace("__", ".")] = value
+        return query
+
+    def is_unindexed(self, query: dict) -> bool:
+        """True when the model declares indexes and none of them can serve the query"""
+        if not self.index_hints or '_id' in query:
+            return False
+        return not any(hint[0] in query for hint in self.index_hints)
+
+    def load(self, document: dict, Model: Optional[type[PydanticBaseModel]] = None) -> MongoBaseModel:
+        """Build Model (the descriptor's model by default) from a stored document"""
+        Model = Model or self.BaseModel
+        if self.construct_on_read:
+            return Model.model_construct(**document)
+        return Model(**document)
+
+    def partial_model(self, fields: Iterable[str]) -> Optional[type[PydanticBaseModel]]:
+        """
+        Model holding only the given fields (by name or alias) plus the id, with
+        their original types and constraints - None if any isn't a model field
+        """
+        stored_keys = set()
+        for field in fields:
+            stored_key = self.key_map.get(field)
+            if stored_key is None:
+                return None
+            stored_keys.add(stored_key)
+        stored_keys.add(self.key_map['id'])
+        return get_partial_model(self.BaseModel, frozenset(stored_keys))
+
+
+def _stored_key(field_name: str, field: FieldInfo) -> str:
+    return field.alias if field.alias else field_name
+
+
+def _index_hints(BaseModel: type[MongoBaseModel]) -> tuple[tuple[str, ...], ...]:
+    """Key order of every pymongo IndexModel a model declares in its `indexes` class attribute"""
+    return tuple(
+        tuple(index.document['key'].keys())
+        for index in getattr(BaseModel, 'indexes', ())
+    )
+
+
+def compile_query_descriptor(collection_name: str, BaseModel: type[MongoBaseModel]) -> ModelQueryDescriptor:
+    key_map = {}
+    alias_keys = set()
+    fields = {}
+    for field_name, field in BaseModel.model_fields.items():
+        stored_key = _stored_key(field_name, field)
+        key_map[field_name] = stored_key
+        if field.alias:
+            key_map[field.alias] = stored_key
+            alias_keys.add(field.alias)
+        fields[stored_key] = field
+
+    return ModelQueryDescriptor(
+        collection_name=collection_name,
+        BaseModel=BaseModel,
+        key_map=key_map,
+        alias_keys=frozenset(alias_keys),
+        fields=fields,
+        projection=get_projection(BaseModel),
+        index_hints=_index_hints(BaseModel),
+        construct_on_read=collection_name in CONSTRUCT_ON_READ
+    )
+
+
+_projections: dict[type, dict[str, int]] = {}
+
+def get_projection(ProjectionModel: type[MongoBaseModel]) -> dict[str, int]:
+    """Mongo projection selecting exactly the stored keys of a model (always including _id)"""
+    projection = _projections.get(ProjectionModel)
+    if projection is None:
+        projection = {
+            _stored_key(field_name, field): 1
+            for field_name, field in ProjectionModel.model_fields.items()
+        }
+        projection.setdefault('_id', 1)
+        _projections[ProjectionModel] = projection
+    return projection
+
+
+_partial_models: dict[tuple[type, frozenset], type[PydanticBaseModel]] = {}
+
+def get_partial_model(BaseModel: type[MongoBaseModel], stored_keys: frozenset) -> type[PydanticBaseModel]:
+    """Cached pydantic model made of the BaseModel fields stored under stored_keys"""
+    cache_key = (BaseModel, stored_keys)
+    PartialModel = _partial_models.get(cache_key)
+    if PartialModel is None:
+        PartialModel = create_model(
+            f"Partial{BaseModel.__name__}",
+            __config__=ConfigDict(populate_by_name=True),
+            **{
+                field_name: (field.annotation, field)
+                for field_name, field in BaseModel.model_fields.items()
+                if _stored_key(field_name, field) in stored_keys
+            }
+        )
+        _partial_models[cache_key] = PartialModel
+    return PartialModel
+
+
+_descriptors: dict[tuple[str, type], ModelQueryDescriptor] = {
+    (collection_name, BaseModel): compile_query_descriptor(collection_name, BaseModel)
+    for collection_name, BaseModel in CollectionModelMatch.items()
+}
+
+def get_query_descriptor(collection_name: str, BaseModel: type[MongoBaseModel]) -> Optional[ModelQueryDescriptor]:
+    """
+    Descriptor for a collection and model, None if the collection isn't set up
+    for generic CRUD or the model doesn't belong to it. Registered models are
+    compiled at import; subclasses (e.g. question types) on first use.
+    """
+    descriptor = _descriptors.get((collection_name, BaseModel))
+    if descriptor is not None:
+        return descriptor
+
+    collection_model = CollectionModelMatch.get(collection_name)
+    if collection_model is None or not issubclass(BaseModel, collection_model):
+        return None
+
+    descriptor = compile_query_descriptor(collection_name, BaseModel)
+    _descriptors[(collection_name, BaseModel)] = descriptor
+    return descriptor
+
+
+_field_adapters: dict[tuple[type, str], Optional[TypeAdapter]] = {}
+
+def get_field_adapter(descriptor: ModelQueryDescriptor, field_key: str) -> Optional[TypeAdapter]:
+    """TypeAdapter validating one field's type and constraints, keyed by alias or name"""
+    cache_key = (descriptor.BaseModel, field_key)
+    if cache_key not in _field_adapters:
+        field = descriptor.field(field_key)
+        adapter = None
+        if field is not None:
+            annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            adapter = TypeAdapter(annotation)
+        _field_adapters[cache_key] = adapter
+    return _field_adapters[cache_key]
@@ -0,0 +1,135 @@
+import asyncio
+from typing import Iterable, List, Optional
+
+from crud.leaderboard.leaderboard import LEADERBOARD_RANK_FIELDS, get_ranked_leaderboard
+
+# Queued in place of the backlog when a subscriber falls too far behind
+RESYNC = object()
+
+
+class LeaderboardSubscription:
+    """One stream client's bounded queue of top-N deltas for a single leaderboard scope"""
+
+    def __init__(self, board: str, scope: str, queue_size: int):
+        self.board = board
+        self.scope = scope
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event) -> None:
+        """Queue an event without blocking, swapping the backlog for RESYNC once the queue is full"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class LeaderboardBroadcaster:
+    """
+    Per-worker fan-out of live top-N changes to leaderboard stream subscribers.
+
+    The write path only marks scopes dirty; a background flusher wakes every
+    flush_seconds, diffs each dirty scope's top N against what it last sent and
+    pushes one compact delta per scope, so a burst of submissions becomes a
+    single event per subscriber.
+    """
+
+    def __init__(self, app, top_n: int = 50, queue_size: int = 32, flush_seconds: float = 1.0):
+        self.app = app
+        self.top_n = top_n
+        self.queue_size = queue_size
+        self.flush_seconds = flush_seconds
+        self._subscriptions: dict[tuple[str, str], set[LeaderboardSubscription]] = {}
+        self._last_sent: dict[tuple[str, str], dict[str, tuple[int, int]]] = {}
+        self._dirty: set[tuple[str, str]] = set()
+        self._flusher: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._flusher = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+    def subscribe(self, board: str, scope: str) -> LeaderboardSubscription:
+        subscription = LeaderboardSubscription(board, scope, self.queue_size)
+        self._subscriptions.setdefault((board, scope), set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LeaderboardSubscription) -> None:
+        scope_key = (subscription.board, subscription.scope)
+        subscriptions = self._subscriptions.get(scope_key)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            self._subscriptions.pop(scope_key, None)
+            self._last_sent.pop(scope_key, None)
+            self._dirty.discard(scope_key)
+
+    def scopes(self, board: str) -> List[str]:
+        """Scopes of a board that currently have subscribers"""
+        return [scope for key_board, scope in self._subscriptions if key_board == board]
+
+    def mark_dirty(self, board: str, scopes: Optional[Iterable[str]] = None) -> None:
+        """Flag scopes (every subscribed scope of the board if None) for the next flush"""
+        for scope in self.scopes(board) if scopes is None else scopes:
+            if (board, scope) in self._subscriptions:
+                self._dirty.add((board, scope))
+
+    async def snapshot(self, board: str, scope: str) -> List[dict]:
+        """Current top N of a scope, with ranks - the first one taken becomes the baseline for deltas"""
+        leaderboard = await get_ranked_leaderboard(self.app, board, scope)
+        rows = [{**row, "rank": rank} for rank, row in enumerate(leaderboard.top(self.top_n), start=1)]
+        if (board, scope) in self._subscriptions and (board, scope) not in self._last_sent:
+            self._last_sent[(board, scope)] = self._rank_map(board, rows)
+        return rows
+
+    def _rank_map(self, board: str, rows: List[dict]) -> dict[str, tuple[int, int]]:
+        id_field, score_field = LEADERBOARD_RANK_FIELDS[board]
+        return {row[id_field]: (row["rank"], row[score_field]) for row in rows}
+
+    async def _flush_forever(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_sweep = loop.time()
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            # Writes from other workers only reach this one through index reloads,
+            # so re-check every subscribed scope once per index TTL
+            if loop.time() >= next_sweep:
+                self._dirty.update(self._subscriptions)
+                next_sweep = loop.time() + self.app.leaderboard_index.ttl_seconds
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Leaderboard stream flush failed: {e}")
+
+    async def flush(self) -> None:
+        """Send one delta per dirty scope to its subscribers"""
+        dirty, self._dirty = self._dirty, set()
+
+        for board, scope in dirty:
+            subscriptions = self._subscriptions.get((board, scope))
+            if not subscriptions:
+                continue
+
+            id_field = LEADERBOARD_RANK_FIELDS[board][0]
+            previous = self._last_sent.get((board, scope), {})
+            rows = await self.snapshot(board, scope)
+            current = self._rank_map(board, rows)
+            self._last_sent[(board, scope)] = current
+
+            changed = [row for row in rows if previous.get(row[id_field]) != current[row[id_field]]]
+            removed = [member_id for member_id in previous if member_id not in current]
+            if not changed and not removed:
+                continue
+
+            delta = {"changed": changed, "removed": removed}
+            for subscription in list(subscriptions):
+                subscription.push(delta)
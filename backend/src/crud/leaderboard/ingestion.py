@@ -0,0 +1,135 @@
+import asyncio
+import traceback
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from bson import ObjectId
+
+from models.leaderboard.leaderboard import ScoreIngestionDeadLetter, ScoreSubmission
+from crud.leaderboard.leaderboard import ingest_score_batch
+
+# Queued behind every pending submission to stop the writer once they are flushed
+_DRAIN = object()
+
+
+class ScoreIngestionQueue:
+    """
+    Per-worker write-behind buffer for score submissions.
+
+    submit() only enqueues; a single writer task collects up to batch_size
+    submissions, waiting at most max_latency_seconds after the first one, and
+    writes them with ingest_score_batch. drain() flushes everything still
+    queued, so it must be awaited on shutdown before the Mongo client closes.
+
+    Submissions are acknowledged before they are written, so a failed batch is
+    retried with exponential backoff (also while draining) - the writer holds
+    the batch and stops taking new ones meanwhile, so the bounded queue pushes
+    back on submitters. A batch still failing after max_attempts is stored in
+    the score_ingestion_dead_letters collection instead of being dropped.
+    """
+
+    def __init__(
+        self,
+        app,
+        batch_size: int = 200,
+        max_latency_seconds: float = 0.25,
+        max_pending: int = 10000,
+        max_attempts: int = 5,
+        retry_delay_seconds: float = 0.5,
+        max_retry_delay_seconds: float = 10.0
+    ):
+        self.app = app
+        self.batch_size = batch_size
+        self.max_latency_seconds = max_latency_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        # Bounded so a stalled database applies backpressure instead of growing memory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._writer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_forever())
+
+    async def submit(self, submission: ScoreSubmission) -> None:
+        # Server-assigned id - it becomes the national entry's _id, which is what makes retries idempotent
+        await self._queue.put(submission.model_copy(update={'id': str(ObjectId())}))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    async def drain(self) -> None:
+        """Flush every queued submission and stop the writer"""
+        if self._writer is None:
+            return
+        await self._queue.put(_DRAIN)
+        await self._writer
+        self._writer = None
+
+    async def _next_batch(self) -> tuple[List[ScoreSubmission], bool]:
+        """Wait for a submission, then gather more until the batch is full or max latency passes"""
+        loop = asyncio.get_running_loop()
+
+        first = await self._queue.get()
+        if first is _DRAIN:
+            return [], True
+
+        batch = [first]
+        deadline = loop.time() + self.max_latency_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                submission = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if submission is _DRAIN:
+                return batch, True
+            batch.append(submission)
+
+        return batch, False
+
+    async def _write_forever(self) -> None:
+        while True:
+            batch, draining = await self._next_batch()
+            if batch:
+                await self._write_batch(batch)
+            if draining:
+                return
+
+    async def _write_batch(self, batch: List[ScoreSubmission]) -> None:
+        """Write a batch, retrying with backoff until it succeeds or max_attempts runs out"""
+        # Fixed for every attempt so a retry lands in the same day buckets
+        batch_time = datetime.now(timezone.utc)
+        delay = self.retry_delay_seconds
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await ingest_score_batch(self.app, batch, batch_time)
+                return
+            except Exception:
+                error = traceback.format_exc()
+                print(f"Attempt {attempt}/{self.max_attempts} to write {len(batch)} queued score submissions failed:\n{error}")
+            if attempt < self.max_attempts:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay_seconds)
+
+        await self._dead_letter(batch, batch_time, error)
+
+    async def _dead_letter(self, batch: List[ScoreSubmission], batch_time: datetime, error: str) -> None:
+        dead_letter = ScoreIngestionDeadLetter(
+            batch_time=batch_time,
+            submissions=batch,
+            attempts=self.max_attempts,
+            error=error
+        )
+        try:
+            await self.app.mongodb['score_ingestion_dead_letters'].insert_one(
+                dead_letter.model_dump(by_alias=True, exclude_none=True)
+            )
+        except Exception:
+            # Last resort - the log is the only place left to recover the batch from
+            print(
+                f"Failed to dead-letter {len(batch)} score submissions:\n{traceback.format_exc()}"
+                f"{dead_letter.model_dump_json(by_alias=True)}"
+            )
@@ -1,11 +1,275 @@
 from fastapi import Request, HTTPException
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from datetime import datetime, timedelta, timezone
 from dateutil import parser
+import asyncio
+import base64
+import binascii
+import json
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
-from models.leaderboard.leaderboard import NationalLeaderboard, SchoolLeaderboard, ScoreSubmission
-from models.schools.school import School
+from models.leaderboard.leaderboard import NationalLeaderboard, SchoolLeaderboard, SchoolTotal, ScoreSubmission
 from crud._generic import _db_actions
+from crud.leaderboard.rank_index import RankedLeaderboard
+from crud.lookups.lookups import get_user_school_id, get_school_summary, get_user_school_ids, get_school_summaries
+
+# Atomic Upserts
+async def _upsert_and_return(collection, key: dict, update: dict) -> dict:
+    """Atomic upsert returning the written document, retried once if a concurrent upsert inserted first"""
+    try:
+        return await collection.find_one_and_update(
+            key,
+            update,
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        # The unique index on key made the other insert win - apply ours on top of it
+        return await collection.find_one_and_update(
+            key,
+            update,
+            return_document=ReturnDocument.AFTER
+        )
+
+async def _bulk_upsert_increments(collection, upserts: List[tuple[dict, dict]]) -> None:
+    """Run several atomic upserts in one unordered bulk_write, retrying any that lost an insert race"""
+    try:
+        await collection.bulk_write(
+            [UpdateOne(key, update, upsert=True) for key, update in upserts],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        write_errors = e.details.get('writeErrors', [])
+        if any(error['code'] != 11000 for error in write_errors):
+            raise
+        # Only the duplicate key failures were not applied - the document exists now
+        await collection.bulk_write(
+            [UpdateOne(*upserts[error['index']]) for error in write_errors],
+            ordered=False
+        )
+
+async def _bulk_upsert_if_higher(collection, upserts: List[tuple[dict, dict]]) -> None:
+    """Run several best-score upserts in one unordered bulk_write - duplicate key failures mean the stored best was higher"""
+    if not upserts:
+        return
+    try:
+        await collection.bulk_write(
+            [UpdateOne(key, update, upsert=True) for key, update in upserts],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        if any(error['code'] != 11000 for error in e.details.get('writeErrors', [])):
+            raise
+
+def _batch_marker(collection_name: str, key: dict) -> str:
+    """Idempotency marker of one counter upsert of an ingestion batch"""
+    return f"{collection_name}:{'|'.join(str(value) for value in key.values())}"
+
+async def _apply_batch_increments(db, batch_id: str, collection_name: str, upserts: List[tuple[dict, dict]], applied: set) -> None:
+    """
+    _bulk_upsert_increments for an ingestion batch: skips the upserts an earlier attempt
+    already applied, then records the ones this attempt applied on the batch record
+    (even when others failed), so a retry can't count them twice
+    """
+    pending = [(_batch_marker(collection_name, key), (key, update)) for key, update in upserts]
+    pending = [(marker, upsert) for marker, upsert in pending if marker not in applied]
+    if not pending:
+        return
+    
+    collection = db[collection_name]
+    failed = set()
+    error = None
+    try:
+        await collection.bulk_write(
+            [UpdateOne(key, update, upsert=True) for _, (key, update) in pending],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        write_errors = e.details.get('writeErrors', [])
+        failed = {write_error['index'] for write_error in write_errors if write_error['code'] != 11000}
+        error = e if failed else None
+        # Only the duplicate key failures were not applied - the document exists now
+        lost_races = [write_error['index'] for write_error in write_errors if write_error['code'] == 11000]
+        if lost_races:
+            try:
+                await collection.bulk_write(
+                    [UpdateOne(*pending[index][1]) for index in lost_races],
+                    ordered=False
+                )
+            except BulkWriteError as retry_error:
+                failed |= {lost_races[write_error['index']] for write_error in retry_error.details.get('writeErrors', [])}
+                error = retry_error
+    
+    done = [marker for index, (marker, _) in enumerate(pending) if index not in failed]
+    if done:
+        await db['score_ingestion_batches'].update_one(
+            {'_id': batch_id},
+            {'$addToSet': {'applied': {'$each': done}}}
+        )
+    if error is not None:
+        raise error
+
+# Day Buckets
+def get_day_bucket(moment: datetime) -> str:
+    """UTC day key (YYYY-MM-DD) used to bucket daily leaderboard entries"""
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%d')
+
+def parse_day_bucket(date_str: str) -> str:
+    """Normalise a requested date into a day bucket, rejecting unparseable input"""
+    try:
+        return get_day_bucket(parser.parse(date_str).replace(tzinfo=timezone.utc))
+    except (ValueError, TypeError, OverflowError):
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+# Day Ranges
+MAX_LEADERBOARD_RANGE_DAYS = 366
+
+def parse_day_range(start_str: str, end_str: str) -> tuple[str, str]:
+    """Normalise an inclusive [start, end] date range into day buckets"""
+    start_bucket = parse_day_bucket(start_str)
+    end_bucket = parse_day_bucket(end_str)
+    if start_bucket > end_bucket:
+        raise HTTPException(status_code=400, detail="Range start must not be after range end")
+    if len(get_range_day_buckets(start_bucket, end_bucket)) > MAX_LEADERBOARD_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Ranges are limited to {MAX_LEADERBOARD_RANGE_DAYS} days")
+    return start_bucket, end_bucket
+
+def parse_week_range(date_str: str) -> tuple[str, str]:
+    """Monday-to-Sunday UTC week containing the given date"""
+    day = datetime.strptime(parse_day_bucket(date_str), '%Y-%m-%d')
+    monday = day - timedelta(days=day.weekday())
+    return get_day_bucket(monday.replace(tzinfo=timezone.utc)), get_day_bucket((monday + timedelta(days=6)).replace(tzinfo=timezone.utc))
+
+def parse_month_range(month_str: str) -> tuple[str, str]:
+    """First and last UTC day of a YYYY-MM month"""
+    try:
+        first_day = datetime.strptime(month_str, '%Y-%m')
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM")
+    next_month = (first_day + timedelta(days=32)).replace(day=1)
+    return first_day.strftime('%Y-%m-%d'), (next_month - timedelta(days=1)).strftime('%Y-%m-%d')
+
+def get_range_day_buckets(start_bucket: str, end_bucket: str) -> List[str]:
+    """Every day bucket in an inclusive range"""
+    day = datetime.strptime(start_bucket, '%Y-%m-%d')
+    end = datetime.strptime(end_bucket, '%Y-%m-%d')
+    day_buckets = []
+    while day <= end:
+        day_buckets.append(day.strftime('%Y-%m-%d'))
+        day += timedelta(days=1)
+    return day_buckets
+
+def get_range_scope(start_bucket: str, end_bucket: str) -> str:
+    """Ranked index scope key for a day range"""
+    return f"{start_bucket}..{end_bucket}"
+
+def range_scope_contains(scope: str, day_bucket: str) -> bool:
+    """Whether a ranked index scope is a day range covering day_bucket"""
+    if '..' not in scope:
+        return False
+    start_bucket, end_bucket = scope.split('..')
+    return start_bucket <= day_bucket <= end_bucket
+
+# National Best Score Projection
+def _best_score_upsert(entry: NationalLeaderboard, key: dict) -> tuple[dict, dict]:
+    """(filter, update) raising a best score projection document to this entry's score if it beats it"""
+    return (
+        # Only matches when the stored best is lower - otherwise the upsert
+        # collides with the unique index on key and there is nothing to do
+        {**key, 'score': {'$lt': entry.score}},
+        {
+            '$set': {
+                'username': entry.username,
+                'score': entry.score,
+                'entry_id': entry.id,
+                'created_at': entry.created_at,
+                'updated_at': entry.updated_at
+            },
+            '$setOnInsert': {'_id': str(ObjectId())}
+        }
+    )
+
+async def upsert_national_best_score(req: Request, entry: NationalLeaderboard) -> None:
+    """Raise the user's stored best score to this entry's score if it beats it"""
+    
+    try:
+        await req.app.mongodb['national_best_scores'].update_one(
+            *_best_score_upsert(entry, {'user_id': entry.user_id}),
+            upsert=True
+        )
+    except DuplicateKeyError:
+        pass
+
+async def upsert_national_daily_best(req: Request, entry: NationalLeaderboard) -> None:
+    """Raise the user's stored best score for the entry's day to this entry's score if it beats it"""
+    
+    try:
+        await req.app.mongodb['national_daily_best'].update_one(
+            *_best_score_upsert(entry, {'user_id': entry.user_id, 'day_bucket': get_day_bucket(entry.created_at)}),
+            upsert=True
+        )
+    except DuplicateKeyError:
+        pass
+
+async def rebuild_national_best_score(req: Request, user_id: str) -> None:
+    """Recompute a user's best score from their national entries (after edits or deletes)"""
+    
+    top_entry = await req.app.mongodb['national_leaderboard'].find_one(
+        {'user_id': user_id},
+        sort=[('score', DESCENDING), ('created_at', ASCENDING)]
+    )
+    
+    if not top_entry:
+        await req.app.mongodb['national_best_scores'].delete_one({'user_id': user_id})
+        return
+    
+    await req.app.mongodb['national_best_scores'].update_one(
+        {'user_id': user_id},
+        {
+            '$set': {
+                'username': top_entry['username'],
+                'score': top_entry['score'],
+                'entry_id': top_entry['_id'],
+                'created_at': top_entry['created_at'],
+                'updated_at': top_entry['updated_at']
+            },
+            '$setOnInsert': {'_id': str(ObjectId())}
+        },
+        upsert=True
+    )
+
+async def rebuild_national_daily_best(req: Request, user_id: str, day_bucket: str) -> None:
+    """Recompute a user's best score for one day from their national entries (after edits or deletes)"""
+    
+    start_of_day = datetime.strptime(day_bucket, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    top_entry = await req.app.mongodb['national_leaderboard'].find_one(
+        {
+            'user_id': user_id,
+            'created_at': {'$gte': start_of_day, '$lt': start_of_day + timedelta(days=1)}
+        },
+        sort=[('score', DESCENDING), ('created_at', ASCENDING)]
+    )
+    
+    if not top_entry:
+        await req.app.mongodb['national_daily_best'].delete_one({'user_id': user_id, 'day_bucket': day_bucket})
+        return
+    
+    await req.app.mongodb['national_daily_best'].update_one(
+        {'user_id': user_id, 'day_bucket': day_bucket},
+        {
+            '$set': {
+                'username': top_entry['username'],
+                'score': top_entry['score'],
+                'entry_id': top_entry['_id'],
+                'created_at': top_entry['created_at'],
+                'updated_at': top_entry['updated_at']
+            },
+            '$setOnInsert': {'_id': str(ObjectId())}
+        },
+        upsert=True
+    )
 
 # National Leaderboard Functions
 async def create_national_entry(req: Request, user_id: str, username: str, score: int) -> NationalLeaderboard:
@@ -24,90 +288,66 @@ async def create_national_entry(req: Request, user_id: str, username: str, score
         new_document=entry
     )
     
+    # Keep the per-user best score projections and ranked index in step with the new entry
+    await upsert_national_best_score(req, created_entry)
+    await upsert_national_daily_best(req, created_entry)
+    _record_national_entry_in_index(req.app, created_entry)
+    
     return created_entry
 
-async def get_national_all_time(req: Request, limit: Optional[int] = None) -> List[dict]:
-    """Get highest score per user for all time"""
+async def _load_national_all_time(db) -> List[dict]:
+    """Load highest score per user for all time (read from the best score projection)"""
     
     pipeline = [
-        # Group by user_id and get the document with maximum score for each user
+        # Served by the (score, user_id) index - no grouping over entry history
+        {"$sort": {"score": -1, "user_id": 1}},
+        # Reshape the output
         {
-            "$group": {
+            "$project": {
                 "_id": "$user_id",
-                "top_score_doc": {
-                    "$top": {
-                        "output": {
-                            "score": "$score",
-                            "id": "$_id",
-                            "username": "$username",
-                            "user_id": "$user_id",
-                            "created_at": "$created_at",
-                            "updated_at": "$updated_at"
-                        },
-                        "sortBy": {"score": -1}
-                    }
-                }
-            }
-        },
-        # Flatten the structure
-        {
-            "$replaceRoot": {
-                "newRoot": {
-                    "_id": "$_id",
-                    "max_score": "$top_score_doc.score",
-                    "username": "$top_score_doc.username",
-                    "user_id": "$top_score_doc.user_id",
-                    "id": "$top_score_doc.id",
-                    "created_at": "$top_score_doc.created_at",
-                    "updated_at": "$top_score_doc.updated_at"
-                }
+                "username": 1,
+                "user_id": 1,
+                "id": "$entry_id",
+                "score": 1,
+                "created_at": 1,
+                "updated_at": 1
             }
-        },
-        # Sort by max_score in descending order
-        {"$sort": {"max_score": -1}},
+        }
+    ]
+    
+    results = await db['national_best_scores'].aggregate(pipeline).to_list(length=None)
+    return results
+
+async def _load_national_by_date(db, day_bucket: str) -> List[dict]:
+    """Load highest score per user for a specific day bucket (read from the daily best projection)"""
+    
+    pipeline = [
+        # Served by the (day_bucket, score, user_id) index
+        {"$match": {"day_bucket": day_bucket}},
+        {"$sort": {"score": -1, "user_id": 1}},
         # Reshape the output
         {
             "$project": {
-                "_id": {"$toString": "$_id"},
+                "_id": "$user_id",
                 "username": 1,
                 "user_id": 1,
-                "id": 1,
-                "score": "$max_score",
+                "id": "$entry_id",
+                "score": 1,
                 "created_at": 1,
                 "updated_at": 1
             }
         }
     ]
     
-    # Add limit if specified
-    if limit:
-        pipeline.insert(-1, {"$limit": limit})
-    
-    results = await req.app.mongodb['national_leaderboard'].aggregate(pipeline).to_list(length=None)
+    results = await db['national_daily_best'].aggregate(pipeline).to_list(length=None)
     return results
 
-async def get_national_by_date(req: Request, date_str: str, limit: Optional[int] = None) -> List[dict]:
-    """Get highest score per user for a specific date"""
-    
-    # Parse the date string and create start/end of day
-    try:
-        target_date = parser.parse(date_str).replace(tzinfo=timezone.utc)
-        start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+async def _load_national_by_range(db, start_bucket: str, end_bucket: str) -> List[dict]:
+    """Load highest score per user across a day range by merging their daily bests"""
     
     pipeline = [
-        # Filter by date range
-        {
-            "$match": {
-                "created_at": {
-                    "$gte": start_of_day,
-                    "$lte": end_of_day
-                }
-            }
-        },
-        # Group by user_id and get the document with maximum score for each user on this date
+        {"$match": {"day_bucket": {"$gte": start_bucket, "$lte": end_bucket}}},
+        # Best day per user
         {
             "$group": {
                 "_id": "$user_id",
@@ -115,147 +355,215 @@ async def get_national_by_date(req: Request, date_str: str, limit: Optional[int]
                     "$top": {
                         "output": {
                             "score": "$score",
-                            "id": "$_id",
+                            "id": "$entry_id",
                             "username": "$username",
                             "user_id": "$user_id",
                             "created_at": "$created_at",
                             "updated_at": "$updated_at"
                         },
-                        "sortBy": {"score": -1}
+                        "sortBy": {"score": -1, "created_at": 1}
                     }
                 }
             }
         },
-        # Flatten the structure
+        {"$replaceRoot": {"newRoot": {"$mergeObjects": [{"_id": "$_id"}, "$top_score_doc"]}}},
+        {"$sort": {"score": -1, "user_id": 1}}
+    ]
+    
+    results = await db['national_daily_best'].aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+    return results
+
+# Deepest page (offset + limit) merged from per-day tops - deeper pages rank the whole range
+MAX_RANGE_TOP_K = 1000
+# Per-day queries in flight at once across the worker, well below Motor's connection pool (100)
+_range_day_queries = asyncio.Semaphore(8)
+
+async def _top_national_by_range(db, start_bucket: str, end_bucket: str, top_k: int) -> List[dict]:
+    """
+    Top top_k users across a day range from each day's top top_k daily bests.
+    
+    Exact because a user's range score is their best daily score: anyone ranked
+    above them on that day is also ranked above them over the range.
+    """
+    
+    projection = {
+        "_id": "$user_id",
+        "username": 1,
+        "user_id": 1,
+        "id": "$entry_id",
+        "score": 1,
+        "created_at": 1,
+        "updated_at": 1
+    }
+    
+    async def daily_top(day_bucket: str) -> List[dict]:
+        async with _range_day_queries:
+            return await db['national_daily_best'].aggregate([
+                {"$match": {"day_bucket": day_bucket}},
+                {"$sort": {"score": -1, "user_id": 1}},
+                {"$limit": top_k},
+                {"$project": projection}
+            ]).to_list(length=top_k)
+    
+    daily_tops = await asyncio.gather(*[
+        daily_top(day_bucket) for day_bucket in get_range_day_buckets(start_bucket, end_bucket)
+    ])
+    
+    best_rows = {}
+    for rows in daily_tops:
+        for row in rows:
+            best_row = best_rows.get(row['user_id'])
+            if best_row is None or row['score'] > best_row['score']:
+                best_rows[row['user_id']] = row
+    
+    return sorted(best_rows.values(), key=lambda row: (-row['score'], row['user_id']))[:top_k]
+
+# School Leaderboard Functions
+async def create_or_update_school_entry(
+    req: Request,
+    school_id: str,
+    school_name: str,
+    user_score: int,
+    county: Optional[str] = None,
+    country: Optional[str] = None
+) -> SchoolLeaderboard:
+    """Add a user's score to the school's entry for today, its all-time totals and its region counters"""
+    
+    now = datetime.now(timezone.utc)
+    # School ids have been stored as both ObjectIds and strings - entries always use the string form
+    school_id = str(school_id)
+    
+    document = await _upsert_and_return(
+        req.app.mongodb['school_leaderboard'],
+        *_school_entry_upsert(school_id, get_day_bucket(now), user_score, 1, now, school_name=school_name, county=county)
+    )
+    school_entry = SchoolLeaderboard(**document)
+    
+    school_total = await increment_school_total(
+        req,
+        school_id=school_id,
+        school_name=school_name,
+        county=county,
+        score_increment=user_score,
+        user_count_increment=1
+    )
+    
+    await increment_region_totals(
+        req,
+        county=county,
+        country=country,
+        day_bucket=school_entry.day_bucket,
+        score_increment=user_score,
+        user_count_increment=1
+    )
+    
+    _record_school_entry_in_index(req.app, school_entry, school_total, user_score)
+    
+    return school_entry
+
+async def increment_school_total(
+    req: Request,
+    school_id: str,
+    score_increment: int,
+    user_count_increment: int = 0,
+    school_name: Optional[str] = None,
+    county: Optional[str] = None
+) -> SchoolTotal:
+    """Apply a change to a school's all-time rollup, creating it on the school's first score"""
+    
+    now = datetime.now(timezone.utc)
+    document = await _upsert_and_return(
+        req.app.mongodb['school_totals'],
+        *_school_total_upsert(school_id, score_increment, user_count_increment, now, school_name=school_name, county=county)
+    )
+    
+    return SchoolTotal(**document)
+
+def _increment_upsert(key: dict, score_increment: int, user_count_increment: int, now: datetime, fields: dict) -> tuple[dict, dict]:
+    """(filter, update) adding to a running total_score/user_count counter, creating it if needed"""
+    return (
+        key,
         {
-            "$replaceRoot": {
-                "newRoot": {
-                    "_id": "$_id",
-                    "max_score": "$top_score_doc.score",
-                    "username": "$top_score_doc.username",
-                    "user_id": "$top_score_doc.user_id",
-                    "id": "$top_score_doc.id",
-                    "created_at": "$top_score_doc.created_at",
-                    "updated_at": "$top_score_doc.updated_at"
-                }
+            '$inc': {
+                'total_score': score_increment,
+                'user_count': user_count_increment
+            },
+            '$set': {**fields, 'updated_at': now},
+            '$setOnInsert': {
+                '_id': str(ObjectId()),
+                'created_at': now
             }
-        },
-        # Sort by max_score in descending order
-        {"$sort": {"max_score": -1}},
+        }
+    )
+
+def _school_entry_upsert(
+    school_id: str,
+    day_bucket: str,
+    score_increment: int,
+    user_count_increment: int,
+    now: datetime,
+    school_name: Optional[str] = None,
+    county: Optional[str] = None
+) -> tuple[dict, dict]:
+    fields = {'school_name': school_name, 'county': county}
+    return _increment_upsert(
+        {'school_id': school_id, 'day_bucket': day_bucket},
+        score_increment,
+        user_count_increment,
+        now,
+        {field: value for field, value in fields.items() if value is not None}
+    )
+
+def _school_total_upsert(
+    school_id: str,
+    score_increment: int,
+    user_count_increment: int,
+    now: datetime,
+    school_name: Optional[str] = None,
+    county: Optional[str] = None
+) -> tuple[dict, dict]:
+    fields = {'school_name': school_name, 'county': county}
+    return _increment_upsert(
+        {'school_id': school_id},
+        score_increment,
+        user_count_increment,
+        now,
+        {field: value for field, value in fields.items() if value is not None}
+    )
+
+async def _load_school_all_time(db) -> List[dict]:
+    """Load all-time school leaderboard (read from the per-school totals rollup)"""
+    
+    pipeline = [
+        # Served by the (total_score, school_id) index - no grouping or lookups
+        {"$sort": {"total_score": -1, "school_id": 1}},
         # Reshape the output
         {
             "$project": {
-                "_id": {"$toString": "$_id"},
-                "username": 1,
-                "user_id": 1,
-                "id": 1,
-                "score": "$max_score",
+                "_id": "$school_id",
+                "school_id": 1,
+                "school_name": 1,
+                "county": 1,
+                "id": "$_id",
+                "total_score": 1,
+                "user_count": 1,
                 "created_at": 1,
                 "updated_at": 1
             }
         }
     ]
     
-    # Add limit if specified
-    if limit:
-        pipeline.insert(-1, {"$limit": limit})
-    
-    results = await req.app.mongodb['national_leaderboard'].aggregate(pipeline).to_list(length=None)
+    results = await db['school_totals'].aggregate(pipeline).to_list(length=None)
     return results
 
-# School Leaderboard Functions
-async def create_or_update_school_entry(req: Request, school_id: str, school_name: str, user_score: int) -> SchoolLeaderboard:
-    """Create a new school leaderboard entry for today or update existing one"""
-    
-    # Get start of today in UTC
-    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    tomorrow = today.replace(hour=23, minute=59, second=59, microsecond=999999)
-    
-    # Check if there's already an entry for this school today
-    existing_entry = await req.app.mongodb['school_leaderboard'].find_one({
-        'school_id': school_id,
-        'created_at': {
-            '$gte': today,
-            '$lte': tomorrow
-        }
-    })
-    
-    if existing_entry:
-        # Update existing entry
-        updated_entry = await _db_actions.updateDocument(
-            req=req,
-            collection_name='school_leaderboard',
-            BaseModel=SchoolLeaderboard,
-            document_id=existing_entry['_id'],
-            total_score=existing_entry['total_score'] + user_score,
-            user_count=existing_entry['user_count'] + 1
-        )
-        return updated_entry
-    else:
-        # Create new entry for today
-        entry = SchoolLeaderboard(
-            school_id=school_id,
-            school_name=school_name,
-            total_score=user_score,
-            user_count=1
-        )
-        
-        created_entry = await _db_actions.createDocument(
-            req=req,
-            collection_name='school_leaderboard',
-            BaseModel=SchoolLeaderboard,
-            new_document=entry
-        )
-        return created_entry
-
-async def get_school_all_time(req: Request, limit: Optional[int] = None) -> List[dict]:
-    """Get all-time school leaderboard (sum of all daily totals per school)"""
+async def _load_school_by_date(db, day_bucket: str) -> List[dict]:
+    """Load school leaderboard for a specific day bucket"""
     
     pipeline = [
-        # Sort by created_at to ensure consistent ordering for $first
-        {"$sort": {"created_at": 1}},
-        # Group by school_id and sum all daily totals
-        {
-            "$group": {
-                "_id": "$school_id",
-                "total_score": {"$sum": "$total_score"},
-                "total_user_count": {"$sum": "$user_count"},
-                "school_name": {"$first": "$school_name"},
-                "school_id": {"$first": "$school_id"},
-                "id": {"$first": "$_id"},  # This will be the first (oldest) document's ID
-                "created_at": {"$first": "$created_at"},
-                "updated_at": {"$first": "$updated_at"}
-            }
-        },
-        # Lookup school details to get county
-        {
-            "$lookup": {
-                "from": "schools",
-                "let": {"schoolIdStr": "$school_id"},
-                "pipeline": [
-                    {
-                        "$match": {
-                            "$expr": {
-                                "$or": [
-                                    {"$eq": ["$_id", {"$toObjectId": "$$schoolIdStr"}]},
-                                    {"$eq": [{"$toString": "$_id"}, "$$schoolIdStr"]}
-                                ]
-                            }
-                        }
-                    },
-                    {"$project": {"county": 1}}
-                ],
-                "as": "school_details"
-            }
-        },
-        # Add county field from lookup result
-        {
-            "$addFields": {
-                "county": {"$arrayElemAt": ["$school_details.county", 0]}
-            }
-        },
+        # One entry per school per day bucket (county is stored on the entry)
+        {"$match": {"day_bucket": day_bucket}},
         # Sort by total_score in descending order
-        {"$sort": {"total_score": -1}},
+        {"$sort": {"total_score": -1, "school_id": 1}},
         # Reshape the output
         {
             "$project": {
@@ -265,85 +573,144 @@ async def get_school_all_time(req: Request, limit: Optional[int] = None) -> List
                 "county": 1,
                 "id": 1,
                 "total_score": 1,
-                "user_count": "$total_user_count",
+                "user_count": 1,
                 "created_at": 1,
                 "updated_at": 1
             }
         }
     ]
     
-    # Add limit if specified
-    if limit:
-        pipeline.insert(-1, {"$limit": limit})
-    
-    results = await req.app.mongodb['school_leaderboard'].aggregate(pipeline).to_list(length=None)
-    
-    # Debug: Print first result to see what's happening
-    if results:
-        print("get_school_all_time - First result with county lookup:")
-        print(results[0])
-    
+    results = await db['school_leaderboard'].aggregate(pipeline).to_list(length=None)
     return results
 
-async def get_school_by_date(req: Request, date_str: str, limit: Optional[int] = None) -> List[dict]:
-    """Get school leaderboard for a specific date"""
+async def _load_school_by_range(db, start_bucket: str, end_bucket: str) -> List[dict]:
+    """Load school leaderboard for a day range by summing the daily school entries"""
     
-    # Parse the date string and create start/end of day
-    try:
-        target_date = parser.parse(date_str).replace(tzinfo=timezone.utc)
-        start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-    except (ValueError, TypeError):
-        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-    
-    # Use aggregation pipeline to include county information
     pipeline = [
-        # Filter by date range
+        # Served by the (day_bucket, total_score) index
+        {"$match": {"day_bucket": {"$gte": start_bucket, "$lte": end_bucket}}},
+        {"$sort": {"day_bucket": 1}},
         {
-            "$match": {
-                "created_at": {
-                    "$gte": start_of_day,
-                    "$lte": end_of_day
-                }
+            "$group": {
+                "_id": "$school_id",
+                "school_id": {"$first": "$school_id"},
+                "school_name": {"$last": "$school_name"},
+                "county": {"$last": "$county"},
+                "total_score": {"$sum": "$total_score"},
+                "user_count": {"$sum": "$user_count"},
+                "created_at": {"$first": "$created_at"},
+                "updated_at": {"$max": "$updated_at"}
             }
         },
-        # Lookup school details to get county
-        {
-            "$lookup": {
-                "from": "schools",
-                "let": {"schoolIdStr": "$school_id"},
-                "pipeline": [
+        {"$sort": {"total_score": -1, "school_id": 1}}
+    ]
+    
+    results = await db['school_leaderboard'].aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+    return results
+
+# Region Leaderboard Functions
+REGION_TYPES = ('county', 'country')
+
+def _get_region_keys(county: Optional[str], country: Optional[str]) -> List[tuple[str, str, str]]:
+    """(region_type, region_key, region) for each region a school's scores count towards"""
+    region_keys = []
+    if country:
+        region_keys.append(('country', country, country))
+        if county:
+            region_keys.append(('county', f"{country}/{county}", county))
+    return region_keys
+
+async def increment_region_totals(
+    req: Request,
+    county: Optional[str],
+    country: Optional[str],
+    day_bucket: str,
+    score_increment: int,
+    user_count_increment: int = 0
+) -> None:
+    """Apply a change to the county and country counters for a day bucket and all time (one bulk write)"""
+    
+    now = datetime.now(timezone.utc)
+    upserts = _region_total_upserts(county, country, day_bucket, score_increment, user_count_increment, now)
+    if not upserts:
+        return
+    
+    await _bulk_upsert_increments(req.app.mongodb['region_leaderboard'], upserts)
+    _record_region_increment_in_index(req.app, county, country, day_bucket, score_increment, user_count_increment, now)
+
+def _region_total_upserts(
+    county: Optional[str],
+    country: Optional[str],
+    day_bucket: str,
+    score_increment: int,
+    user_count_increment: int,
+    now: datetime
+) -> List[tuple[dict, dict]]:
+    """Counter upserts for every region and bucket (the day and all-time) a school's score counts towards"""
+    return [
+        _increment_upsert(
+            {
+                'region_type': region_type,
+                'region_key': region_key,
+                'day_bucket': bucket
+            },
+            score_increment,
+            user_count_increment,
+            now,
+            {'region': region, 'country': country}
+        )
+        for region_type, region_key, region in _get_region_keys(county, country)
+        for bucket in (day_bucket, ALL_TIME_SCOPE)
+    ]
+
+def _record_region_increment_in_index(
+    app,
+    county: Optional[str],
+    country: Optional[str],
+    day_bucket: str,
+    score_increment: int,
+    user_count_increment: int,
+    now: datetime
+) -> None:
+    """Write a region counter change through to the loaded region scopes"""
+    
+    region_keys = _get_region_keys(county, country)
+    for region_type, region_key, region in region_keys:
+        for bucket in (day_bucket, ALL_TIME_SCOPE):
+            leaderboard = app.leaderboard_index.peek(region_type, bucket)
+            if leaderboard is not None:
+                leaderboard.increment(
                     {
-                        "$match": {
-                            "$expr": {
-                                "$or": [
-                                    {"$eq": ["$_id", {"$toObjectId": "$$schoolIdStr"}]},
-                                    {"$eq": [{"$toString": "$_id"}, "$$schoolIdStr"]}
-                                ]
-                            }
-                        }
+                        "_id": region_key,
+                        "region_key": region_key,
+                        "region": region,
+                        "country": country,
+                        "total_score": score_increment,
+                        "user_count": user_count_increment,
+                        "created_at": now,
+                        "updated_at": now
                     },
-                    {"$project": {"county": 1}}
-                ],
-                "as": "school_details"
-            }
-        },
-        # Add county field from lookup result
-        {
-            "$addFields": {
-                "county": {"$arrayElemAt": ["$school_details.county", 0]}
-            }
-        },
-        # Sort by total_score in descending order
-        {"$sort": {"total_score": -1}},
+                    {"total_score": score_increment, "user_count": user_count_increment}
+                )
+    
+    for region_type in {region_type for region_type, _, _ in region_keys}:
+        notify_leaderboard_change(app, region_type, day_bucket)
+
+async def _load_region_leaderboard(db, region_type: str, day_bucket: str) -> List[dict]:
+    """Load the county or country leaderboard for a day bucket (or all time) from its counters"""
+    
+    pipeline = [
+        # Served by the (region_type, day_bucket, total_score, region_key) index
+        {"$match": {"region_type": region_type, "day_bucket": day_bucket}},
+        {"$sort": {"total_score": -1, "region_key": 1}},
         # Reshape the output
         {
             "$project": {
-                "_id": {"$toString": "$_id"},
-                "school_id": 1,
-                "school_name": 1,
-                "county": 1,
-                "id": 1,
+                "_id": "$region_key",
+                "region_key": 1,
+                "region": 1,
+                "country": 1,
+                "id": "$_id",
                 "total_score": 1,
                 "user_count": 1,
                 "created_at": 1,
@@ -352,18 +719,397 @@ async def get_school_by_date(req: Request, date_str: str, limit: Optional[int] =
         }
     ]
     
-    # Add limit if specified
-    if limit:
-        pipeline.append({"$limit": limit})
+    results = await db['region_leaderboard'].aggregate(pipeline).to_list(length=None)
+    return results
+
+# Ranked Leaderboard Index
+ALL_TIME_SCOPE = 'all-time'
+
+LEADERBOARD_RANK_FIELDS = {
+    'national': ('user_id', 'score'),
+    'school': ('school_id', 'total_score'),
+    'county': ('region_key', 'total_score'),
+    'country': ('region_key', 'total_score')
+}
+
+async def get_ranked_leaderboard(app, board: str, scope: str) -> RankedLeaderboard:
+    """Get the in-memory ranked view of a leaderboard scope, loading it from MongoDB if needed"""
+    
+    db = app.mongodb
+    if board == 'national' and '..' in scope:
+        loader = lambda: _load_national_by_range(db, *scope.split('..'))
+    elif board == 'national':
+        loader = (lambda: _load_national_all_time(db)) if scope == ALL_TIME_SCOPE \
+            else (lambda: _load_national_by_date(db, scope))
+    elif board == 'school' and '..' in scope:
+        loader = lambda: _load_school_by_range(db, *scope.split('..'))
+    elif board == 'school':
+        loader = (lambda: _load_school_all_time(db)) if scope == ALL_TIME_SCOPE \
+            else (lambda: _load_school_by_date(db, scope))
+    else:
+        loader = lambda: _load_region_leaderboard(db, board, scope)
     
-    results = await req.app.mongodb['school_leaderboard'].aggregate(pipeline).to_list(length=None)
+    id_field, score_field = LEADERBOARD_RANK_FIELDS[board]
+    return await app.leaderboard_index.get(
+        board, scope, id_field, score_field, loader,
+        revision=await get_cached_leaderboard_revision(app, board, scope)
+    )
+
+async def warm_leaderboard_index(app) -> None:
+    """Load the all-time and today's scopes of every leaderboard at startup"""
     
-    # Debug: Print first result to see what's happening
-    if results:
-        print("get_school_by_date - First result with county lookup:")
-        print(results[0])
+    today = get_day_bucket(datetime.now(timezone.utc))
+    for board in LEADERBOARD_RANK_FIELDS:
+        for scope in (ALL_TIME_SCOPE, today):
+            await get_ranked_leaderboard(app, board, scope)
+
+def _record_national_entry_in_index(app, entry: NationalLeaderboard) -> None:
+    """Write a new national entry through to the loaded national scopes"""
     
-    return results
+    row = {
+        "_id": entry.user_id,
+        "username": entry.username,
+        "user_id": entry.user_id,
+        "id": entry.id,
+        "score": entry.score,
+        "created_at": entry.created_at,
+        "updated_at": entry.updated_at
+    }
+    day_bucket = get_day_bucket(entry.created_at)
+    for scope in (ALL_TIME_SCOPE, day_bucket):
+        leaderboard = app.leaderboard_index.peek('national', scope)
+        if leaderboard is not None:
+            leaderboard.upsert_if_higher(row)
+    
+    # Range scopes rank each user's best day, so a new best is a plain max too
+    for scope, leaderboard in app.leaderboard_index.loaded('national'):
+        if range_scope_contains(scope, day_bucket):
+            leaderboard.upsert_if_higher(row)
+    
+    notify_leaderboard_change(app, 'national', day_bucket)
+
+def _school_total_row(school_total: SchoolTotal) -> dict:
+    return {
+        "_id": school_total.school_id,
+        "school_id": school_total.school_id,
+        "school_name": school_total.school_name,
+        "county": school_total.county,
+        "id": school_total.id,
+        "total_score": school_total.total_score,
+        "user_count": school_total.user_count,
+        "created_at": school_total.created_at,
+        "updated_at": school_total.updated_at
+    }
+
+def _record_school_entry_in_index(app, entry: SchoolLeaderboard, school_total: SchoolTotal, user_score: int) -> None:
+    """
+    Write an updated daily school entry and all-time total through to the loaded school scopes.
+    Applied as increments, with the written documents only filling in the other fields of
+    a school not yet ranked, so concurrent submissions finishing out of order can't put
+    back older totals.
+    """
+    
+    increments = {"total_score": user_score, "user_count": 1}
+    
+    day_leaderboard = app.leaderboard_index.peek('school', entry.day_bucket)
+    if day_leaderboard is not None:
+        day_leaderboard.increment({
+            "_id": entry.id,
+            "school_id": entry.school_id,
+            "school_name": entry.school_name,
+            "county": entry.county,
+            **increments,
+            "created_at": entry.created_at,
+            "updated_at": entry.updated_at
+        }, increments)
+    
+    all_time_leaderboard = app.leaderboard_index.peek('school', ALL_TIME_SCOPE)
+    if all_time_leaderboard is not None:
+        all_time_leaderboard.increment({**_school_total_row(school_total), **increments}, increments)
+    
+    # Range scopes sum the daily entries, so add this score onto them
+    for scope, leaderboard in app.leaderboard_index.loaded('school'):
+        if range_scope_contains(scope, entry.day_bucket):
+            leaderboard.increment(
+                {
+                    "_id": entry.school_id,
+                    "school_id": entry.school_id,
+                    "school_name": entry.school_name,
+                    "county": entry.county,
+                    "total_score": user_score,
+                    "user_count": 1,
+                    "created_at": entry.created_at,
+                    "updated_at": entry.updated_at
+                },
+                increments
+            )
+    
+    notify_leaderboard_change(app, 'school', entry.day_bucket)
+
+def _record_school_increment_in_index(
+    app,
+    school_id: str,
+    school_name: str,
+    county: Optional[str],
+    day_bucket: str,
+    score_increment: int,
+    user_count_increment: int,
+    entry_id: str,
+    total_id: str,
+    now: datetime
+) -> None:
+    """
+    Write a school score change through to the loaded school scopes without the
+    written documents - entry_id/total_id only seed schools not yet ranked
+    """
+    
+    row = {
+        "school_id": school_id,
+        "school_name": school_name,
+        "county": county,
+        "total_score": score_increment,
+        "user_count": user_count_increment,
+        "created_at": now,
+        "updated_at": now
+    }
+    increments = {"total_score": score_increment, "user_count": user_count_increment}
+    
+    day_leaderboard = app.leaderboard_index.peek('school', day_bucket)
+    if day_leaderboard is not None:
+        day_leaderboard.increment({**row, "_id": entry_id}, increments)
+    
+    all_time_leaderboard = app.leaderboard_index.peek('school', ALL_TIME_SCOPE)
+    if all_time_leaderboard is not None:
+        all_time_leaderboard.increment({**row, "_id": school_id, "id": total_id}, increments)
+    
+    for scope, leaderboard in app.leaderboard_index.loaded('school'):
+        if range_scope_contains(scope, day_bucket):
+            leaderboard.increment({**row, "_id": school_id}, increments)
+    
+    notify_leaderboard_change(app, 'school', day_bucket)
+
+# Leaderboard Change Notification
+def notify_leaderboard_change(app, board: str, day_bucket: Optional[str] = None) -> None:
+    """
+    Invalidate cached pages and wake stream subscribers for the scopes a write
+    to day_bucket can change (every scope of the board if None)
+    """
+    
+    cache = app.leaderboard_cache
+    broadcaster = app.leaderboard_broadcaster
+    if day_bucket is None:
+        cache.bump(board)
+        broadcaster.mark_dirty(board)
+        return
+    
+    def affected_scopes(scopes: List[str]) -> List[str]:
+        return [ALL_TIME_SCOPE, day_bucket] + [scope for scope in scopes if range_scope_contains(scope, day_bucket)]
+    
+    cache.bump(board, affected_scopes(cache.scopes(board)))
+    broadcaster.mark_dirty(board, affected_scopes(broadcaster.scopes(board)))
+
+# Leaderboard Revisions
+def _revision_id_range(board: str, scope: str) -> dict:
+    """_id range of the day counters a scope is made of - every day of the board for all time"""
+    if scope == ALL_TIME_SCOPE:
+        # ';' sorts straight after ':', so this is every "board:<day>" id
+        return {'$gte': f"{board}:", '$lt': f"{board};"}
+    start_bucket, _, end_bucket = scope.partition('..')
+    return {'$gte': f"{board}:{start_bucket}", '$lte': f"{board}:{end_bucket or start_bucket}"}
+
+async def get_leaderboard_revision(app, board: str, scope: str) -> int:
+    """
+    Revision of a leaderboard scope - the sum of the write counters of its day buckets,
+    so it goes up whenever any write that can change the scope is recorded
+    """
+    revision = await app.mongodb['leaderboard_revisions'].aggregate([
+        {"$match": {"_id": _revision_id_range(board, scope)}},
+        {"$group": {"_id": None, "revision": {"$sum": "$revision"}}}
+    ]).to_list(length=1)
+    return revision[0]['revision'] if revision else 0
+
+async def get_cached_leaderboard_revision(app, board: str, scope: str) -> int:
+    """get_leaderboard_revision through the worker's response cache (kept for its TTL)"""
+    cache = app.leaderboard_cache
+    revision = cache.get_revision(board, scope)
+    if revision is None:
+        revision = await get_leaderboard_revision(app, board, scope)
+        cache.put_revision(board, scope, revision)
+    return revision
+
+def get_school_revision_changes(day_bucket: str, county: Optional[str], country: Optional[str]) -> List[tuple[str, str]]:
+    """(board, day bucket) of every board a school score on day_bucket changes"""
+    region_types = {region_type for region_type, _, _ in _get_region_keys(county, country)}
+    return [('school', day_bucket)] + [(region_type, day_bucket) for region_type in sorted(region_types)]
+
+async def bump_leaderboard_revisions(app, changes: Iterable[tuple[str, str]]) -> None:
+    """
+    Record a request's writes for every worker, once all of them are done: one counter
+    per (board, day bucket) changed, all bumped in a single bulk write
+    """
+    changes = set(changes)
+    if not changes:
+        return
+    now = datetime.now(timezone.utc)
+    await app.mongodb['leaderboard_revisions'].bulk_write(
+        [
+            UpdateOne(
+                {'_id': f"{board}:{day_bucket}"},
+                {'$inc': {'revision': 1}, '$set': {'updated_at': now}},
+                upsert=True
+            )
+            for board, day_bucket in sorted(changes)
+        ],
+        ordered=False
+    )
+    
+    # This worker sees its own writes straight away: its loaded scopes already hold
+    # them, so they count the bump too (another worker's write leaves them behind)
+    cache = app.leaderboard_cache
+    for board, day_bucket in changes:
+        cache.drop_revisions(board, [
+            scope for scope in cache.revision_scopes(board)
+            if _scope_includes_day(scope, day_bucket)
+        ])
+        for scope, leaderboard in app.leaderboard_index.loaded(board):
+            if _scope_includes_day(scope, day_bucket):
+                leaderboard.revision += 1
+
+def _scope_includes_day(scope: str, day_bucket: str) -> bool:
+    return scope in (ALL_TIME_SCOPE, day_bucket) or range_scope_contains(scope, day_bucket)
+
+# Leaderboard Cursors
+def encode_leaderboard_cursor(board: str, row: dict) -> str:
+    """Opaque keyset cursor for the position just after row"""
+    id_field, score_field = LEADERBOARD_RANK_FIELDS[board]
+    raw_cursor = json.dumps([row[score_field], row[id_field]], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw_cursor.encode()).decode()
+
+def decode_leaderboard_cursor(cursor: str) -> tuple[int, str]:
+    """(score, member_id) position encoded in a cursor from encode_leaderboard_cursor"""
+    try:
+        score, member_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(score, int) or not isinstance(member_id, str):
+            raise ValueError
+        return score, member_id
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid leaderboard cursor")
+
+def get_next_leaderboard_cursor(board: str, rows: List[dict], limit: Optional[int]) -> Optional[str]:
+    """Cursor for the following page, or None when this page was the last one"""
+    if not limit or len(rows) < limit:
+        return None
+    return encode_leaderboard_cursor(board, rows[-1])
+
+def _read_leaderboard_page(leaderboard: RankedLeaderboard, limit: Optional[int], offset: int, cursor: Optional[str]) -> List[dict]:
+    if cursor:
+        score, member_id = decode_leaderboard_cursor(cursor)
+        return leaderboard.page_after(score, member_id, limit, offset)
+    return leaderboard.top(limit, offset)
+
+# Leaderboard Reads
+async def get_national_all_time(req: Request, limit: Optional[int] = None, offset: int = 0, cursor: Optional[str] = None) -> List[dict]:
+    """Get highest score per user for all time"""
+    leaderboard = await get_ranked_leaderboard(req.app, 'national', ALL_TIME_SCOPE)
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_national_by_date(req: Request, date_str: str, limit: Optional[int] = None, offset: int = 0, cursor: Optional[str] = None) -> List[dict]:
+    """Get highest score per user for a specific date"""
+    leaderboard = await get_ranked_leaderboard(req.app, 'national', parse_day_bucket(date_str))
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_school_all_time(req: Request, limit: Optional[int] = None, offset: int = 0, cursor: Optional[str] = None) -> List[dict]:
+    """Get all-time school leaderboard (sum of all daily totals per school)"""
+    leaderboard = await get_ranked_leaderboard(req.app, 'school', ALL_TIME_SCOPE)
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_school_by_date(req: Request, date_str: str, limit: Optional[int] = None, offset: int = 0, cursor: Optional[str] = None) -> List[dict]:
+    """Get school leaderboard for a specific date"""
+    leaderboard = await get_ranked_leaderboard(req.app, 'school', parse_day_bucket(date_str))
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_region_leaderboard(
+    req: Request,
+    region_type: str,
+    date_str: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> List[dict]:
+    """Get the county or country leaderboard, all-time or for a specific date"""
+    scope = parse_day_bucket(date_str) if date_str else ALL_TIME_SCOPE
+    leaderboard = await get_ranked_leaderboard(req.app, region_type, scope)
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_national_by_range(
+    req: Request,
+    start_bucket: str,
+    end_bucket: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> List[dict]:
+    """Get highest score per user across an inclusive day range (week, month or custom)"""
+    scope = get_range_scope(start_bucket, end_bucket)
+    
+    # A shallow top-N page is merged from each day's top N unless the whole range is already ranked
+    if (
+        limit is not None
+        and offset + limit <= MAX_RANGE_TOP_K
+        and not cursor
+        and req.app.leaderboard_index.peek('national', scope) is None
+    ):
+        rows = await _top_national_by_range(req.app.mongodb, start_bucket, end_bucket, offset + limit)
+        return rows[offset:]
+    
+    leaderboard = await get_ranked_leaderboard(req.app, 'national', scope)
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+async def get_school_by_range(
+    req: Request,
+    start_bucket: str,
+    end_bucket: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    cursor: Optional[str] = None
+) -> List[dict]:
+    """Get school leaderboard summed across an inclusive day range (week, month or custom)"""
+    leaderboard = await get_ranked_leaderboard(req.app, 'school', get_range_scope(start_bucket, end_bucket))
+    return _read_leaderboard_page(leaderboard, limit, offset, cursor)
+
+# Leaderboard Positions
+async def _get_leaderboard_position(req: Request, board: str, scope: str, member_id: str, window: int) -> dict:
+    """Rank of one member plus the window entries ranked either side of them"""
+    
+    leaderboard = await get_ranked_leaderboard(req.app, board, scope)
+    rank = leaderboard.rank_of(member_id)
+    
+    position = {
+        "rank": rank,
+        "total_entries": len(leaderboard),
+        "entry": leaderboard.get(member_id),
+        "entries": []
+    }
+    
+    if rank is not None and window:
+        start = max(rank - 1 - window, 0)
+        rows = leaderboard.top(rank + window - start, start)
+        position["entries"] = [
+            {**row, "rank": start + position_in_window + 1}
+            for position_in_window, row in enumerate(rows)
+        ]
+    
+    return position
+
+async def get_national_position(req: Request, user_id: str, date_str: Optional[str] = None, window: int = 0) -> dict:
+    """Get a user's national rank (all-time, or for a specific date) and optionally their neighbours"""
+    scope = parse_day_bucket(date_str) if date_str else ALL_TIME_SCOPE
+    return await _get_leaderboard_position(req, 'national', scope, user_id, window)
+
+async def get_school_position(req: Request, school_id: str, date_str: Optional[str] = None, window: int = 0) -> dict:
+    """Get a school's rank (all-time, or for a specific date) and optionally its neighbours"""
+    scope = parse_day_bucket(date_str) if date_str else ALL_TIME_SCOPE
+    return await _get_leaderboard_position(req, 'school', scope, school_id, window)
 
 # Combined Score Processing Function
 async def process_quiz_score(req: Request, score_submission: ScoreSubmission) -> dict:
@@ -375,6 +1121,7 @@ async def process_quiz_score(req: Request, score_submission: ScoreSubmission) ->
         "success": True,
         "errors": []
     }
+    revision_changes = []
     
     try:
         # Always create national leaderboard entry
@@ -385,44 +1132,33 @@ async def process_quiz_score(req: Request, score_submission: ScoreSubmission) ->
             score=score_submission.score
         )
         result["national_entry"] = national_entry
+        revision_changes.append(('national', get_day_bucket(national_entry.created_at)))
 
-        # Check if user has a school by fetching their user document
-        from models.users.users import User
-        user = await _db_actions.getDocument(
-            req=req,
-            collection_name="users",
-            BaseModel=User,
-            id=score_submission.user_id
-        )
+        # Check if user has a school (cached user -> school_id lookup)
+        document_school_id = await get_user_school_id(req, score_submission.user_id)
         
         print("--------------------------------")
         print("Score submission school id:", score_submission.school_id)
-        print("User school id from document:", user.school_id if user else None)
+        print("User school id from document:", document_school_id)
         
         # Use school_id from user document if available
-        user_school_id = None
-        if user and user.school_id:
-            user_school_id = user.school_id
-        elif score_submission.school_id:
-            user_school_id = score_submission.school_id
+        user_school_id = document_school_id or score_submission.school_id
             
         if user_school_id:
-            # Get school name from schools collection
-            school = await _db_actions.getDocument(
-                req=req,
-                collection_name="schools",
-                BaseModel=School,
-                id=user_school_id
-            )
+            # Get school name, county and country (cached school lookup)
+            school = await get_school_summary(req, user_school_id)
             
             if school:
                 school_entry = await create_or_update_school_entry(
                     req=req,
                     school_id=user_school_id,
                     school_name=school.school_name,
-                    user_score=score_submission.score
+                    user_score=score_submission.score,
+                    county=school.county,
+                    country=school.country
                 )
                 result["school_entry"] = school_entry
+                revision_changes += get_school_revision_changes(school_entry.day_bucket, school.county, school.country)
                 print("Created/updated school entry for:", school.school_name)
             else:
                 result["errors"].append(f"School with ID {user_school_id} not found")
@@ -433,9 +1169,166 @@ async def process_quiz_score(req: Request, score_submission: ScoreSubmission) ->
     except Exception as e:
         result["success"] = False
         result["errors"].append(str(e))
+    finally:
+        # Once per submission, covering whatever was written before any failure
+        await bump_leaderboard_revisions(req.app, revision_changes)
     
     return result
 
+async def ingest_score_batch(app, submissions: List[ScoreSubmission], now: Optional[datetime] = None) -> None:
+    """
+    Write-behind equivalent of process_quiz_score for a batch of submissions:
+    one insert_many for the national entries, then one bulk write per
+    projection/rollup with the school and region increments coalesced.
+    
+    Idempotent for the same submissions and now, so a batch that failed part
+    way through can be retried: national entries reuse the submission ids,
+    best scores only ever rise, and every counter upsert that went through is
+    recorded on the batch's score_ingestion_batches record (kept for a week,
+    keyed by the first submission's id) and skipped on retry. A retry also
+    drops the affected in-memory school and region scopes instead of applying
+    the increments to them again. Only an upsert whose outcome is unknown (the
+    connection dropped mid-write) can still count twice.
+    """
+    
+    if not submissions:
+        return
+    
+    db = app.mongodb
+    now = now or datetime.now(timezone.utc)
+    day_bucket = get_day_bucket(now)
+    batch_id = submissions[0].id
+    
+    entries = [
+        NationalLeaderboard(
+            _id=submission.id,
+            user_id=submission.user_id,
+            username=submission.username,
+            score=submission.score,
+            created_at=now,
+            updated_at=now
+        )
+        for submission in submissions
+    ]
+    try:
+        await db['national_leaderboard'].insert_many(
+            [entry.model_dump(by_alias=True, exclude_none=True) for entry in entries],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        # Duplicate ids are entries an earlier attempt at this batch already inserted
+        if any(error['code'] != 11000 for error in e.details.get('writeErrors', [])):
+            raise
+    
+    # Only each user's best entry in the batch can move their best scores
+    best_entries = {}
+    for entry in entries:
+        if entry.user_id not in best_entries or entry.score > best_entries[entry.user_id].score:
+            best_entries[entry.user_id] = entry
+    await _bulk_upsert_if_higher(
+        db['national_best_scores'],
+        [_best_score_upsert(entry, {'user_id': entry.user_id}) for entry in best_entries.values()]
+    )
+    await _bulk_upsert_if_higher(
+        db['national_daily_best'],
+        [_best_score_upsert(entry, {'user_id': entry.user_id, 'day_bucket': day_bucket}) for entry in best_entries.values()]
+    )
+    for entry in best_entries.values():
+        _record_national_entry_in_index(app, entry)
+    
+    # The user document's school wins over the one submitted, as in process_quiz_score
+    user_school_ids = await get_user_school_ids(app, best_entries)
+    
+    school_scores = {}
+    for submission in submissions:
+        school_id = user_school_ids.get(submission.user_id) or submission.school_id
+        if school_id:
+            score_sum, user_count = school_scores.get(str(school_id), (0, 0))
+            school_scores[str(school_id)] = (score_sum + submission.score, user_count + 1)
+    if not school_scores:
+        await bump_leaderboard_revisions(app, [('national', day_bucket)])
+        return
+    
+    schools_by_id = await get_school_summaries(app, school_scores)
+    missing_school_ids = sorted(set(school_scores) - set(schools_by_id))
+    
+    # Created by the first attempt - an existing record means this batch is being retried
+    batch_record = await db['score_ingestion_batches'].find_one_and_update(
+        {'_id': batch_id},
+        {
+            '$set': {'missing_school_ids': missing_school_ids, 'updated_at': now},
+            '$setOnInsert': {'applied': [], 'created_at': now}
+        },
+        upsert=True,
+        return_document=ReturnDocument.BEFORE
+    )
+    retrying = batch_record is not None
+    applied = set(batch_record['applied']) if retrying else set()
+    
+    entry_upserts = []
+    total_upserts = []
+    region_scores = {}
+    for school_id, (score_sum, user_count) in school_scores.items():
+        school = schools_by_id.get(school_id)
+        if not school:
+            # Recorded on the batch record as missing_school_ids
+            continue
+        entry_upserts.append(_school_entry_upsert(
+            school_id, day_bucket, score_sum, user_count, now,
+            school_name=school.school_name, county=school.county
+        ))
+        total_upserts.append(_school_total_upsert(
+            school_id, score_sum, user_count, now,
+            school_name=school.school_name, county=school.county
+        ))
+        region = (school.county, school.country)
+        region_score_sum, region_user_count = region_scores.get(region, (0, 0))
+        region_scores[region] = (region_score_sum + score_sum, region_user_count + user_count)
+    
+    region_upserts = [
+        upsert
+        for (county, country), (score_sum, user_count) in region_scores.items()
+        for upsert in _region_total_upserts(county, country, day_bucket, score_sum, user_count, now)
+    ]
+    
+    await _apply_batch_increments(db, batch_id, 'school_leaderboard', entry_upserts, applied)
+    await _apply_batch_increments(db, batch_id, 'school_totals', total_upserts, applied)
+    await _apply_batch_increments(db, batch_id, 'region_leaderboard', region_upserts, applied)
+    
+    revision_changes = [('national', day_bucket)]
+    for county, country in region_scores:
+        revision_changes += get_school_revision_changes(day_bucket, county, country)
+    
+    if retrying:
+        # An earlier attempt may have written some of these through already - reload instead
+        for board in {board for board, _ in revision_changes if board != 'national'}:
+            for scope, _ in app.leaderboard_index.loaded(board):
+                if _scope_includes_day(scope, day_bucket):
+                    app.leaderboard_index.invalidate(board, scope)
+            notify_leaderboard_change(app, board, day_bucket)
+        await bump_leaderboard_revisions(app, revision_changes)
+        return
+    
+    for (key, update), (_, total_update) in zip(entry_upserts, total_upserts):
+        school_id = key['school_id']
+        school = schools_by_id[school_id]
+        _record_school_increment_in_index(
+            app,
+            school_id=school_id,
+            school_name=school.school_name,
+            county=school.county,
+            day_bucket=day_bucket,
+            score_increment=update['$inc']['total_score'],
+            user_count_increment=update['$inc']['user_count'],
+            entry_id=update['$setOnInsert']['_id'],
+            total_id=total_update['$setOnInsert']['_id'],
+            now=now
+        )
+    for (county, country), (score_sum, user_count) in region_scores.items():
+        _record_region_increment_in_index(app, county, country, day_bucket, score_sum, user_count, now)
+    
+    await bump_leaderboard_revisions(app, revision_changes)
+
 # Admin Functions
 async def add_bonus_points_to_entry(req: Request, entry_id: str, bonus_points: int, entry_type: str) -> dict:
     """Add bonus points to a leaderboard entry (admin only)"""
@@ -471,6 +1364,11 @@ async def add_bonus_points_to_entry(req: Request, entry_id: str, bonus_points: i
                 score=new_score,
                 updated_at=datetime.now(timezone.utc)
             )
+            await rebuild_national_best_score(req, existing_entry.user_id)
+            await rebuild_national_daily_best(req, existing_entry.user_id, get_day_bucket(existing_entry.created_at))
+            req.app.leaderboard_index.invalidate('national')
+            notify_leaderboard_change(req.app, 'national')
+            await bump_leaderboard_revisions(req.app, [('national', get_day_bucket(existing_entry.created_at))])
             result["updated_entry"] = updated_entry
             
         elif entry_type == "school":
@@ -497,6 +1395,28 @@ async def add_bonus_points_to_entry(req: Request, entry_id: str, bonus_points: i
                 total_score=new_total_score,
                 updated_at=datetime.now(timezone.utc)
             )
+            await increment_school_total(
+                req,
+                school_id=existing_entry.school_id,
+                score_increment=bonus_points
+            )
+            school = await get_school_summary(req, existing_entry.school_id)
+            if school:
+                await increment_region_totals(
+                    req,
+                    county=school.county,
+                    country=school.country,
+                    day_bucket=existing_entry.day_bucket or get_day_bucket(existing_entry.created_at),
+                    score_increment=bonus_points
+                )
+            for board in ('school', *REGION_TYPES):
+                req.app.leaderboard_index.invalidate(board)
+                notify_leaderboard_change(req.app, board)
+            await bump_leaderboard_revisions(req.app, get_school_revision_changes(
+                existing_entry.day_bucket or get_day_bucket(existing_entry.created_at),
+                school.county if school else None,
+                school.country if school else None
+            ))
             result["updated_entry"] = updated_entry
             
         else:
@@ -546,6 +1466,11 @@ async def delete_leaderboard_entry(req: Request, entry_id: str, entry_type: str)
                 BaseModel=NationalLeaderboard,
                 id=entry_id
             )
+            await rebuild_national_best_score(req, existing_entry.user_id)
+            await rebuild_national_daily_best(req, existing_entry.user_id, get_day_bucket(existing_entry.created_at))
+            req.app.leaderboard_index.invalidate('national')
+            notify_leaderboard_change(req.app, 'national')
+            await bump_leaderboard_revisions(req.app, [('national', get_day_bucket(existing_entry.created_at))])
             
         elif entry_type == "school":
             # Check if entry exists
@@ -569,6 +1494,30 @@ async def delete_leaderboard_entry(req: Request, entry_id: str, entry_type: str)
                 BaseModel=SchoolLeaderboard,
                 id=entry_id
             )
+            await increment_school_total(
+                req,
+                school_id=existing_entry.school_id,
+                score_increment=-existing_entry.total_score,
+                user_count_increment=-existing_entry.user_count
+            )
+            school = await get_school_summary(req, existing_entry.school_id)
+            if school:
+                await increment_region_totals(
+                    req,
+                    county=school.county,
+                    country=school.country,
+                    day_bucket=existing_entry.day_bucket or get_day_bucket(existing_entry.created_at),
+                    score_increment=-existing_entry.total_score,
+                    user_count_increment=-existing_entry.user_count
+                )
+            for board in ('school', *REGION_TYPES):
+                req.app.leaderboard_index.invalidate(board)
+                notify_leaderboard_change(req.app, board)
+            await bump_leaderboard_revisions(req.app, get_school_revision_changes(
+                existing_entry.day_bucket or get_day_bucket(existing_entry.created_at),
+                school.county if school else None,
+                school.country if school else None
+            ))
             
         else:
             result["success"] = False
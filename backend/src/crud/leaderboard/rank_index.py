@@ -0,0 +1,165 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional
+
+from sortedcontainers import SortedList
+
+
+class RankedLeaderboard:
+    """
+    Order-statistics view of a single leaderboard scope.
+
+    Rows are kept in a SortedList keyed by (-score, member_id) so top-N,
+    page-at-offset and rank lookups are O(log n) without touching MongoDB.
+    """
+
+    def __init__(self, id_field: str, score_field: str, rows: Optional[List[dict]] = None):
+        self.id_field = id_field
+        self.score_field = score_field
+        self.loaded_at = time.monotonic()
+        # Database revision of the scope the rows are known to include (set by the loading
+        # index, and advanced by this worker's own writes)
+        self.revision = 0
+        self._keys = SortedList()
+        self._rows: dict[str, dict] = {}
+
+        for row in rows or []:
+            self.upsert(row)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, row: dict) -> tuple:
+        return (-row[self.score_field], row[self.id_field])
+
+    def get(self, member_id: str) -> Optional[dict]:
+        return self._rows.get(member_id)
+
+    def upsert(self, row: dict) -> None:
+        """Insert or replace a member's row"""
+        member_id = row[self.id_field]
+        existing_row = self._rows.get(member_id)
+        if existing_row is not None:
+            self._keys.remove(self._key(existing_row))
+        self._rows[member_id] = row
+        self._keys.add(self._key(row))
+
+    def upsert_if_higher(self, row: dict) -> bool:
+        """Replace a member's row only when the new score beats the stored one"""
+        existing_row = self._rows.get(row[self.id_field])
+        if existing_row is not None and existing_row[self.score_field] >= row[self.score_field]:
+            return False
+        self.upsert(row)
+        return True
+
+    def increment(self, row: dict, increments: dict) -> dict:
+        """Add increments onto a member's row, seeding it with row if it is not ranked yet"""
+        existing_row = self._rows.get(row[self.id_field])
+        if existing_row is None:
+            updated_row = dict(row)
+        else:
+            updated_row = dict(existing_row)
+            for field, amount in increments.items():
+                updated_row[field] = existing_row.get(field, 0) + amount
+        self.upsert(updated_row)
+        return updated_row
+
+    def remove(self, member_id: str) -> None:
+        existing_row = self._rows.pop(member_id, None)
+        if existing_row is not None:
+            self._keys.remove(self._key(existing_row))
+
+    def top(self, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        """Rows ranked from offset, limit of None meaning the rest of the board"""
+        stop = None if limit is None else offset + limit
+        return [self._rows[key[1]] for key in self._keys.islice(offset, stop)]
+
+    def page_after(self, score: int, member_id: str, limit: Optional[int] = None, offset: int = 0) -> List[dict]:
+        """Rows ranked strictly after the (score, member_id) position - keyset pagination"""
+        start = self._keys.bisect_right((-score, member_id))
+        return self.top(limit, start + offset)
+
+    def rank_of(self, member_id: str) -> Optional[int]:
+        """1-based rank of a member, or None if they are not on the board"""
+        row = self._rows.get(member_id)
+        if row is None:
+            return None
+        return self._keys.index(self._key(row)) + 1
+
+
+class LeaderboardRankIndex:
+    """
+    Per-worker registry of RankedLeaderboard scopes (e.g. ('national', 'all-time'),
+    ('school', '2025-06-01')).
+
+    Scopes are loaded lazily from MongoDB and kept up to date by the score
+    submission path. Writes from other workers show up through the scope's
+    revision: a scope is reloaded once the caller's current revision is ahead of
+    the one it was loaded at (or advanced to by this worker's own writes), and
+    in any case after ttl_seconds. Least recently used scopes are evicted
+    beyond max_scopes.
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_scopes: int = 32):
+        self.ttl_seconds = ttl_seconds
+        self.max_scopes = max_scopes
+        self._scopes: OrderedDict[tuple[str, str], RankedLeaderboard] = OrderedDict()
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    def _is_fresh(self, leaderboard: RankedLeaderboard, revision: int) -> bool:
+        return leaderboard.revision >= revision and time.monotonic() - leaderboard.loaded_at < self.ttl_seconds
+
+    async def get(
+        self,
+        board: str,
+        scope: str,
+        id_field: str,
+        score_field: str,
+        loader: Callable[[], Awaitable[List[dict]]],
+        revision: int = 0
+    ) -> RankedLeaderboard:
+        """
+        Return a fresh scope, loading it with loader on a miss or once it is stale.
+        revision is the scope's current database revision, read before calling, so
+        rows loaded now include every write counted in it.
+        """
+        scope_key = (board, scope)
+
+        leaderboard = self._scopes.get(scope_key)
+        if leaderboard is not None and self._is_fresh(leaderboard, revision):
+            self._scopes.move_to_end(scope_key)
+            return leaderboard
+
+        # One load per scope at a time - concurrent readers wait for it
+        lock = self._locks.setdefault(scope_key, asyncio.Lock())
+        async with lock:
+            leaderboard = self._scopes.get(scope_key)
+            if leaderboard is None or not self._is_fresh(leaderboard, revision):
+                rows = await loader()
+                leaderboard = RankedLeaderboard(id_field, score_field, rows)
+                leaderboard.revision = revision
+                self._scopes[scope_key] = leaderboard
+
+            self._scopes.move_to_end(scope_key)
+            while len(self._scopes) > self.max_scopes:
+                evicted_key, _ = self._scopes.popitem(last=False)
+                self._locks.pop(evicted_key, None)
+
+        return leaderboard
+
+    def peek(self, board: str, scope: str) -> Optional[RankedLeaderboard]:
+        """Return a scope only if it is already loaded (used for write-through updates)"""
+        return self._scopes.get((board, scope))
+
+    def loaded(self, board: str) -> List[tuple[str, RankedLeaderboard]]:
+        """(scope, leaderboard) for every loaded scope of a board"""
+        return [(key[1], leaderboard) for key, leaderboard in self._scopes.items() if key[0] == board]
+
+    def invalidate(self, board: str, scope: Optional[str] = None) -> None:
+        """Drop one scope, or every scope of a board, so the next read reloads it"""
+        if scope is not None:
+            self._scopes.pop((board, scope), None)
+            return
+        for scope_key in [key for key in self._scopes if key[0] == board]:
+            self._scopes.pop(scope_key, None)
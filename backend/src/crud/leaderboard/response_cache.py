@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from cachetools import TTLCache
+
+
+@dataclass(frozen=True)
+class CachedLeaderboardPage:
+    """A leaderboard page already serialized to JSON bytes, plus its ETag and next-page cursor"""
+    body: bytes
+    etag: str
+    next_cursor: Optional[str] = None
+
+
+class LeaderboardResponseCache:
+    """
+    Per-worker cache of serialized leaderboard pages keyed by
+    (board, scope, request params).
+
+    Every key also carries the board's and the scope's version counter, so
+    bumping a version on write makes the old pages unreachable at once (a read
+    that started before the bump stores its page under the old version, where it
+    is never served). Entries expire after ttl_seconds so writes made by other
+    workers show up.
+
+    Scope revisions (see get_leaderboard_revision) are kept for the same TTL, so
+    cache hits and conditional requests don't have to read them from MongoDB.
+    """
+
+    def __init__(self, ttl_seconds: float = 5, max_entries: int = 1024):
+        self._pages: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._revisions: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._board_versions: dict[str, int] = {}
+        self._scope_versions: dict[tuple[str, str], int] = {}
+
+    def version(self, board: str, scope: str) -> tuple[int, int]:
+        """Current (board, scope) version pair - take it before computing a page"""
+        return self._board_versions.get(board, 0), self._scope_versions.get((board, scope), 0)
+
+    def get(self, board: str, scope: str, params: tuple) -> Optional[CachedLeaderboardPage]:
+        return self._pages.get((board, scope, self.version(board, scope), params))
+
+    def put(
+        self,
+        board: str,
+        scope: str,
+        params: tuple,
+        page: CachedLeaderboardPage,
+        version: Optional[tuple[int, int]] = None
+    ) -> CachedLeaderboardPage:
+        """Store a page under the version it was computed at (defaults to the current one)"""
+        if version is None:
+            version = self.version(board, scope)
+        self._pages[(board, scope, version, params)] = page
+        return page
+
+    def scopes(self, board: str) -> List[str]:
+        """Scopes of a board that currently have cached pages"""
+        return list({key[1] for key in list(self._pages.keys()) if key[0] == board})
+
+    def bump(self, board: str, scopes: Optional[Iterable[str]] = None) -> None:
+        """Invalidate the given scopes of a board, or every scope when scopes is None"""
+        if scopes is None:
+            self._board_versions[board] = self._board_versions.get(board, 0) + 1
+            return
+        for scope in scopes:
+            scope_key = (board, scope)
+            self._scope_versions[scope_key] = self._scope_versions.get(scope_key, 0) + 1
+
+    def get_revision(self, board: str, scope: str) -> Optional[int]:
+        return self._revisions.get((board, scope))
+
+    def put_revision(self, board: str, scope: str, revision: int) -> None:
+        self._revisions[(board, scope)] = revision
+
+    def revision_scopes(self, board: str) -> List[str]:
+        """Scopes of a board that currently have a cached revision"""
+        return [key[1] for key in list(self._revisions.keys()) if key[0] == board]
+
+    def drop_revisions(self, board: str, scopes: Iterable[str]) -> None:
+        for scope in scopes:
+            self._revisions.pop((board, scope), None)
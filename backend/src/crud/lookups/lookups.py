@@ -0,0 +1,98 @@
+from fastapi import Request
+from typing import Iterable, NamedTuple, Optional
+
+from bson import ObjectId
+from cachetools import TTLCache
+
+# Cached in place of a missing school_id so users without a school are not re-read
+_NO_SCHOOL = ''
+
+
+class SchoolSummary(NamedTuple):
+    """The school fields the leaderboard write path denormalizes onto its entries"""
+    school_name: str
+    county: Optional[str]
+    country: Optional[str]
+
+
+class LookupCache:
+    """
+    Per-worker bounded LRU caches with TTL for hot id lookups on the score path:
+    user_id -> school_id and school_id -> SchoolSummary.
+
+    Entries are dropped by the user/school write paths and otherwise expire
+    after ttl_seconds, which bounds staleness from writes on other workers.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300):
+        self.user_school_ids: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self.schools: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+
+
+async def get_user_school_id(req: Request, user_id: str) -> Optional[str]:
+    """School id of a user, or None if they have no school (or do not exist)"""
+    cache = req.app.lookups.user_school_ids
+
+    school_id = cache.get(user_id)
+    if school_id is None:
+        user = await req.app.mongodb['users'].find_one({'_id': user_id}, projection={'school_id': 1})
+        if user is None:
+            return None
+        school_id = str(user['school_id']) if user.get('school_id') else _NO_SCHOOL
+        cache[user_id] = school_id
+
+    return school_id or None
+
+
+async def get_school_summary(req: Request, school_id: str) -> Optional[SchoolSummary]:
+    """Name, county and country of a school, or None if it does not exist"""
+    # Through the batch form so both stored id forms (string and ObjectId) are matched
+    school_id = str(school_id)
+    summaries = await get_school_summaries(req.app, [school_id])
+    return summaries.get(school_id)
+
+
+async def get_user_school_ids(app, user_ids: Iterable[str]) -> dict[str, Optional[str]]:
+    """Batch form of get_user_school_id - one $in query for the users not cached"""
+    cache = app.lookups.user_school_ids
+
+    school_ids = {user_id: cache.get(user_id) for user_id in set(user_ids)}
+    missing = [user_id for user_id, school_id in school_ids.items() if school_id is None]
+    if missing:
+        users = await app.mongodb['users'].find(
+            {'_id': {'$in': missing}},
+            projection={'school_id': 1}
+        ).to_list(length=None)
+        for user in users:
+            school_id = str(user['school_id']) if user.get('school_id') else _NO_SCHOOL
+            cache[user['_id']] = school_ids[user['_id']] = school_id
+
+    return {user_id: school_id or None for user_id, school_id in school_ids.items()}
+
+
+async def get_school_summaries(app, school_ids: Iterable[str]) -> dict[str, SchoolSummary]:
+    """Batch form of get_school_summary - one $in query for the schools not cached, missing schools omitted"""
+    cache = app.lookups.schools
+
+    summaries = {school_id: cache.get(school_id) for school_id in set(school_ids)}
+    missing = [school_id for school_id, summary in summaries.items() if summary is None]
+    if missing:
+        # School ids have been stored as both strings and ObjectIds - match either form
+        query_ids = missing + [ObjectId(school_id) for school_id in missing if ObjectId.is_valid(school_id)]
+        schools = await app.mongodb['schools'].find(
+            {'_id': {'$in': query_ids}},
+            projection={'school_name': 1, 'county': 1, 'country': 1}
+        ).to_list(length=None)
+        for school in schools:
+            summary = SchoolSummary(school['school_name'], school.get('county'), school.get('country'))
+            cache[str(school['_id'])] = summaries[str(school['_id'])] = summary
+
+    return {school_id: summary for school_id, summary in summaries.items() if summary is not None}
+
+
+def invalidate_user_lookup(req: Request, user_id: str) -> None:
+    req.app.lookups.user_school_ids.pop(user_id, None)
+
+
+def invalidate_school_lookup(req: Request, school_id: str) -> None:
+    req.app.lookups.schools.pop(school_id, None)
@@ -38,6 +38,22 @@ def _deserialize_question(document: dict):
 
 from crud._generic import _db_actions
 
+# Question Bank Revision
+async def get_question_bank_revision(req: Request) -> int:
+    """Revision counter of the question bank, bumped on every create, update and delete"""
+    revision = await req.app.mongodb['collection_revisions'].find_one({'_id': 'questions'})
+    return revision['revision'] if revision else 0
+
+async def _bump_question_bank_revision(req: Request) -> None:
+    await req.app.mongodb['collection_revisions'].update_one(
+        {'_id': 'questions'},
+        {
+            '$inc': {'revision': 1},
+            '$set': {'updated_at': datetime.now(timezone.utc)}
+        },
+        upsert=True
+    )
+
 async def create_question(req: Request, question_data: QuestionCreate) -> dict:
     """Create a single question based on its type"""
     
@@ -51,6 +67,7 @@ async def create_question(req: Request, question_data: QuestionCreate) -> dict:
         BaseModel=type(question),
         new_document=question
     )
+    await _bump_question_bank_revision(req)
     
     return created_question
 
@@ -133,6 +150,7 @@ async def update_question(req: Request, question_id: str, question_data: Questio
     
     if not updated_question:
         raise HTTPException(status_code=404, detail="Question not found")
+    await _bump_question_bank_revision(req)
     
     return updated_question
 
@@ -147,6 +165,7 @@ async def delete_question(req: Request, question_id: str) -> bool:
     
     if not deleted:
         raise HTTPException(status_code=404, detail="Question not found")
+    await _bump_question_bank_revision(req)
     
     return True
 
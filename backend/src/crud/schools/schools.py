@@ -1,12 +1,14 @@
 from fastapi import Request
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from models.schools.school import School
+from crud.lookups.lookups import invalidate_school_lookup
 from crud._generic._db_actions import (
     createDocument,
     createMultipleDocuments,
     getAllDocuments,
     getDocument,
     getMultipleDocuments,
+    iterDocuments,
     updateDocument,
     deleteDocument,
     countDocuments,
@@ -55,6 +57,25 @@ async def getAllSchools(
     )
 
 
+async def iterSchools(
+    req: Request,
+    order_by: Optional[str] = 'school_name',
+    order_direction: Optional[SortDirection] = SortDirection.ASCENDING,
+    limit: Optional[int] = 0,
+    **filter_kwargs
+) -> AsyncIterator[School]:
+    """Stream schools (optionally filtered, e.g. by county or country) without loading them all"""
+    return await iterDocuments(
+        req,
+        'schools',
+        School,
+        order_by=order_by,
+        order_direction=order_direction,
+        limit=limit,
+        **filter_kwargs
+    )
+
+
 async def getSchoolById(
     req: Request,
     school_id: str
@@ -120,25 +141,29 @@ async def updateSchool(
     school_id: str,
     **update_fields
 ) -> School | None:
-    return await updateDocument(
+    updated_school = await updateDocument(
         req,
         'schools',
         School,
         school_id,
         **update_fields
     )
+    invalidate_school_lookup(req, school_id)
+    return updated_school
 
 
 async def deleteSchool(
     req: Request,
     school_id: str
 ) -> School | None:
-    return await deleteDocument(
+    deleted_school = await deleteDocument(
         req,
         'schools',
         School,
         _id=school_id
     )
+    invalidate_school_lookup(req, school_id)
+    return deleted_school
 
 
 async def countSchools(
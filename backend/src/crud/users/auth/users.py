@@ -24,6 +24,7 @@ async def generate_username(req: Request, school_id: str = None) -> str:
                 req=req,
                 collection_name='schools',
                 BaseModel=School,
+                fields=['school_name'],
                 id=school_id
             )
             
@@ -128,6 +129,7 @@ async def check_if_username_is_taken(req:Request, username:str):
         req=req,
         collection_name='users',
         BaseModel=User,
+        fields=['id'],
         username=username
     )
     return user is not None
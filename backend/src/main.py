@@ -9,9 +9,31 @@ from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
 
 from routers.app._index import router as app_router
+from crud.leaderboard.leaderboard import warm_leaderboard_index
+from crud._generic.indexes import ensure_collection_indexes
+from crud.leaderboard.rank_index import LeaderboardRankIndex
+from crud.leaderboard.response_cache import LeaderboardResponseCache
+from crud.leaderboard.broadcaster import LeaderboardBroadcaster
+from crud.leaderboard.ingestion import ScoreIngestionQueue
+from crud.lookups.lookups import LookupCache
 
 CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
 DB_NAME=config("DB_NAME", cast=str)
+LEADERBOARD_INDEX_TTL_SECONDS=config("LEADERBOARD_INDEX_TTL_SECONDS", default=60, cast=int)
+LEADERBOARD_INDEX_MAX_SCOPES=config("LEADERBOARD_INDEX_MAX_SCOPES", default=32, cast=int)
+LEADERBOARD_CACHE_TTL_SECONDS=config("LEADERBOARD_CACHE_TTL_SECONDS", default=5, cast=int)
+LEADERBOARD_CACHE_MAX_ENTRIES=config("LEADERBOARD_CACHE_MAX_ENTRIES", default=1024, cast=int)
+LEADERBOARD_STREAM_TOP_N=config("LEADERBOARD_STREAM_TOP_N", default=50, cast=int)
+LEADERBOARD_STREAM_QUEUE_SIZE=config("LEADERBOARD_STREAM_QUEUE_SIZE", default=32, cast=int)
+LEADERBOARD_STREAM_FLUSH_SECONDS=config("LEADERBOARD_STREAM_FLUSH_SECONDS", default=1.0, cast=float)
+LOOKUP_CACHE_MAX_ENTRIES=config("LOOKUP_CACHE_MAX_ENTRIES", default=10000, cast=int)
+LOOKUP_CACHE_TTL_SECONDS=config("LOOKUP_CACHE_TTL_SECONDS", default=300, cast=int)
+SCORE_WRITE_BEHIND=config("SCORE_WRITE_BEHIND", default=False, cast=bool)
+SCORE_WRITE_BEHIND_BATCH_SIZE=config("SCORE_WRITE_BEHIND_BATCH_SIZE", default=200, cast=int)
+SCORE_WRITE_BEHIND_MAX_LATENCY_SECONDS=config("SCORE_WRITE_BEHIND_MAX_LATENCY_SECONDS", default=0.25, cast=float)
+SCORE_WRITE_BEHIND_MAX_PENDING=config("SCORE_WRITE_BEHIND_MAX_PENDING", default=10000, cast=int)
+SCORE_WRITE_BEHIND_MAX_ATTEMPTS=config("SCORE_WRITE_BEHIND_MAX_ATTEMPTS", default=5, cast=int)
+SCORE_WRITE_BEHIND_RETRY_DELAY_SECONDS=config("SCORE_WRITE_BEHIND_RETRY_DELAY_SECONDS", default=0.5, cast=float)
 
 middleware = [
     Middleware(
@@ -20,13 +42,19 @@ middleware = [
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=['*'],
-        allow_headers=['*']
+        allow_headers=['*'],
+        expose_headers=['X-Next-Cursor', 'ETag']
     )
 ]
 
 class ExtendFastAPI(FastAPI):
     mongodb_client: AsyncIOMotorClient
     mongodb: AsyncIOMotorClient
+    leaderboard_index: LeaderboardRankIndex
+    leaderboard_cache: LeaderboardResponseCache
+    leaderboard_broadcaster: LeaderboardBroadcaster
+    score_ingestion: ScoreIngestionQueue | None
+    lookups: LookupCache
 
 @asynccontextmanager
 async def lifespan(app: ExtendFastAPI):
@@ -39,8 +67,48 @@ async def lifespan(app: ExtendFastAPI):
 
     app.mongodb = app.mongodb_client[DB_NAME]
 
+    await ensure_collection_indexes(app.mongodb)
+
+    app.lookups = LookupCache(
+        max_entries=LOOKUP_CACHE_MAX_ENTRIES,
+        ttl_seconds=LOOKUP_CACHE_TTL_SECONDS
+    )
+
+    app.leaderboard_index = LeaderboardRankIndex(
+        ttl_seconds=LEADERBOARD_INDEX_TTL_SECONDS,
+        max_scopes=LEADERBOARD_INDEX_MAX_SCOPES
+    )
+    app.leaderboard_cache = LeaderboardResponseCache(
+        ttl_seconds=LEADERBOARD_CACHE_TTL_SECONDS,
+        max_entries=LEADERBOARD_CACHE_MAX_ENTRIES
+    )
+    app.leaderboard_broadcaster = LeaderboardBroadcaster(
+        app,
+        top_n=LEADERBOARD_STREAM_TOP_N,
+        queue_size=LEADERBOARD_STREAM_QUEUE_SIZE,
+        flush_seconds=LEADERBOARD_STREAM_FLUSH_SECONDS
+    )
+    await warm_leaderboard_index(app)
+    app.leaderboard_broadcaster.start()
+
+    app.score_ingestion = None
+    if SCORE_WRITE_BEHIND:
+        app.score_ingestion = ScoreIngestionQueue(
+            app,
+            batch_size=SCORE_WRITE_BEHIND_BATCH_SIZE,
+            max_latency_seconds=SCORE_WRITE_BEHIND_MAX_LATENCY_SECONDS,
+            max_pending=SCORE_WRITE_BEHIND_MAX_PENDING,
+            max_attempts=SCORE_WRITE_BEHIND_MAX_ATTEMPTS,
+            retry_delay_seconds=SCORE_WRITE_BEHIND_RETRY_DELAY_SECONDS
+        )
+        app.score_ingestion.start()
+
     # shutdown
     yield
+    # Flush queued scores while the database client is still open
+    if app.score_ingestion is not None:
+        await app.score_ingestion.drain()
+    await app.leaderboard_broadcaster.stop()
     app.mongodb_client.close()
 
 app = ExtendFastAPI(
@@ -0,0 +1,80 @@
+"""
+One-off backfill of the national_best_scores projection from national_leaderboard.
+
+Run from backend/src:
+    python -m migrations.backfill_national_best_scores
+"""
+import asyncio
+from datetime import timezone
+from bson import ObjectId
+from decouple import config
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from crud._generic.indexes import ensure_collection_indexes
+
+CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
+DB_NAME=config("DB_NAME", cast=str)
+
+BATCH_SIZE = 1000
+
+
+async def backfill_national_best_scores():
+    client = AsyncIOMotorClient(
+        CONNECTION_STRING_DB,
+        tz_aware = True,
+        tzinfo=timezone.utc
+    )
+    db = client[DB_NAME]
+
+    await ensure_collection_indexes(db)
+
+    pipeline = [
+        # Highest score per user, earliest entry wins ties
+        {"$sort": {"score": -1, "created_at": 1}},
+        {
+            "$group": {
+                "_id": "$user_id",
+                "username": {"$first": "$username"},
+                "score": {"$first": "$score"},
+                "entry_id": {"$first": "$_id"},
+                "created_at": {"$first": "$created_at"},
+                "updated_at": {"$first": "$updated_at"}
+            }
+        }
+    ]
+
+    operations = []
+    written = 0
+    async for best in db['national_leaderboard'].aggregate(pipeline, allowDiskUse=True):
+        operations.append(UpdateOne(
+            {'user_id': best['_id']},
+            {
+                '$set': {
+                    'username': best['username'],
+                    'score': best['score'],
+                    'entry_id': best['entry_id'],
+                    'created_at': best['created_at'],
+                    'updated_at': best['updated_at']
+                },
+                '$setOnInsert': {'_id': str(ObjectId())}
+            },
+            upsert=True
+        ))
+
+        if len(operations) >= BATCH_SIZE:
+            await db['national_best_scores'].bulk_write(operations, ordered=False)
+            written += len(operations)
+            operations = []
+
+    if operations:
+        await db['national_best_scores'].bulk_write(operations, ordered=False)
+        written += len(operations)
+
+    print(f"national_best_scores backfilled - {written} users")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_national_best_scores())
@@ -0,0 +1,106 @@
+"""
+One-off backfill of the county/country region_leaderboard counters from the
+daily school_leaderboard entries, using each school's current county and country.
+Totals are overwritten, so it is safe to re-run.
+
+Run from backend/src:
+    python -m migrations.backfill_region_leaderboard
+"""
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timezone
+from bson import ObjectId
+from decouple import config
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from crud.leaderboard.leaderboard import ALL_TIME_SCOPE, _get_region_keys
+from crud._generic.indexes import ensure_collection_indexes
+
+CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
+DB_NAME=config("DB_NAME", cast=str)
+
+
+async def backfill_region_leaderboard():
+    client = AsyncIOMotorClient(
+        CONNECTION_STRING_DB,
+        tz_aware = True,
+        tzinfo=timezone.utc
+    )
+    db = client[DB_NAME]
+
+    await ensure_collection_indexes(db)
+
+    pipeline = [
+        {
+            "$group": {
+                "_id": {
+                    "school_id": {"$toString": "$school_id"},
+                    "day_bucket": {
+                        "$ifNull": [
+                            "$day_bucket",
+                            {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}
+                        ]
+                    }
+                },
+                "total_score": {"$sum": "$total_score"},
+                "user_count": {"$sum": "$user_count"}
+            }
+        }
+    ]
+
+    school_days = await db['school_leaderboard'].aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+
+    # School ids have been stored as both strings and ObjectIds - match either form
+    school_ids = list({school_day['_id']['school_id'] for school_day in school_days})
+    school_ids += [ObjectId(school_id) for school_id in school_ids if ObjectId.is_valid(school_id)]
+    schools = await db['schools'].find(
+        {'_id': {'$in': school_ids}},
+        projection={'county': 1, 'country': 1}
+    ).to_list(length=None)
+    schools_by_id = {str(school['_id']): school for school in schools}
+
+    totals = defaultdict(lambda: {'total_score': 0, 'user_count': 0})
+    for school_day in school_days:
+        school = schools_by_id.get(school_day['_id']['school_id'])
+        if not school:
+            continue
+        for region_type, region_key, region in _get_region_keys(school.get('county'), school.get('country')):
+            for bucket in (school_day['_id']['day_bucket'], ALL_TIME_SCOPE):
+                total = totals[(region_type, region_key, bucket)]
+                total['region'] = region
+                total['country'] = school['country']
+                total['total_score'] += school_day['total_score']
+                total['user_count'] += school_day['user_count']
+
+    now = datetime.now(timezone.utc)
+    operations = []
+    for (region_type, region_key, bucket), total in totals.items():
+        operations.append(UpdateOne(
+            {'region_type': region_type, 'region_key': region_key, 'day_bucket': bucket},
+            {
+                '$set': {
+                    'region': total['region'],
+                    'country': total['country'],
+                    'total_score': total['total_score'],
+                    'user_count': total['user_count'],
+                    'updated_at': now
+                },
+                '$setOnInsert': {
+                    '_id': str(ObjectId()),
+                    'created_at': now
+                }
+            },
+            upsert=True
+        ))
+
+    if operations:
+        await db['region_leaderboard'].bulk_write(operations, ordered=False)
+
+    print(f"region_leaderboard backfilled - {len(operations)} counters")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_region_leaderboard())
@@ -0,0 +1,97 @@
+"""
+One-off backfill of day_bucket on school_leaderboard entries written before
+daily entries were keyed by (school_id, day_bucket). Duplicate entries for the
+same school and day (from the old find-then-create race) are merged into one,
+including rows stored under the ObjectId and the string form of the same school
+id, so it does not depend on backfill_school_leaderboard_county running first.
+
+Run from backend/src:
+    python -m migrations.backfill_school_day_buckets
+"""
+import asyncio
+from datetime import timezone
+from decouple import config
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from crud._generic.indexes import ensure_collection_indexes
+
+CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
+DB_NAME=config("DB_NAME", cast=str)
+
+
+async def backfill_school_day_buckets():
+    client = AsyncIOMotorClient(
+        CONNECTION_STRING_DB,
+        tz_aware = True,
+        tzinfo=timezone.utc
+    )
+    db = client[DB_NAME]
+    collection = db['school_leaderboard']
+
+    await ensure_collection_indexes(db)
+
+    pipeline = [
+        {"$match": {"day_bucket": {"$exists": False}}},
+        {"$sort": {"created_at": 1}},
+        {
+            "$group": {
+                "_id": {
+                    # Legacy rows hold the school id as an ObjectId or a string - group both together
+                    "school_id": {"$toString": "$school_id"},
+                    "day_bucket": {
+                        "$dateToString": {
+                            "format": "%Y-%m-%d",
+                            "date": "$created_at",
+                            "timezone": "UTC"
+                        }
+                    }
+                },
+                "entry_ids": {"$push": "$_id"},
+                "total_score": {"$sum": "$total_score"},
+                "user_count": {"$sum": "$user_count"}
+            }
+        }
+    ]
+
+    groups = await collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+
+    merged = 0
+    for group in groups:
+        entry_key = group['_id']
+        entry_ids = group['entry_ids']
+
+        existing_entry = await collection.find_one(entry_key)
+
+        if existing_entry:
+            # A bucketed entry was already written for this day - fold the legacy rows into it
+            await collection.update_one(
+                {'_id': existing_entry['_id']},
+                {'$inc': {
+                    'total_score': group['total_score'],
+                    'user_count': group['user_count']
+                }}
+            )
+            await collection.delete_many({'_id': {'$in': entry_ids}})
+        else:
+            # Keep the oldest legacy row and fold any same-day duplicates into it
+            await collection.update_one(
+                {'_id': entry_ids[0]},
+                {'$set': {
+                    'school_id': entry_key['school_id'],
+                    'day_bucket': entry_key['day_bucket'],
+                    'total_score': group['total_score'],
+                    'user_count': group['user_count']
+                }}
+            )
+            if len(entry_ids) > 1:
+                await collection.delete_many({'_id': {'$in': entry_ids[1:]}})
+
+        merged += len(entry_ids)
+
+    print(f"school_leaderboard backfilled - {merged} legacy entries into {len(groups)} daily entries")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_school_day_buckets())
@@ -0,0 +1,66 @@
+"""
+One-off backfill that normalizes school_id to its string form and denormalizes
+county onto every school_leaderboard entry, so school leaderboard reads no
+longer need a $lookup into schools.
+
+Run from backend/src:
+    python -m migrations.backfill_school_leaderboard_county
+"""
+import asyncio
+from datetime import timezone
+from bson import ObjectId
+from decouple import config
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateMany, UpdateOne
+
+CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
+DB_NAME=config("DB_NAME", cast=str)
+
+
+async def backfill_school_leaderboard_county():
+    client = AsyncIOMotorClient(
+        CONNECTION_STRING_DB,
+        tz_aware = True,
+        tzinfo=timezone.utc
+    )
+    db = client[DB_NAME]
+
+    # Entries written with an ObjectId school_id get the string form
+    object_id_entries = await db['school_leaderboard'].find(
+        {'school_id': {'$type': 'objectId'}},
+        projection={'school_id': 1}
+    ).to_list(length=None)
+
+    if object_id_entries:
+        await db['school_leaderboard'].bulk_write([
+            UpdateOne(
+                {'_id': entry['_id']},
+                {'$set': {'school_id': str(entry['school_id'])}}
+            ) for entry in object_id_entries
+        ], ordered=False)
+
+    # One update per school rather than per entry
+    school_ids = await db['school_leaderboard'].distinct('school_id')
+    lookup_ids = school_ids + [ObjectId(school_id) for school_id in school_ids if ObjectId.is_valid(school_id)]
+    schools = await db['schools'].find(
+        {'_id': {'$in': lookup_ids}},
+        projection={'county': 1}
+    ).to_list(length=None)
+
+    operations = [
+        UpdateMany(
+            {'school_id': str(school['_id'])},
+            {'$set': {'county': school.get('county')}}
+        ) for school in schools
+    ]
+
+    if operations:
+        await db['school_leaderboard'].bulk_write(operations, ordered=False)
+
+    print(f"school_leaderboard backfilled - {len(object_id_entries)} school ids normalized, county set for {len(operations)} schools")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_school_leaderboard_county())
@@ -0,0 +1,87 @@
+"""
+One-off backfill of the school_totals rollup from the daily school_leaderboard
+entries, with school_name and county denormalized from the schools collection.
+Totals are overwritten, so it is safe to re-run.
+
+Run from backend/src:
+    python -m migrations.backfill_school_totals
+"""
+import asyncio
+from datetime import datetime, timezone
+from bson import ObjectId
+from decouple import config
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+from crud._generic.indexes import ensure_collection_indexes
+
+CONNECTION_STRING_DB=config("CONNECTION_STRING_DB", cast=str)
+DB_NAME=config("DB_NAME", cast=str)
+
+
+async def backfill_school_totals():
+    client = AsyncIOMotorClient(
+        CONNECTION_STRING_DB,
+        tz_aware = True,
+        tzinfo=timezone.utc
+    )
+    db = client[DB_NAME]
+
+    await ensure_collection_indexes(db)
+
+    pipeline = [
+        {"$sort": {"created_at": 1}},
+        {
+            "$group": {
+                "_id": {"$toString": "$school_id"},
+                "total_score": {"$sum": "$total_score"},
+                "user_count": {"$sum": "$user_count"},
+                "school_name": {"$last": "$school_name"},
+                "created_at": {"$first": "$created_at"}
+            }
+        }
+    ]
+
+    totals = await db['school_leaderboard'].aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+
+    # School ids have been stored as both strings and ObjectIds - match either form
+    school_ids = [total['_id'] for total in totals]
+    school_ids += [ObjectId(school_id) for school_id in school_ids if ObjectId.is_valid(school_id)]
+    schools = await db['schools'].find(
+        {'_id': {'$in': school_ids}},
+        projection={'school_name': 1, 'county': 1}
+    ).to_list(length=None)
+    schools_by_id = {str(school['_id']): school for school in schools}
+
+    now = datetime.now(timezone.utc)
+    operations = []
+    for total in totals:
+        school = schools_by_id.get(str(total['_id']), {})
+        operations.append(UpdateOne(
+            {'school_id': total['_id']},
+            {
+                '$set': {
+                    'school_name': school.get('school_name', total['school_name']),
+                    'county': school.get('county'),
+                    'total_score': total['total_score'],
+                    'user_count': total['user_count'],
+                    'updated_at': now
+                },
+                '$setOnInsert': {
+                    '_id': str(ObjectId()),
+                    'created_at': total['created_at']
+                }
+            },
+            upsert=True
+        ))
+
+    if operations:
+        await db['school_totals'].bulk_write(operations, ordered=False)
+
+    print(f"school_totals backfilled - {len(operations)} schools")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_school_totals())
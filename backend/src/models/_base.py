@@ -1,6 +1,7 @@
-from typing import Any
+from typing import Any, ClassVar
 from bson import ObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel
 from pydantic_core import core_schema
 from datetime import datetime, timezone
 
@@ -45,6 +46,9 @@ class PyObjectID(ObjectId):
 
 
 class MongoBaseModel(BaseModel):
+    # Indexes the model's collection needs - created at startup by ensure_collection_indexes
+    indexes: ClassVar[list[IndexModel]] = []
+
     id: str = Field(
         default_factory=lambda: str(ObjectId()), 
         alias="_id"
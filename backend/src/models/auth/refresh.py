@@ -1,4 +1,5 @@
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 from datetime import datetime, timezone, timedelta
 
 from models._base import MongoBaseModel
@@ -20,3 +21,10 @@ class RefreshToken(MongoBaseModel):
         default_factory=lambda: datetime.now(timezone.utc) + timedelta(days=50),
         description='The time the refresh token expires'
     )
+
+    indexes = [
+        IndexModel([('token_id', ASCENDING)], unique=True),
+        # MongoDB removes tokens once they expire
+        IndexModel([('expires_at', ASCENDING)], expireAfterSeconds=0),
+        IndexModel([('user_id', ASCENDING)]),
+    ]
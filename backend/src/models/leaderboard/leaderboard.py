@@ -1,5 +1,7 @@
 from pydantic import Field
-from typing import Optional
+from datetime import datetime
+from typing import List, Literal, Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from models._base import MongoBaseModel
 
 class NationalLeaderboard(MongoBaseModel):
@@ -8,16 +10,108 @@ class NationalLeaderboard(MongoBaseModel):
     user_id: str = Field(..., description="Player's unique user ID")
     score: int = Field(..., description="Score achieved in the quiz", ge=0)
 
+    indexes = [
+        IndexModel([('user_id', ASCENDING), ('score', DESCENDING)]),
+        IndexModel([('user_id', ASCENDING), ('created_at', ASCENDING)]),
+        IndexModel([('created_at', ASCENDING), ('user_id', ASCENDING), ('score', DESCENDING)]),
+    ]
+
+class NationalBestScore(MongoBaseModel):
+    """National best score projection - one document per user holding their highest quiz score"""
+    user_id: str = Field(..., description="Player's unique user ID")
+    username: str = Field(..., description="Player's username")
+    score: int = Field(..., description="Highest score the player has achieved in a quiz", ge=0)
+    entry_id: str = Field(..., description="ID of the national leaderboard entry holding this score")
+
+    indexes = [
+        IndexModel([('user_id', ASCENDING)], unique=True),
+        IndexModel([('score', DESCENDING), ('user_id', ASCENDING)]),
+    ]
+
+class NationalDailyBest(MongoBaseModel):
+    """National daily best projection - one document per user per UTC day holding their highest score that day"""
+    user_id: str = Field(..., description="Player's unique user ID")
+    username: str = Field(..., description="Player's username")
+    day_bucket: str = Field(..., description="UTC day (YYYY-MM-DD) this best score was achieved on")
+    score: int = Field(..., description="Highest score the player achieved in a quiz on this day", ge=0)
+    entry_id: str = Field(..., description="ID of the national leaderboard entry holding this score")
+
+    indexes = [
+        IndexModel([('user_id', ASCENDING), ('day_bucket', ASCENDING)], unique=True),
+        IndexModel([('day_bucket', ASCENDING), ('score', DESCENDING), ('user_id', ASCENDING)]),
+    ]
+
 class SchoolLeaderboard(MongoBaseModel):
     """School leaderboard entry model - daily aggregated school scores"""
     school_id: str = Field(..., description="School's unique ID")
     school_name: str = Field(..., description="School's name for display and filtering")
     total_score: int = Field(..., description="Total score for all users from this school on this date", ge=0)
     user_count: int = Field(..., description="Number of users who contributed to this total", ge=1)
+    county: Optional[str] = Field(None, description="School's county, denormalized from the schools collection")
+    day_bucket: Optional[str] = Field(None, description="UTC day (YYYY-MM-DD) this entry aggregates")
+
+    indexes = [
+        # Partial so legacy rows written before day buckets existed don't block the build
+        IndexModel(
+            [('school_id', ASCENDING), ('day_bucket', ASCENDING)],
+            unique=True,
+            partialFilterExpression={'day_bucket': {'$exists': True}}
+        ),
+        IndexModel([('day_bucket', ASCENDING), ('total_score', DESCENDING)]),
+        IndexModel([('school_id', ASCENDING), ('created_at', ASCENDING)]),
+    ]
+
+class SchoolTotal(MongoBaseModel):
+    """School all-time rollup - running totals per school maintained at score submission"""
+    school_id: str = Field(..., description="School's unique ID")
+    school_name: str = Field(..., description="School's name for display and filtering")
+    county: Optional[str] = Field(None, description="School's county, denormalized from the schools collection")
+    total_score: int = Field(..., description="Total score for all users from this school across all dates", ge=0)
+    user_count: int = Field(..., description="Number of scores that contributed to this total", ge=0)
+
+    indexes = [
+        IndexModel([('school_id', ASCENDING)], unique=True),
+        IndexModel([('total_score', DESCENDING), ('school_id', ASCENDING)]),
+    ]
+
+class RegionLeaderboard(MongoBaseModel):
+    """County/country leaderboard counter - running totals per region for one day bucket or all time"""
+    region_type: Literal["county", "country"] = Field(..., description="Whether this counter aggregates a county or a country")
+    region_key: str = Field(..., description="Unique region key - 'country/county' for counties, the country for countries")
+    region: str = Field(..., description="County or country name for display")
+    country: str = Field(..., description="Country the region belongs to")
+    day_bucket: str = Field(..., description="UTC day (YYYY-MM-DD) this counter aggregates, or 'all-time'")
+    total_score: int = Field(..., description="Total score for all users from schools in this region", ge=0)
+    user_count: int = Field(..., description="Number of scores that contributed to this total", ge=0)
+
+    indexes = [
+        IndexModel(
+            [('region_type', ASCENDING), ('region_key', ASCENDING), ('day_bucket', ASCENDING)],
+            unique=True
+        ),
+        IndexModel([('region_type', ASCENDING), ('day_bucket', ASCENDING), ('total_score', DESCENDING), ('region_key', ASCENDING)]),
+    ]
 
 class ScoreSubmission(MongoBaseModel):
     """Model for submitting a quiz score"""
     user_id: str = Field(..., description="Player's unique user ID")
     username: str = Field(..., description="Player's username")
     score: int = Field(..., description="Score achieved in the quiz", ge=0)
-    school_id: Optional[str] = Field(None, description="Player's school ID (optional)")
\ No newline at end of file
+    school_id: Optional[str] = Field(None, description="Player's school ID (optional)")
+
+class ScoreIngestionDeadLetter(MongoBaseModel):
+    """Write-behind batch of score submissions that could not be written after every retry"""
+    batch_time: datetime = Field(..., description="Time the batch was written at - pass it back to ingest_score_batch to replay it idempotently")
+    submissions: List[ScoreSubmission] = Field(..., description="The submissions in the batch, in queue order")
+    attempts: int = Field(..., description="Number of write attempts made before giving up", ge=1)
+    error: str = Field(..., description="Traceback of the last failed attempt")
+
+class ScoreIngestionBatch(MongoBaseModel):
+    """Record of a write-behind batch's counter upserts, so retrying the batch skips the ones already applied"""
+    applied: List[str] = Field(default_factory=list, description="Markers ('collection:key') of the counter upserts already applied")
+    missing_school_ids: List[str] = Field(default_factory=list, description="School ids in the batch with no school document - their scores only count nationally")
+
+    indexes = [
+        # MongoDB removes batch records a week after the batch was first written
+        IndexModel([('created_at', ASCENDING)], expireAfterSeconds=7 * 24 * 60 * 60),
+    ]
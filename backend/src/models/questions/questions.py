@@ -1,11 +1,16 @@
 from pydantic import Field, BaseModel
 from typing import List, Dict, Union, Literal, Optional
+from pymongo import ASCENDING, IndexModel
 from models._base import MongoBaseModel
 
 class BaseQuestion(MongoBaseModel):
     """Base question model that all question types inherit from"""
     type: str = Field(..., description="Question type")
 
+    indexes = [
+        IndexModel([('type', ASCENDING)]),
+    ]
+
 class MultipleChoiceQuestion(BaseQuestion):
     type: Literal["multiple_choice"] = Field(default="multiple_choice", description="Question type")
     question: str = Field(..., description="The question text")
@@ -1,8 +1,16 @@
 from typing import Optional
+from pymongo import ASCENDING, IndexModel
 from models._base import MongoBaseModel
 
 
 class School(MongoBaseModel):
     school_name: str
     county: str
-    country: str
\ No newline at end of file
+    country: str
+
+    indexes = [
+        IndexModel([('school_name', ASCENDING)]),
+        # Listings by county or country are sorted by name
+        IndexModel([('county', ASCENDING), ('school_name', ASCENDING)]),
+        IndexModel([('country', ASCENDING), ('school_name', ASCENDING)]),
+    ]
@@ -1,6 +1,7 @@
 from pydantic import Field, BaseModel
 from typing import Optional
 from datetime import datetime, timezone
+from pymongo import ASCENDING, IndexModel
 
 from models._base import MongoBaseModel
 from models.users.user_role import UserRole
@@ -68,6 +69,13 @@ class User(MongoBaseModel):
         description='The role of the user (USER or ADMIN)'
     )
 
+    indexes = [
+        # Not unique - registration checks for existing accounts itself
+        IndexModel([('email', ASCENDING)]),
+        IndexModel([('username', ASCENDING)]),
+        IndexModel([('school_id', ASCENDING)]),
+    ]
+
 
 class LoginUser(BaseModel):
     email:str = Field(
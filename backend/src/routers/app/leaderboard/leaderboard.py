@@ -1,20 +1,43 @@
 from fastapi import Request, HTTPException, APIRouter, Query, Depends
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.encoders import jsonable_encoder
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional
 from pydantic import BaseModel
+import asyncio
+import json
 
 from models.leaderboard.leaderboard import ScoreSubmission
+from crud.leaderboard.response_cache import CachedLeaderboardPage
+from crud.leaderboard.broadcaster import RESYNC
+from crud.lookups.lookups import get_user_school_id
 from crud.leaderboard.leaderboard import (
     process_quiz_score,
     get_national_all_time,
     get_national_by_date,
     get_school_all_time,
     get_school_by_date,
+    get_region_leaderboard,
+    get_national_by_range,
+    get_school_by_range,
+    parse_day_range,
+    parse_week_range,
+    parse_month_range,
+    parse_day_bucket,
+    get_range_scope,
+    get_cached_leaderboard_revision,
+    ALL_TIME_SCOPE,
+    LEADERBOARD_RANK_FIELDS,
+    get_national_position,
+    get_school_position,
+    get_next_leaderboard_cursor,
+    create_or_update_school_entry,
+    bump_leaderboard_revisions,
+    get_school_revision_changes,
     add_bonus_points_to_entry,
     delete_leaderboard_entry
 )
 from utils.__errors__.error_decorator_routes import error_decorator
+from utils.http.etags import etag_matches, not_modified_response
 from authentication import Authorization
 
 router = APIRouter()
@@ -41,6 +64,14 @@ async def submit_quiz_score(
             status_code=200
         )
     
+    # Write-behind mode - acknowledge now, the ingestion queue writes it in the next batch
+    if req.app.score_ingestion is not None:
+        await req.app.score_ingestion.submit(score_submission)
+        return JSONResponse(
+            status_code=202,
+            content={"success": True, "queued": True}
+        )
+    
     result = await process_quiz_score(req, score_submission)
     
     if not result["success"]:
@@ -54,19 +85,84 @@ async def submit_quiz_score(
         content=jsonable_encoder(result)
     )
 
+def _leaderboard_page_response(page: CachedLeaderboardPage) -> Response:
+    """Serialized leaderboard page as a JSON response, with the next page's cursor in X-Next-Cursor"""
+    response = Response(
+        status_code=200,
+        content=page.body,
+        media_type='application/json',
+        headers={'ETag': page.etag, 'Cache-Control': 'no-cache'}
+    )
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+    return response
+
+def _leaderboard_etag(board: str, scope: str, revision: int, params: tuple) -> str:
+    limit, offset, cursor = params
+    return f'"{board}-{scope}-{revision}-{limit}-{offset}-{cursor or ""}"'
+
+async def _cached_leaderboard_page(
+    req: Request,
+    board: str,
+    scope: str,
+    limit: Optional[int],
+    offset: int,
+    cursor: Optional[str],
+    read_page: Callable[[], Awaitable[List[dict]]]
+) -> Response:
+    """
+    Serve a leaderboard page from the response cache, reading and serializing it on a miss.
+    The ETag is built from the scope's revision and the page params, so If-None-Match
+    is answered with a 304 before anything is read - the revision itself only comes
+    from MongoDB for conditional requests and cache misses, once per cache TTL.
+    """
+    cache = req.app.leaderboard_cache
+    params = (limit, offset, cursor)
+    
+    if req.headers.get('if-none-match'):
+        revision = await get_cached_leaderboard_revision(req.app, board, scope)
+        etag = _leaderboard_etag(board, scope, revision, params)
+        if etag_matches(req, etag):
+            return not_modified_response(etag)
+    
+    page = cache.get(board, scope, params)
+    if page is None:
+        version = cache.version(board, scope)
+        revision = await get_cached_leaderboard_revision(req.app, board, scope)
+        leaderboard = await read_page()
+        # A loaded scope may lag the database (writes from other workers show up on
+        # reload), so the page only claims the revision its rows are known to include
+        ranked = req.app.leaderboard_index.peek(board, scope)
+        page_revision = min(revision, ranked.revision) if ranked is not None else revision
+        body = JSONResponse(content=jsonable_encoder(leaderboard)).body
+        page = cache.put(
+            board,
+            scope,
+            params,
+            CachedLeaderboardPage(
+                body=body,
+                etag=_leaderboard_etag(board, scope, page_revision, params),
+                next_cursor=get_next_leaderboard_cursor(board, leaderboard, limit)
+            ),
+            version=version
+        )
+    
+    return _leaderboard_page_response(page)
+
 # National Leaderboard Routes
 @router.get('/national/all-time')
 @error_decorator
 async def get_national_all_time_route(
     req: Request,
     limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     user_id: str = Depends(auth.auth_wrapper)
 ):
     """Get the national all-time leaderboard (highest score per unique user)"""
-    leaderboard = await get_national_all_time(req, limit=limit)
-    return JSONResponse(
-        status_code=200,
-        content=jsonable_encoder(leaderboard)
+    return await _cached_leaderboard_page(
+        req, 'national', ALL_TIME_SCOPE, limit, offset, cursor,
+        lambda: get_national_all_time(req, limit=limit, offset=offset, cursor=cursor)
     )
 
 @router.get('/national/date/{date}')
@@ -75,13 +171,14 @@ async def get_national_by_date_route(
     req: Request,
     date: str,
     limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     user_id: str = Depends(auth.auth_wrapper)
 ):
     """Get national leaderboard for a specific date (YYYY-MM-DD format)"""
-    leaderboard = await get_national_by_date(req, date, limit=limit)
-    return JSONResponse(
-        status_code=200,
-        content=jsonable_encoder(leaderboard)
+    return await _cached_leaderboard_page(
+        req, 'national', parse_day_bucket(date), limit, offset, cursor,
+        lambda: get_national_by_date(req, date, limit=limit, offset=offset, cursor=cursor)
     )
 
 # School Leaderboard Routes
@@ -90,13 +187,14 @@ async def get_national_by_date_route(
 async def get_school_all_time_route(
     req: Request,
     limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     user_id: str = Depends(auth.auth_wrapper)
 ):
     """Get the school all-time leaderboard (sum of all daily totals per school)"""
-    leaderboard = await get_school_all_time(req, limit=limit)
-    return JSONResponse(
-        status_code=200,
-        content=jsonable_encoder(leaderboard)
+    return await _cached_leaderboard_page(
+        req, 'school', ALL_TIME_SCOPE, limit, offset, cursor,
+        lambda: get_school_all_time(req, limit=limit, offset=offset, cursor=cursor)
     )
 
 @router.get('/school/date/{date}')
@@ -105,13 +203,353 @@ async def get_school_by_date_route(
     req: Request,
     date: str,
     limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
     user_id: str = Depends(auth.auth_wrapper)
 ):
     """Get school leaderboard for a specific date (YYYY-MM-DD format)"""
-    leaderboard = await get_school_by_date(req, date, limit=limit)
+    return await _cached_leaderboard_page(
+        req, 'school', parse_day_bucket(date), limit, offset, cursor,
+        lambda: get_school_by_date(req, date, limit=limit, offset=offset, cursor=cursor)
+    )
+
+# Date Range Leaderboard Routes
+@router.get('/national/week/{date}')
+@error_decorator
+async def get_national_by_week_route(
+    req: Request,
+    date: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get national leaderboard for the Monday-Sunday UTC week containing a date (YYYY-MM-DD format)"""
+    start_bucket, end_bucket = parse_week_range(date)
+    return await _cached_leaderboard_page(
+        req, 'national', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_national_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/national/month/{month}')
+@error_decorator
+async def get_national_by_month_route(
+    req: Request,
+    month: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get national leaderboard for a UTC month (YYYY-MM format)"""
+    start_bucket, end_bucket = parse_month_range(month)
+    return await _cached_leaderboard_page(
+        req, 'national', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_national_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/national/range')
+@error_decorator
+async def get_national_by_range_route(
+    req: Request,
+    start: str = Query(..., alias="from", description="First day of the range (YYYY-MM-DD format)"),
+    end: str = Query(..., alias="to", description="Last day of the range, inclusive (YYYY-MM-DD format)"),
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get national leaderboard for a custom inclusive date range (highest score per user)"""
+    start_bucket, end_bucket = parse_day_range(start, end)
+    return await _cached_leaderboard_page(
+        req, 'national', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_national_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/school/week/{date}')
+@error_decorator
+async def get_school_by_week_route(
+    req: Request,
+    date: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get school leaderboard for the Monday-Sunday UTC week containing a date (YYYY-MM-DD format)"""
+    start_bucket, end_bucket = parse_week_range(date)
+    return await _cached_leaderboard_page(
+        req, 'school', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_school_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/school/month/{month}')
+@error_decorator
+async def get_school_by_month_route(
+    req: Request,
+    month: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get school leaderboard for a UTC month (YYYY-MM format)"""
+    start_bucket, end_bucket = parse_month_range(month)
+    return await _cached_leaderboard_page(
+        req, 'school', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_school_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/school/range')
+@error_decorator
+async def get_school_by_range_route(
+    req: Request,
+    start: str = Query(..., alias="from", description="First day of the range (YYYY-MM-DD format)"),
+    end: str = Query(..., alias="to", description="Last day of the range, inclusive (YYYY-MM-DD format)"),
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get school leaderboard for a custom inclusive date range (sum of daily totals per school)"""
+    start_bucket, end_bucket = parse_day_range(start, end)
+    return await _cached_leaderboard_page(
+        req, 'school', get_range_scope(start_bucket, end_bucket), limit, offset, cursor,
+        lambda: get_school_by_range(req, start_bucket, end_bucket, limit=limit, offset=offset, cursor=cursor)
+    )
+
+# Region Leaderboard Routes
+@router.get('/county/all-time')
+@error_decorator
+async def get_county_all_time_route(
+    req: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the county all-time leaderboard (sum of all school scores per county)"""
+    return await _cached_leaderboard_page(
+        req, 'county', ALL_TIME_SCOPE, limit, offset, cursor,
+        lambda: get_region_leaderboard(req, 'county', limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/county/date/{date}')
+@error_decorator
+async def get_county_by_date_route(
+    req: Request,
+    date: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get county leaderboard for a specific date (YYYY-MM-DD format)"""
+    return await _cached_leaderboard_page(
+        req, 'county', parse_day_bucket(date), limit, offset, cursor,
+        lambda: get_region_leaderboard(req, 'county', date_str=date, limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/country/all-time')
+@error_decorator
+async def get_country_all_time_route(
+    req: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the country all-time leaderboard (sum of all school scores per country)"""
+    return await _cached_leaderboard_page(
+        req, 'country', ALL_TIME_SCOPE, limit, offset, cursor,
+        lambda: get_region_leaderboard(req, 'country', limit=limit, offset=offset, cursor=cursor)
+    )
+
+@router.get('/country/date/{date}')
+@error_decorator
+async def get_country_by_date_route(
+    req: Request,
+    date: str,
+    limit: Optional[int] = Query(None, ge=1, description="Number of top entries to return (no limit if not specified)"),
+    offset: int = Query(0, ge=0, description="Number of ranked entries to skip"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's X-Next-Cursor header"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get country leaderboard for a specific date (YYYY-MM-DD format)"""
+    return await _cached_leaderboard_page(
+        req, 'country', parse_day_bucket(date), limit, offset, cursor,
+        lambda: get_region_leaderboard(req, 'country', date_str=date, limit=limit, offset=offset, cursor=cursor)
+    )
+
+# Live Leaderboard Stream
+STREAM_KEEPALIVE_SECONDS = 15
+
+def _sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data), separators=(',', ':'))}\n\n"
+
+@router.get('/stream/{board}')
+@error_decorator
+async def stream_leaderboard_route(
+    req: Request,
+    board: str,
+    date: Optional[str] = Query(None, description="Stream a specific date (YYYY-MM-DD format) instead of all-time"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """
+    Server-Sent Events stream of a leaderboard's top entries - one 'snapshot'
+    event on connect, then 'delta' events ({changed, removed}) as ranks move.
+    A repeated 'snapshot' means the client fell behind and should replace its list.
+    """
+    if board not in LEADERBOARD_RANK_FIELDS:
+        raise HTTPException(status_code=404, detail="Unknown leaderboard")
+    scope = parse_day_bucket(date) if date else ALL_TIME_SCOPE
+    broadcaster = req.app.leaderboard_broadcaster
+    
+    async def event_stream():
+        # Subscribe before the snapshot so no change between the two is missed
+        subscription = broadcaster.subscribe(board, scope)
+        try:
+            yield _sse_event('snapshot', await broadcaster.snapshot(board, scope))
+            while not await req.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is RESYNC:
+                    yield _sse_event('snapshot', await broadcaster.snapshot(board, scope))
+                else:
+                    yield _sse_event('delta', event)
+        finally:
+            broadcaster.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+# Leaderboard Position Routes
+async def _get_user_school_id(req: Request, user_id: str) -> str:
+    school_id = await get_user_school_id(req, user_id)
+    if not school_id:
+        raise HTTPException(status_code=404, detail="User is not linked to a school")
+    return school_id
+
+@router.get('/national/all-time/me')
+@error_decorator
+async def get_national_all_time_me_route(
+    req: Request,
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the current user's rank and best score on the national all-time leaderboard"""
+    position = await get_national_position(req, user_id)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/national/all-time/around-me')
+@error_decorator
+async def get_national_all_time_around_me_route(
+    req: Request,
+    window: int = Query(5, ge=1, le=50, description="Number of entries to return either side of the current user"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the entries ranked around the current user on the national all-time leaderboard"""
+    position = await get_national_position(req, user_id, window=window)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/national/date/{date}/me')
+@error_decorator
+async def get_national_by_date_me_route(
+    req: Request,
+    date: str,
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the current user's rank and best score on the national leaderboard for a date (YYYY-MM-DD format)"""
+    position = await get_national_position(req, user_id, date_str=date)
     return JSONResponse(
         status_code=200,
-        content=jsonable_encoder(leaderboard)
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/national/date/{date}/around-me')
+@error_decorator
+async def get_national_by_date_around_me_route(
+    req: Request,
+    date: str,
+    window: int = Query(5, ge=1, le=50, description="Number of entries to return either side of the current user"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the entries ranked around the current user on the national leaderboard for a date (YYYY-MM-DD format)"""
+    position = await get_national_position(req, user_id, date_str=date, window=window)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/school/all-time/me')
+@error_decorator
+async def get_school_all_time_me_route(
+    req: Request,
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the current user's school rank and total on the school all-time leaderboard"""
+    school_id = await _get_user_school_id(req, user_id)
+    position = await get_school_position(req, school_id)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/school/all-time/around-me')
+@error_decorator
+async def get_school_all_time_around_me_route(
+    req: Request,
+    window: int = Query(5, ge=1, le=50, description="Number of schools to return either side of the current user's school"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the schools ranked around the current user's school on the school all-time leaderboard"""
+    school_id = await _get_user_school_id(req, user_id)
+    position = await get_school_position(req, school_id, window=window)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/school/date/{date}/me')
+@error_decorator
+async def get_school_by_date_me_route(
+    req: Request,
+    date: str,
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the current user's school rank and total on the school leaderboard for a date (YYYY-MM-DD format)"""
+    school_id = await _get_user_school_id(req, user_id)
+    position = await get_school_position(req, school_id, date_str=date)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
+    )
+
+@router.get('/school/date/{date}/around-me')
+@error_decorator
+async def get_school_by_date_around_me_route(
+    req: Request,
+    date: str,
+    window: int = Query(5, ge=1, le=50, description="Number of schools to return either side of the current user's school"),
+    user_id: str = Depends(auth.auth_wrapper)
+):
+    """Get the schools ranked around the current user's school on the school leaderboard for a date (YYYY-MM-DD format)"""
+    school_id = await _get_user_school_id(req, user_id)
+    position = await get_school_position(req, school_id, date_str=date, window=window)
+    return JSONResponse(
+        status_code=200,
+        content=jsonable_encoder(position)
     )
 
 # Test endpoint for admin - directly update school scores
@@ -128,56 +566,25 @@ async def test_add_school_score(
 ):
     """Test endpoint: Add score directly to a school's leaderboard (Admin only)"""
     from crud.schools.schools import getSchoolById
-    from crud._generic import _db_actions
-    from models.leaderboard.leaderboard import SchoolLeaderboard
-    from datetime import datetime, timezone
     
     # Get school info
     school = await getSchoolById(req, test_data.school_id)
     if not school:
         raise HTTPException(status_code=404, detail="School not found")
     
-    # Get today's date
-    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-    
-    # Check if school already has an entry for today
-    existing_entry = await _db_actions.getDocument(
+    # Add to today's entry through the same atomic upsert as real submissions
+    result_entry = await create_or_update_school_entry(
         req=req,
-        collection_name='school_leaderboard',
-        BaseModel=SchoolLeaderboard,
         school_id=test_data.school_id,
-        date=today
+        school_name=school.school_name,
+        user_score=test_data.score_to_add,
+        county=school.county,
+        country=school.country
+    )
+    await bump_leaderboard_revisions(
+        req.app,
+        get_school_revision_changes(result_entry.day_bucket, school.county, school.country)
     )
-    
-    if existing_entry:
-        # Update existing entry
-        new_total = existing_entry.total_score + test_data.score_to_add
-        await _db_actions.updateDocument(
-            req=req,
-            collection_name='school_leaderboard',
-            BaseModel=SchoolLeaderboard,
-            document_id=existing_entry.id,
-            total_score=new_total,
-            updated_at=datetime.now(timezone.utc)
-        )
-        existing_entry.total_score = new_total
-        result_entry = existing_entry
-    else:
-        # Create new entry
-        new_entry = SchoolLeaderboard(
-            school_id=test_data.school_id,
-            school_name=school.school_name,
-            total_score=test_data.score_to_add,
-            user_count=1,  # Fake user count for testing
-            date=today
-        )
-        
-        result_entry = await _db_actions.createDocument(
-            req=req,
-            collection_name='school_leaderboard',
-            BaseModel=SchoolLeaderboard,
-            new_document=new_entry
-        )
     
     return JSONResponse(
         status_code=201,
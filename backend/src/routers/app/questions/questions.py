@@ -8,12 +8,14 @@ from crud.questions.questions import (
     create_question,
     create_questions_from_list,
     get_all_questions,
+    get_question_bank_revision,
     get_question_by_id,
     get_questions_by_type,
     update_question,
     delete_question
 )
 from utils.__errors__.error_decorator_routes import error_decorator
+from utils.http.etags import etag_matches, not_modified_response
 from authentication import Authorization
 
 router = APIRouter()
@@ -60,11 +62,17 @@ async def get_all_questions_route(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of questions to return"),
     user_id: str = Depends(auth.auth_wrapper)
 ):
-    """Get all questions with pagination"""
+    """Get all questions with pagination (answers 304 while the question bank is unchanged)"""
+    revision = await get_question_bank_revision(req)
+    etag = f'"questions-{revision}-{skip}-{limit}"'
+    if etag_matches(req, etag):
+        return not_modified_response(etag)
+    
     questions = await get_all_questions(req, skip=skip, limit=limit)
     return JSONResponse(
         status_code=200,
-        content=jsonable_encoder(questions)
+        content=jsonable_encoder(questions),
+        headers={'ETag': etag, 'Cache-Control': 'no-cache'}
     )
 
 @router.get('/by-id/{question_id}')
@@ -6,13 +6,12 @@ from models.schools.school import School
 from crud.schools.schools import (
     createSchool,
     createMultipleSchools,
-    getAllSchools,
+    iterSchools,
     getSchoolById,
-    getSchoolsByCounty,
-    getSchoolsByCountry,
     countSchools
 )
 from utils.__errors__.error_decorator_routes import error_decorator
+from utils.http.streaming import stream_models_response
 
 
 class SchoolCreateRequest(BaseModel):
@@ -36,29 +35,24 @@ async def get_all_schools(
     country: Optional[str] = None,
     limit: Optional[int] = 0
 ):
-    """Get all schools, optionally filtered by county or country"""
+    """
+    Get all schools, optionally filtered by county or country. The listing is
+    streamed - as a JSON array, or NDJSON for clients accepting application/x-ndjson
+    """
     
-    # If filters are provided, use specific query functions
+    filters = {}
     if county:
-        schools = await getSchoolsByCounty(
-            req,
-            county=county,
-            limit=limit
-        )
+        filters['county'] = county
     elif country:
-        schools = await getSchoolsByCountry(
-            req,
-            country=country,
-            limit=limit
-        )
-    else:
-        # Get all schools
-        schools = await getAllSchools(
-            req,
-            limit=limit
-        )
+        filters['country'] = country
+
+    schools = await iterSchools(
+        req,
+        limit=limit,
+        **filters
+    )
     
-    return schools
+    return stream_models_response(req, schools)
 
 
 @router.post("/", response_model=School)
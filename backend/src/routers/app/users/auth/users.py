@@ -20,7 +20,7 @@ auth = Authorization()
 @router.post('/register')
 @error_decorator
 async def register(req:Request, user:User):
-    user.password = auth.hash_password(user.password)
+    user.password = await auth.hash_password(user.password)
     return await create_user(req, user)
 
 
@@ -37,7 +37,7 @@ async def login(req:Request, login_user:LoginUser):
     if user is None:
         raise HTTPException(status_code=401, detail='Invalid username or password')
 
-    if not auth.verify_password(login_user.password, user.password):
+    if not await auth.verify_password(login_user.password, user.password):
         raise HTTPException(status_code=401, detail='Invalid username or password')
 
     authenticated_user_and_tokens = await handle_login(req, user)
@@ -91,3 +91,22 @@ async def logout(
     
     await auth.logout(req, user_id)
     return Response(status_code=204)
+
+
+@router.get('/stats', response_description='Per-worker auth performance counters (Admin only)')
+@error_decorator
+async def auth_stats(
+    req:Request,
+    user_id:str=Depends(auth.auth_wrapper)
+) -> JSONResponse:
+    
+    if not await auth.check_admin_role(req, user_id):
+        raise HTTPException(status_code=403, detail='Admin access required')
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            'password_hashing': auth.password_hashing.stats(),
+            'verified_tokens': auth.verified_tokens.stats()
+        }
+    )
@@ -0,0 +1,90 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Tests import the app's modules the way main.py does, from backend/src
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings read at import time by the modules under test - never used to connect anywhere
+for name in ('ENVIRONMENT', 'SECRET_KEY', 'CONNECTION_STRING_DB', 'DB_NAME'):
+    os.environ.setdefault(name, 'test')
+
+import mongomock.aggregate
+import mongomock.collection
+from mongomock_motor import AsyncMongoMockClient
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+
+def _bulk_write(self, requests, ordered=True, **kwargs):
+    """
+    mongomock's bulk_write doesn't accept the operations of current pymongo
+    versions - apply them one by one, reporting duplicate keys like MongoDB
+    """
+    write_errors = []
+    for index, request in enumerate(requests):
+        try:
+            if isinstance(request, InsertOne):
+                self.insert_one(request._doc)
+            else:
+                self.update_one(request._filter, request._doc, upsert=request._upsert)
+        except DuplicateKeyError:
+            write_errors.append({'index': index, 'code': 11000})
+            if ordered:
+                break
+    if write_errors:
+        raise BulkWriteError({'writeErrors': write_errors})
+
+
+mongomock.collection.Collection.bulk_write = _bulk_write
+
+_accumulate_group = mongomock.aggregate._accumulate_group
+
+
+def _accumulate_group_with_top(output_fields, group_list):
+    """mongomock has no $top accumulator - evaluate it here and leave the rest to mongomock"""
+    top_fields = {field: value['$top'] for field, value in output_fields.items() if isinstance(value, dict) and '$top' in value}
+    doc_dict = _accumulate_group({field: value for field, value in output_fields.items() if field not in top_fields}, group_list)
+    for field, top in top_fields.items():
+        ordered = list(group_list)
+        # Stable sorts applied from the last key to the first give the compound order
+        for key, direction in reversed(list(top['sortBy'].items())):
+            ordered.sort(key=lambda doc: (doc.get(key) is not None, doc.get(key)), reverse=direction < 0)
+        doc_dict[field] = mongomock.aggregate._parse_expression(top['output'], ordered[0], ignore_missing_keys=True)
+    return doc_dict
+
+
+mongomock.aggregate._accumulate_group = _accumulate_group_with_top
+
+_parse = mongomock.aggregate._Parser.parse
+
+
+def _parse_with_merge_objects(self, expression):
+    """mongomock has no $mergeObjects expression - later documents' fields win, as in MongoDB"""
+    if isinstance(expression, dict) and list(expression) == ['$mergeObjects']:
+        merged = {}
+        for document in expression['$mergeObjects']:
+            merged.update(self.parse(document) or {})
+        return merged
+    return _parse(self, expression)
+
+
+mongomock.aggregate._Parser.parse = _parse_with_merge_objects
+
+
+@pytest.fixture
+def app():
+    """Per-worker app state the leaderboard code uses, over an in-memory MongoDB"""
+    from crud.leaderboard.broadcaster import LeaderboardBroadcaster
+    from crud.leaderboard.rank_index import LeaderboardRankIndex
+    from crud.leaderboard.response_cache import LeaderboardResponseCache
+    from crud.lookups.lookups import LookupCache
+
+    app = SimpleNamespace(mongodb=AsyncMongoMockClient(tz_aware=True)['test'])
+    app.leaderboard_index = LeaderboardRankIndex()
+    app.leaderboard_cache = LeaderboardResponseCache()
+    app.lookups = LookupCache()
+    app.leaderboard_broadcaster = LeaderboardBroadcaster(app, top_n=10, queue_size=2)
+    return app
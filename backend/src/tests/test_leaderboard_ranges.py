@@ -0,0 +1,51 @@
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+from crud.leaderboard.leaderboard import (
+    _load_national_by_range,
+    _top_national_by_range,
+    get_range_day_buckets
+)
+
+
+async def _seed_daily_bests(db, days, users, seed):
+    random.seed(seed)
+    await db['national_daily_best'].insert_many([
+        {
+            '_id': f"{user}-{day}",
+            'user_id': f"u{user:02d}",
+            'username': f"user {user}",
+            'day_bucket': day,
+            'score': random.randint(0, 200),
+            'entry_id': f"entry-{user}-{day}",
+            'created_at': datetime(2025, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=random.randint(0, 60 * 24 * 4))
+        }
+        for day in days
+        for user in range(users)
+        # Not everyone plays every day
+        if random.random() < 0.6
+    ])
+
+
+def _ranking(rows):
+    return [(row['user_id'], row['score']) for row in rows]
+
+
+def test_range_top_k_matches_the_full_range_ranking(app):
+    days = get_range_day_buckets('2025-06-01', '2025-06-04')
+
+    async def scenario():
+        await _seed_daily_bests(app.mongodb, days, users=60, seed=7)
+        full_ranking = _ranking(await _load_national_by_range(app.mongodb, days[0], days[-1]))
+        for top_k in (1, 5, 17, 60, 80):
+            top_rows = await _top_national_by_range(app.mongodb, days[0], days[-1], top_k)
+            assert _ranking(top_rows) == full_ranking[:top_k]
+
+    asyncio.run(scenario())
+
+
+def test_range_top_k_of_an_empty_range(app):
+    rows = asyncio.run(_top_national_by_range(app.mongodb, '2025-06-01', '2025-06-07', 10))
+
+    assert rows == []
@@ -0,0 +1,92 @@
+import asyncio
+
+from crud.leaderboard.leaderboard import decode_leaderboard_cursor, encode_leaderboard_cursor
+from crud.leaderboard.rank_index import LeaderboardRankIndex, RankedLeaderboard
+
+
+def _board(*scores):
+    return RankedLeaderboard('user_id', 'score', [
+        {'user_id': user_id, 'score': score} for user_id, score in scores
+    ])
+
+
+def _ids(rows):
+    return [row['user_id'] for row in rows]
+
+
+def test_ranks_by_score_then_member_id():
+    board = _board(('b', 5), ('a', 5), ('c', 9), ('d', 1))
+
+    assert _ids(board.top()) == ['c', 'a', 'b', 'd']
+    assert [board.rank_of(user_id) for user_id in 'cabd'] == [1, 2, 3, 4]
+    assert board.rank_of('missing') is None
+
+
+def test_top_pages_by_offset_and_limit():
+    board = _board(*[(f'u{i}', i) for i in range(10)])
+
+    assert _ids(board.top(3)) == ['u9', 'u8', 'u7']
+    assert _ids(board.top(3, offset=8)) == ['u1', 'u0']
+
+
+def test_page_after_continues_from_a_position():
+    board = _board(('a', 9), ('b', 7), ('c', 7), ('d', 3))
+
+    assert _ids(board.page_after(7, 'b')) == ['c', 'd']
+    assert _ids(board.page_after(7, 'b', limit=1)) == ['c']
+    # The position doesn't have to be on the board any more
+    assert _ids(board.page_after(8, 'zz')) == ['b', 'c', 'd']
+
+
+def test_page_after_through_a_cursor():
+    board = _board(('a', 9), ('b', 7), ('c', 7))
+    cursor = encode_leaderboard_cursor('national', board.top(2)[-1])
+
+    assert _ids(board.page_after(*decode_leaderboard_cursor(cursor))) == ['c']
+
+
+def test_increment_seeds_and_reorders_members():
+    board = RankedLeaderboard('school_id', 'total_score')
+
+    board.increment({'school_id': 's1', 'total_score': 4, 'user_count': 1}, {'total_score': 4, 'user_count': 1})
+    board.increment({'school_id': 's2', 'total_score': 6, 'user_count': 1}, {'total_score': 6, 'user_count': 1})
+    updated_row = board.increment({'school_id': 's1', 'total_score': 5, 'user_count': 1}, {'total_score': 5, 'user_count': 1})
+
+    assert updated_row['total_score'] == 9
+    assert updated_row['user_count'] == 2
+    assert board.rank_of('s1') == 1
+    assert [row['school_id'] for row in board.top()] == ['s1', 's2']
+    assert len(board) == 2
+
+
+def test_upsert_if_higher_keeps_the_best_score():
+    board = _board(('a', 5))
+
+    assert board.upsert_if_higher({'user_id': 'a', 'score': 3}) is False
+    assert board.upsert_if_higher({'user_id': 'a', 'score': 8}) is True
+    assert board.get('a')['score'] == 8
+    assert len(board) == 1
+
+
+def test_index_reloads_a_scope_behind_the_revision():
+    index = LeaderboardRankIndex()
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return [{'user_id': 'a', 'score': len(loads)}]
+
+    async def get(revision):
+        return await index.get('national', 'all-time', 'user_id', 'score', loader, revision=revision)
+
+    async def scenario():
+        first = await get(3)
+        assert await get(3) is first
+        # A write elsewhere moved the scope's revision on
+        second = await get(4)
+        assert second is not first
+        assert second.revision == 4
+        assert second.get('a')['score'] == 2
+
+    asyncio.run(scenario())
+    assert len(loads) == 2
@@ -0,0 +1,87 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import crud.leaderboard.leaderboard as leaderboard_crud
+from crud.leaderboard.leaderboard import (
+    ALL_TIME_SCOPE,
+    get_ranked_leaderboard,
+    ingest_score_batch,
+    warm_leaderboard_index
+)
+from models.leaderboard.leaderboard import ScoreSubmission
+
+BATCH_TIME = datetime(2025, 6, 2, 12, tzinfo=timezone.utc)
+
+
+async def _seed(app):
+    await app.mongodb['schools'].insert_one({'_id': 's1', 'school_name': 'School 1', 'county': 'Cork', 'country': 'Ireland'})
+    await app.mongodb['users'].insert_many([
+        {'_id': 'u1', 'school_id': 's1'},
+        {'_id': 'u2', 'school_id': 's1'},
+        {'_id': 'u3'}
+    ])
+    return [
+        ScoreSubmission(user_id='u1', username='one', score=10),
+        ScoreSubmission(user_id='u2', username='two', score=20),
+        ScoreSubmission(user_id='u3', username='three', score=30)
+    ]
+
+
+async def _counters(app):
+    db = app.mongodb
+    return {
+        'entries': await db['national_leaderboard'].count_documents({}),
+        'school_totals': [(doc['total_score'], doc['user_count']) for doc in await db['school_totals'].find().to_list(None)],
+        'school_days': [(doc['total_score'], doc['user_count']) for doc in await db['school_leaderboard'].find().to_list(None)],
+        'regions': sorted(
+            (doc['region_key'], doc['day_bucket'], doc['total_score'])
+            for doc in await db['region_leaderboard'].find().to_list(None)
+        )
+    }
+
+
+def test_repeated_batch_is_written_once(app):
+    async def scenario():
+        submissions = await _seed(app)
+        await ingest_score_batch(app, submissions, BATCH_TIME)
+        first = await _counters(app)
+        await ingest_score_batch(app, submissions, BATCH_TIME)
+        return first, await _counters(app)
+
+    first, repeated = asyncio.run(scenario())
+
+    assert first == repeated
+    assert first['entries'] == 3
+    assert first['school_totals'] == [(30, 2)]
+    assert first['school_days'] == [(30, 2)]
+    assert first['regions'] == [
+        ('Ireland', '2025-06-02', 30),
+        ('Ireland', ALL_TIME_SCOPE, 30),
+        ('Ireland/Cork', '2025-06-02', 30),
+        ('Ireland/Cork', ALL_TIME_SCOPE, 30)
+    ]
+
+
+def test_retried_batch_does_not_double_the_loaded_scopes(app, monkeypatch):
+    async def failing_bump(app, changes):
+        raise RuntimeError('revision write failed')
+
+    async def scenario():
+        submissions = await _seed(app)
+        await warm_leaderboard_index(app)
+        with monkeypatch.context() as patch:
+            patch.setattr(leaderboard_crud, 'bump_leaderboard_revisions', failing_bump)
+            with pytest.raises(RuntimeError):
+                await ingest_score_batch(app, submissions, BATCH_TIME)
+        await ingest_score_batch(app, submissions, BATCH_TIME)
+
+        school_all_time = await get_ranked_leaderboard(app, 'school', ALL_TIME_SCOPE)
+        county_all_time = await get_ranked_leaderboard(app, 'county', ALL_TIME_SCOPE)
+        return school_all_time.get('s1'), county_all_time.get('Ireland/Cork')
+
+    school_row, county_row = asyncio.run(scenario())
+
+    assert (school_row['total_score'], school_row['user_count']) == (30, 2)
+    assert (county_row['total_score'], county_row['user_count']) == (30, 2)
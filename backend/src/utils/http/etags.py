@@ -0,0 +1,16 @@
+from fastapi import Request, Response
+
+
+def etag_matches(req: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header already names this ETag"""
+    if_none_match = req.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    # Weak comparison, as If-None-Match requires
+    return etag in [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 telling the client its cached copy is still current"""
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
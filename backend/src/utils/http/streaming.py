@@ -0,0 +1,48 @@
+from typing import AsyncIterable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
+
+# Models serialized into each chunk written to the socket
+CHUNK_SIZE = 100
+
+
+def wants_ndjson(req: Request) -> bool:
+    """Whether the client asked for newline-delimited JSON over a JSON array"""
+    return NDJSON_MEDIA_TYPE in req.headers.get('accept', '')
+
+async def _json_array_chunks(models: AsyncIterable[BaseModel]):
+    chunk = [b'[']
+    first = True
+    async for model in models:
+        if not first:
+            chunk.append(b',')
+        first = False
+        chunk.append(model.model_dump_json(by_alias=True).encode())
+        if len(chunk) >= CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk = []
+    chunk.append(b']')
+    yield b''.join(chunk)
+
+async def _ndjson_chunks(models: AsyncIterable[BaseModel]):
+    chunk = []
+    async for model in models:
+        chunk.append(model.model_dump_json(by_alias=True).encode() + b'\n')
+        if len(chunk) >= CHUNK_SIZE:
+            yield b''.join(chunk)
+            chunk = []
+    if chunk:
+        yield b''.join(chunk)
+
+def stream_models_response(req: Request, models: AsyncIterable[BaseModel]) -> StreamingResponse:
+    """
+    Stream models as a JSON array, or as NDJSON when the client accepts it,
+    serializing them as they arrive so memory use doesn't grow with the listing
+    """
+    if wants_ndjson(req):
+        return StreamingResponse(_ndjson_chunks(models), media_type=NDJSON_MEDIA_TYPE)
+    return StreamingResponse(_json_array_chunks(models), media_type='application/json')